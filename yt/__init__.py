@@ -133,6 +133,7 @@ from yt.visualization.api import (
     ProfilePlot,
     ProjectionPlot,
     SlicePlot,
+    TiledFixedResolutionBuffer,
     add_colormap,
     apply_colormap,
     make_colormap,
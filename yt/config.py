@@ -44,6 +44,19 @@ ytcfg_defaults["yt"] = dict(
     thread_field_detection=False,
     ignore_invalid_unit_operation_errors=False,
     chunk_size=1000,
+    io_threads=1,
+    index_nprocs=1,
+    hdf5_memmap=False,
+    coordinate_cache_size=0,
+    field_dependency_cache=False,
+    lazy_field_detection=False,
+    intermediate_field_cache_size=0,
+    derived_quantity_backend="mpi",
+    derived_quantity_nprocs=0,
+    profile_threads=1,
+    bin_index_cache_size=0,
+    sph_particle_order_cache_size=0,
+    frb_cache_size=0,
     xray_data_dir="/does/not/exist",
     supp_data_dir="/does/not/exist",
     default_colormap="cmyt.arbre",
@@ -20,7 +20,14 @@ from yt.data_objects.selection_objects.data_selection_objects import (
 )
 from yt.fields.field_exceptions import NeedsGridType, NeedsOriginalGrid
 from yt.frontends.sph.data_structures import ParticleDataset
-from yt.funcs import get_memory_usage, is_sequence, iter_fields, mylog, only_on_root
+from yt.funcs import (
+    get_memory_usage,
+    get_num_threads,
+    is_sequence,
+    iter_fields,
+    mylog,
+    only_on_root,
+)
 from yt.geometry import particle_deposit as particle_deposit
 from yt.geometry.coordinates.cartesian_coordinates import all_data
 from yt.loaders import load_uniform_grid
@@ -236,9 +243,17 @@ class YTProj(YTSelectionContainer2D):
             for chunk in self.data_source.chunks([], "io", local_only=False):
                 self._initialize_chunk(chunk, tree)
         _units_initialized = False
+        # Get all the fields of each chunk at once, so that their common
+        # dependencies are only read and generated once
+        chunk_fields = list(fields)
+        if self.weight_field is not None:
+            chunk_fields.append(self.weight_field)
+        if not (self.method == "mip" or self._sum_only):
+            ax_name = self.ds.coordinates.axis_name[self.axis]
+            chunk_fields.append(("index", f"path_element_{ax_name}"))
         with self.data_source._field_parameter_state(self.field_parameters):
             for chunk in parallel_objects(
-                self.data_source.chunks([], "io", local_only=True)
+                self.data_source.chunks(chunk_fields, "io", local_only=True)
             ):
                 if not _units_initialized:
                     self._initialize_projected_units(fields, chunk)
@@ -893,6 +908,7 @@ class YTCoveringGrid(YTSelectionContainer3D):
             period = period.in_units("code_length").d
         # TODO maybe there is a better way of handling this
         is_periodic = int(any(self.ds.periodicity))
+        num_threads = get_num_threads()
 
         if smoothing_style == "scatter":
             for field in fields:
@@ -905,14 +921,22 @@ class YTCoveringGrid(YTSelectionContainer3D):
                     buff_den = np.zeros(size, dtype="float64")
 
                 pbar = tqdm(desc=f"Interpolating SPH field {field}")
+                chunk_fields = [
+                    (ptype, "particle_position_x"),
+                    (ptype, "particle_position_y"),
+                    (ptype, "particle_position_z"),
+                    (ptype, "smoothing_length"),
+                    (ptype, "particle_mass"),
+                    (ptype, "density"),
+                ]
                 for chunk in self._data_source.chunks([field], "io"):
-                    px = chunk[(ptype, "particle_position_x")].in_base("code").d
-                    py = chunk[(ptype, "particle_position_y")].in_base("code").d
-                    pz = chunk[(ptype, "particle_position_z")].in_base("code").d
-                    hsml = chunk[(ptype, "smoothing_length")].in_base("code").d
-                    mass = chunk[(ptype, "particle_mass")].in_base("code").d
-                    dens = chunk[(ptype, "density")].in_base("code").d
-                    field_quantity = chunk[field].d
+                    data = self.ds.index._sort_particles(
+                        chunk, ptype, chunk_fields + [field]
+                    )
+                    px, py, pz, hsml, mass, dens = (
+                        d.in_base("code").d for d in data[:-1]
+                    )
+                    field_quantity = data[-1].d
 
                     pixelize_sph_kernel_arbitrary_grid(
                         buff,
@@ -927,6 +951,7 @@ class YTCoveringGrid(YTSelectionContainer3D):
                         pbar=pbar,
                         check_period=is_periodic,
                         period=period,
+                        num_threads=num_threads,
                     )
                     if normalize:
                         pixelize_sph_kernel_arbitrary_grid(
@@ -942,6 +967,7 @@ class YTCoveringGrid(YTSelectionContainer3D):
                             pbar=pbar,
                             check_period=is_periodic,
                             period=period,
+                            num_threads=num_threads,
                         )
 
                 if normalize:
@@ -2882,13 +2908,28 @@ class YTOctree(YTSelectionContainer3D):
         ptype = fields[0]
         pbar = tqdm(desc=f"Interpolating (scatter) SPH field {fields[0]}")
         for chunk in self._data_source.chunks([fields], "io"):
-            px = chunk[(ptype, "particle_position_x")].to("code_length").d
-            py = chunk[(ptype, "particle_position_y")].to("code_length").d
-            pz = chunk[(ptype, "particle_position_z")].to("code_length").d
-            hsml = chunk[(ptype, "smoothing_length")].to("code_length").d
-            pmass = chunk[(ptype, "particle_mass")].to("code_mass").d
-            pdens = chunk[(ptype, "density")].to("code_mass/code_length**3").d
-            field_quantity = chunk[fields].to(units).d
+            px, py, pz, hsml, pmass, pdens, field_quantity = (
+                self.ds.index._sort_particles(
+                    chunk,
+                    ptype,
+                    [
+                        (ptype, "particle_position_x"),
+                        (ptype, "particle_position_y"),
+                        (ptype, "particle_position_z"),
+                        (ptype, "smoothing_length"),
+                        (ptype, "particle_mass"),
+                        (ptype, "density"),
+                        fields,
+                    ],
+                )
+            )
+            px = px.to("code_length").d
+            py = py.to("code_length").d
+            pz = pz.to("code_length").d
+            hsml = hsml.to("code_length").d
+            pmass = pmass.to("code_mass").d
+            pdens = pdens.to("code_mass/code_length**3").d
+            field_quantity = field_quantity.to(units).d
 
             if px.shape[0] > 0:
                 self.tree.interpolate_sph_cells(
@@ -1,17 +1,179 @@
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+from yt.config import ytcfg
 from yt.funcs import camelcase_to_underscore, iter_fields
 from yt.units.yt_array import array_like_field
 from yt.utilities.exceptions import YTParticleTypeNotFound
+from yt.utilities.io_handler import ArrayCache
 from yt.utilities.object_registries import derived_quantity_registry
 from yt.utilities.parallel_tools.parallel_analysis_interface import (
     ParallelAnalysisInterface,
+    communication_system,
     parallel_objects,
 )
 from yt.utilities.physical_constants import gravitational_constant_cgs
 from yt.utilities.physical_ratios import HUGE
 
 
+_derived_quantity_backends = ("serial", "threads", "processes", "mpi")
+
+# State shared with the worker processes processing the chunks of derived
+# quantities. The workers are forked, so they inherit it.
+_worker_state = None
+
+
+def _process_chunk(tasks, data):
+    # Process a chunk with each task, a (quantity, args, kwargs) tuple. The
+    # fields read for the chunk are shared by all the tasks.
+    if len(tasks) > 1:
+        # The intermediate fields of the chunk are kept until all the tasks
+        # have processed it
+        data._intermediate_fields = ArrayCache(sys.maxsize)
+    return [dq.process_chunk(data, *args, **kwargs) for dq, args, kwargs in tasks]
+
+
+def _process_chunks(tasks, data_source, chunk_ind=None):
+    chunks = data_source.chunks(
+        [], chunking_style=data_source._derived_quantity_chunking, chunk_ind=chunk_ind
+    )
+    return [_process_chunk(tasks, ds) for ds in chunks]
+
+
+def _process_chunk_worker(ci):
+    tasks, data_source = _worker_state
+    (results,) = _process_chunks(tasks, data_source, ci)
+    return results
+
+
+def _get_backend(data_source):
+    # The backend processing the chunks, and its number of workers. The MPI
+    # parallel path takes precedence over the local pools, and the worker
+    # processes can only be forked.
+    backend = ytcfg.get("yt", "derived_quantity_backend")
+    if backend not in _derived_quantity_backends:
+        raise ValueError(
+            f"Unknown derived quantity backend {backend!r}, "
+            f"expected one of {_derived_quantity_backends}"
+        )
+    if backend in ("serial", "mpi"):
+        return backend, 1
+    if communication_system.communicators[-1].size > 1:
+        return "mpi", 1
+    if backend == "processes":
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return "serial", 1
+    nworkers = ytcfg.get("yt", "derived_quantity_nprocs") or os.cpu_count()
+    nchunks = data_source._count_chunks(data_source._derived_quantity_chunking)
+    nworkers = min(nworkers, nchunks)
+    if nworkers <= 1:
+        return "serial", 1
+    return backend, nworkers
+
+
+def _process_chunks_threads(tasks, data_source, nthreads):
+    # The chunks are swapped into the data source while they are processed,
+    # so each thread chunks over its own clone of it.
+    nchunks = data_source._count_chunks(data_source._derived_quantity_chunking)
+    chunk_inds = [list(range(i, nchunks, nthreads)) for i in range(nthreads)]
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        futures = [
+            pool.submit(_process_chunks, tasks, data_source.clone(), chunk_ind)
+            for chunk_ind in chunk_inds
+        ]
+        results = [None] * nchunks
+        for chunk_ind, future in zip(chunk_inds, futures):
+            for ci, result in zip(chunk_ind, future.result()):
+                results[ci] = result
+    return results
+
+
+def _process_chunks_processes(tasks, data_source, nprocs):
+    global _worker_state
+    nchunks = data_source._count_chunks(data_source._derived_quantity_chunking)
+    _worker_state = (tasks, data_source)
+    try:
+        with multiprocessing.get_context("fork").Pool(nprocs) as pool:
+            return pool.map(_process_chunk_worker, range(nchunks))
+    finally:
+        _worker_state = None
+
+
+def _run_tasks(tasks, data_source):
+    # Process all the chunks of data_source with the tasks, and return the
+    # list of the results of the chunks for each task.
+    backend, nworkers = _get_backend(data_source)
+    if backend == "threads":
+        results = _process_chunks_threads(tasks, data_source, nworkers)
+    elif backend == "processes":
+        results = _process_chunks_processes(tasks, data_source, nworkers)
+    elif backend == "serial":
+        results = _process_chunks(tasks, data_source)
+    else:
+        chunks = data_source.chunks(
+            [], chunking_style=data_source._derived_quantity_chunking
+        )
+        storage = {}
+        for sto, ds in parallel_objects(chunks, -1, storage=storage):
+            sto.result = _process_chunk(tasks, ds)
+        # Now storage will have everything, and will be done via pickling, so
+        # the units will be preserved.  (Credit to Nathan for this
+        # idea/implementation.)
+        results = [storage[key] for key in sorted(storage)]
+    return [[result[i] for result in results] for i in range(len(tasks))]
+
+
+class _DeferredQuantity(Exception):
+    pass
+
+
+class _QuantityBatch:
+    # Evaluates derived quantities of the same data source together. The
+    # quantities are called repeatedly: each time, the chunk results of their
+    # calls to DerivedQuantity.__call__ are either those of a previous sweep,
+    # or they are queued for the next sweep and the quantity is deferred.
+    def __init__(self, data_source):
+        self.data_source = data_source
+        self.results = {}
+        self.pending = []
+        self.ncalls = {}
+
+    def get_results(self, dq, args, kwargs):
+        key = (id(dq), self.ncalls[id(dq)])
+        self.ncalls[id(dq)] += 1
+        if key in self.results:
+            return self.results[key]
+        self.pending.append((key, (dq, args, kwargs)))
+        raise _DeferredQuantity
+
+    def evaluate(self, quantities):
+        values = [None] * len(quantities)
+        todo = list(range(len(quantities)))
+        while todo:
+            deferred = []
+            for i in todo:
+                dq, args, kwargs = quantities[i]
+                self.ncalls[id(dq)] = 0
+                dq._batch = self
+                try:
+                    values[i] = dq(*args, **kwargs)
+                except _DeferredQuantity:
+                    deferred.append(i)
+                finally:
+                    dq._batch = None
+            if self.pending:
+                keys, tasks = zip(*self.pending)
+                self.pending = []
+                results = _run_tasks(tasks, self.data_source)
+                self.results.update(zip(keys, results))
+            todo = deferred
+        return values
+
+
 def get_position_fields(field, data):
     axis_names = [data.ds.coordinates.axis_name[num] for num in [0, 1, 2]]
     field = data._determine_fields(field)[0]
@@ -30,6 +192,8 @@ def get_position_fields(field, data):
 
 class DerivedQuantity(ParallelAnalysisInterface):
     num_vals = -1
+    # The batch of quantities this quantity is being evaluated with
+    _batch = None
 
     def __init__(self, data_source):
         self.data_source = data_source
@@ -47,19 +211,14 @@ class DerivedQuantity(ParallelAnalysisInterface):
         # create the index if it doesn't exist yet
         self.data_source.ds.index
         self.count_values(*args, **kwargs)
-        chunks = self.data_source.chunks(
-            [], chunking_style=self.data_source._derived_quantity_chunking
-        )
-        storage = {}
-        for sto, ds in parallel_objects(chunks, -1, storage=storage):
-            sto.result = self.process_chunk(ds, *args, **kwargs)
-        # Now storage will have everything, and will be done via pickling, so
-        # the units will be preserved.  (Credit to Nathan for this
-        # idea/implementation.)
+        if self._batch is None:
+            (results,) = _run_tasks([(self, args, kwargs)], self.data_source)
+        else:
+            results = self._batch.get_results(self, args, kwargs)
         values = [[] for i in range(self.num_vals)]
-        for key in sorted(storage):
+        for result in results:
             for i in range(self.num_vals):
-                values[i].append(storage[key][i])
+                values[i].append(result[i])
         # These will be YTArrays
         values = [self.data_source.ds.arr(values[i]) for i in range(self.num_vals)]
         values = self.reduce_intermediate(values)
@@ -90,6 +249,59 @@ class DerivedQuantityCollection:
     def keys(self):
         return derived_quantity_registry.keys()
 
+    def evaluate(self, requests):
+        r"""
+        Calculate several derived quantities with a single pass over the
+        chunks of the data object.
+
+        The chunks are processed by all the quantities at once, so that the
+        fields they share are only read once per chunk.
+
+        Parameters
+        ----------
+
+        requests : list
+            The quantities to calculate. Each request is the name of a
+            quantity, or a tuple of the name of a quantity, the list of its
+            positional arguments and, optionally, the dictionary of its
+            keyword arguments. The names can be given either as in
+            ``quantities["WeightedAverageQuantity"]`` or as in
+            ``quantities.weighted_average_quantity``.
+
+        Returns
+        -------
+
+        The list of the results of the quantities, in the order of the
+        requests.
+
+        Examples
+        --------
+
+        >>> ds = load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sp = ds.sphere("max", (10, "kpc"))
+        >>> density = ("gas", "density")
+        >>> extrema, average, bulk_velocity, total_mass = sp.quantities.evaluate(
+        ...     [
+        ...         ("extrema", [density]),
+        ...         ("weighted_average_quantity", [density, ("gas", "mass")]),
+        ...         ("bulk_velocity", [], {"use_particles": False}),
+        ...         "total_mass",
+        ...     ]
+        ... )
+        """
+        names = {camelcase_to_underscore(key): key for key in self.keys()}
+        quantities = []
+        for request in requests:
+            if isinstance(request, str):
+                request = (request,)
+            name, args, kwargs = request[0], (), {}
+            if len(request) > 1:
+                args = tuple(request[1])
+            if len(request) > 2:
+                kwargs = request[2]
+            quantities.append((self[names.get(name, name)], args, kwargs))
+        return _QuantityBatch(self.data_source).evaluate(quantities)
+
 
 class WeightedAverageQuantity(DerivedQuantity):
     r"""
@@ -25,6 +25,7 @@ RECONSTRUCT_INDEX = bool(ytcfg.get("yt", "reconstruct_index"))
 
 class AMRGridPatch(YTSelectionContainer):
     _spatial = True
+    _keep_intermediate_fields = False
     _num_ghost_zones = 0
     _grids = None
     _id_offset = 1
@@ -35,6 +35,7 @@ def cell_count_cache(func):
 
 class OctreeSubset(YTSelectionContainer):
     _spatial = True
+    _keep_intermediate_fields = False
     _num_ghost_zones = 0
     _type_name = "octree_subset"
     _skip_add = True
@@ -102,6 +103,16 @@ class OctreeSubset(YTSelectionContainer):
 
     _domain_ind = None
 
+    def _file_index_octs(self, selector):
+        """
+        Return the level, cell index and file index of the cells selected by
+        selector in this subset. See
+        :meth:`~yt.geometry.oct_geometry_handler.OctreeIndex._get_file_index_octs`.
+        """
+        return self.ds.index._get_file_index_octs(
+            self.oct_handler, selector, self.domain_id
+        )
+
     def mask_refinement(self, selector):
         mask = self.oct_handler.mask(selector, domain_id=self.domain_id)
         return mask
@@ -21,6 +21,7 @@ def _non_indexed(name):
 
 class ParticleContainer(YTSelectionContainer):
     _spatial = False
+    _keep_intermediate_fields = False
     _type_name = "particle_container"
     _skip_add = True
     _con_args = ("base_region", "base_selector", "data_files", "overlap_files")
@@ -10,6 +10,7 @@ from yt.utilities.lib.mesh_utilities import fill_fcoords, fill_fwidths
 class UnstructuredMesh(YTSelectionContainer):
     # This is a base class, not meant to be used directly.
     _spatial = False
+    _keep_intermediate_fields = False
     _connectivity_length = -1
     _type_name = "unstructured_mesh"
     _skip_add = True
@@ -1,6 +1,10 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from more_itertools import collapse
 
+from yt.config import ytcfg
 from yt.data_objects.field_data import YTFieldData
 from yt.fields.derived_field import DerivedField
 from yt.frontends.ytdata.utilities import save_as_dataset
@@ -10,6 +14,7 @@ from yt.units.yt_array import YTQuantity, array_like_field
 from yt.utilities.exceptions import (
     YTIllDefinedBounds,
     YTIllDefinedProfile,
+    YTIncompatibleProfiles,
     YTProfileDataShape,
 )
 from yt.utilities.lib.misc_utilities import (
@@ -68,10 +73,41 @@ class ProfileFieldAccumulator:
         self.used = np.zeros(size, dtype="bool")
         self.weight_values = np.zeros(size, dtype="float64")
 
+    def merge(self, other):
+        """
+        Add the values accumulated by another accumulator, with the same
+        fields and bins, to this one.
+        """
+        # The bins only used by the other accumulator are copied
+        new = other.used & ~self.used
+        self.values[new] = other.values[new]
+        self.mvalues[new] = other.mvalues[new]
+        self.qvalues[new] = other.qvalues[new]
+        self.weight_values[new] = other.weight_values[new]
+        # For two sets of values with total weights w1 and w2, means m1 and
+        # m2, and weighted sums of the squared deviations from the mean q1
+        # and q2, the combined mean and sum of the squared deviations are:
+        # m12 = m1 + (m2 - m1) * w2 / (w1 + w2)
+        # q12 = q1 + q2 + (m2 - m1)**2 * w1 * w2 / (w1 + w2)
+        both = other.used & self.used
+        w1 = self.weight_values[both][:, None]
+        w2 = other.weight_values[both][:, None]
+        delta = other.mvalues[both] - self.mvalues[both]
+        self.values[both] += other.values[both]
+        self.mvalues[both] += delta * w2 / (w1 + w2)
+        self.qvalues[both] += other.qvalues[both] + delta**2 * w1 * w2 / (w1 + w2)
+        self.weight_values[both] += other.weight_values[both]
+        self.used |= other.used
+
 
 class ProfileND(ParallelAnalysisInterface):
     """The profile object class"""
 
+    # The number of threads used by the binning kernels
+    _num_threads = 1
+    # The cache of the bin indices of the data object being binned
+    _bin_index_cache = None
+
     def __init__(self, data_source, weight_field=None):
         self.data_source = data_source
         self.ds = data_source.ds
@@ -85,6 +121,9 @@ class ProfileND(ParallelAnalysisInterface):
             self.standard_deviation = None
         self.weight_field = weight_field
         self.field_units = {}
+        # The fields added together, with the accumulator of their binned
+        # values
+        self._accumulators = []
         ParallelAnalysisInterface.__init__(self, comm=data_source.comm)
 
     def add_fields(self, fields):
@@ -99,11 +138,204 @@ class ProfileND(ParallelAnalysisInterface):
         fields = self.data_source._determine_fields(fields)
         for f in fields:
             self.field_info[f] = self.data_source.ds.field_info[f]
-        temp_storage = ProfileFieldAccumulator(len(fields), self.size)
-        citer = self.data_source.chunks([], "io")
-        for chunk in parallel_objects(citer):
-            self._bin_chunk(chunk, fields, temp_storage)
-        self._finalize_storage(fields, temp_storage)
+        storage = self._bin_data(self.data_source, fields)
+        self._accumulators.append((fields, storage))
+        self._finalize_storage(fields, storage)
+
+    def accumulate(self, data_source):
+        """
+        Bin the data of another data object into the profile.
+
+        The data of all the data objects binned so far are accumulated in
+        the profile, with the bins of the profile, as if they were binned
+        together. For instance, this profiles a set of halos:
+
+        >>> profile = yt.create_profile(
+        ...     halos[0], ("gas", "density"), ("gas", "temperature")
+        ... )
+        >>> for halo in halos[1:]:
+        ...     profile.accumulate(halo)
+
+        Parameters
+        ----------
+        data_source : data object
+            The data object to bin. It can belong to another dataset, whose
+            fields are then binned in the units of the profile.
+        """
+        for fields, storage in self._accumulators:
+            self._merge_storage(storage, self._bin_data(data_source, fields))
+        self._refinalize()
+
+    def merge(self, other):
+        """
+        Add the data binned by another profile to this profile.
+
+        The other profile needs to have the same bins and weight field as
+        this profile, as well as all of its fields. It can be a profile
+        loaded from a dataset saved with ``save_as_dataset``, so that
+        profiles can be resumed. For instance, this combines the profiles of
+        several datasets:
+
+        >>> ts = yt.load("DD????/DD????")
+        >>> profiles = [
+        ...     yt.create_profile(
+        ...         ds.all_data(),
+        ...         ("gas", "density"),
+        ...         ("gas", "temperature"),
+        ...         extrema={"density": (1e-30, 1e-20)},
+        ...     )
+        ...     for ds in ts
+        ... ]
+        >>> for profile in profiles[1:]:
+        ...     profiles[0].merge(profile)
+
+        Parameters
+        ----------
+        other : profile
+            The profile to merge into this one.
+        """
+        weight_field = other.weight_field
+        if weight_field is not None:
+            # The weight field of loaded profiles is stored as a list
+            weight_field = tuple(weight_field)
+        if weight_field != self.weight_field:
+            raise YTIncompatibleProfiles(
+                self, other, f"their weight fields differ ({other.weight_field})"
+            )
+        for ax in "xyz":
+            bins = getattr(self, f"{ax}_bins", None)
+            if bins is None:
+                continue
+            other_bins = getattr(other, f"{ax}_bins", None)
+            if other_bins is None or other_bins.shape != bins.shape:
+                raise YTIncompatibleProfiles(self, other, f"their {ax} bins differ")
+            if not np.allclose(other_bins.to(bins.units).d, bins.d, rtol=1e-12):
+                raise YTIncompatibleProfiles(self, other, f"their {ax} bins differ")
+        other_storages = [
+            (other._get_storage(fields), storage)
+            for fields, storage in self._accumulators
+        ]
+        for other_storage, storage in other_storages:
+            self._merge_storage(storage, other_storage)
+        self._refinalize()
+
+    def _get_storage(self, fields):
+        # The accumulator of the values of the fields binned so far
+        storages = {}
+        for acc_fields, storage in self._accumulators:
+            for i, field in enumerate(acc_fields):
+                storages[field] = storages[field[1]] = (storage, i)
+        # The fields of loaded profiles have another field type
+        keys = [field if field in storages else field[1] for field in fields]
+        missing = [key for key in keys if key not in storages]
+        if missing:
+            raise YTIncompatibleProfiles(
+                self, None, f"the fields {missing} have not been binned"
+            )
+        size = storages[keys[0]][0].used.shape
+        storage = ProfileFieldAccumulator(len(fields), size)
+        for j, key in enumerate(keys):
+            field_storage, i = storages[key]
+            storage.values[..., j] = field_storage.values[..., i]
+            storage.mvalues[..., j] = field_storage.mvalues[..., i]
+            storage.qvalues[..., j] = field_storage.qvalues[..., i]
+            storage.used |= field_storage.used
+            storage.weight_values[...] = field_storage.weight_values
+        return storage
+
+    def _bin_data(self, data_source, fields):
+        # Bin the fields of data_source, and return the accumulator of the
+        # binned values
+        # Get all the fields of each chunk at once, so that their common
+        # dependencies are only read and generated once
+        chunk_fields = list(fields)
+        if self.weight_field is not None:
+            chunk_fields.append(self.weight_field)
+        # The bin fields are only read if their bin indices are not cached
+        self._bin_index_cache = getattr(data_source, "_bin_indices", None)
+        if not self._has_bin_indices(data_source):
+            chunk_fields = list(self.bin_fields) + chunk_fields
+        nworkers, self._num_threads = self._get_binning_threads(data_source)
+        try:
+            if nworkers > 1:
+                temp_storages = self._bin_chunks_threads(
+                    data_source, chunk_fields, fields, nworkers
+                )
+            else:
+                temp_storage = ProfileFieldAccumulator(len(fields), self.size)
+                citer = enumerate(data_source.chunks(chunk_fields, "io"))
+                for ci, chunk in parallel_objects(citer):
+                    self._bin_chunk(chunk, fields, temp_storage, chunk_id=ci)
+                temp_storages = [temp_storage]
+        finally:
+            self._bin_index_cache = None
+
+        # We use our main comm here
+        # get the profile data from all procs, and all the threads binning
+        # their chunks
+        all_store = {
+            (self.comm.rank, i): temp_storage
+            for i, temp_storage in enumerate(temp_storages)
+        }
+        all_store = self.comm.par_combine_object(all_store, "join", datatype="dict")
+        storage = ProfileFieldAccumulator(len(fields), self.size)
+        for p in sorted(all_store.keys()):
+            self._merge_storage(storage, all_store[p])
+        return storage
+
+    def _merge_storage(self, storage, other):
+        storage.merge(other)
+
+    def _get_bin_index_key(self):
+        # The bin indices are reused by the profiles with the same bin fields
+        # and bins
+        return tuple(
+            (field, str(bins.units), bins.d.tobytes())
+            for field, bins in zip(self.bin_fields, self._get_all_bins())
+        )
+
+    def _get_all_bins(self):
+        return [getattr(self, f"{ax}_bins") for ax in "xyz"[: len(self.bin_fields)]]
+
+    def _has_bin_indices(self, data_source):
+        # Whether the bin indices of all the chunks of data_source are cached
+        cache = self._bin_index_cache
+        if cache is None or len(cache) == 0:
+            return False
+        key = self._get_bin_index_key()
+        nchunks = data_source._count_chunks("io")
+        return all((key, ci) in cache for ci in range(nchunks))
+
+    def _get_binning_threads(self, data_source):
+        # The number of threads binning chunks concurrently, and the number of
+        # threads used by the binning kernels for each chunk. The MPI parallel
+        # path takes precedence over the pool of threads binning the chunks.
+        nthreads = ytcfg.get("yt", "profile_threads") or os.cpu_count()
+        if nthreads <= 1:
+            return 1, 1
+        nworkers = 1
+        if self.comm.size == 1:
+            nworkers = min(nthreads, data_source._count_chunks("io"))
+            nworkers = max(nworkers, 1)
+        return nworkers, max(nthreads // nworkers, 1)
+
+    def _bin_chunks_threads(self, data_source, chunk_fields, fields, nthreads):
+        # Each thread bins its chunks into its own accumulator. The chunks are
+        # swapped into the data source while they are binned, so each thread
+        # also chunks over its own clone of it.
+        nchunks = data_source._count_chunks("io")
+
+        def bin_chunks(chunk_ind):
+            storage = ProfileFieldAccumulator(len(fields), self.size)
+            clone = data_source.clone()
+            chunks = clone.chunks(chunk_fields, "io", chunk_ind=chunk_ind)
+            for ci, chunk in zip(chunk_ind, chunks):
+                self._bin_chunk(chunk, fields, storage, chunk_id=ci)
+            return storage
+
+        chunk_inds = [list(range(i, nchunks, nthreads)) for i in range(nthreads)]
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            return list(pool.map(bin_chunks, chunk_inds))
 
     def set_field_unit(self, field, new_unit):
         """Sets a new unit for the requested field
@@ -125,79 +357,31 @@ class ProfileND(ParallelAnalysisInterface):
             else:
                 raise KeyError(f"{field} not in profile!")
 
-    def _finalize_storage(self, fields, temp_storage):
-        # We use our main comm here
-        # This also will fill _field_data
-
-        for i, _field in enumerate(fields):
-            # q values are returned as q * weight but we want just q
-            temp_storage.qvalues[..., i][
-                temp_storage.used
-            ] /= temp_storage.weight_values[temp_storage.used]
-
-        # get the profile data from all procs
-        all_store = {self.comm.rank: temp_storage}
-        all_store = self.comm.par_combine_object(all_store, "join", datatype="dict")
-
-        all_val = np.zeros_like(temp_storage.values)
-        all_mean = np.zeros_like(temp_storage.mvalues)
-        all_std = np.zeros_like(temp_storage.qvalues)
-        all_weight = np.zeros_like(temp_storage.weight_values)
-        all_used = np.zeros_like(temp_storage.used, dtype="bool")
-
-        # Combine the weighted mean and standard deviation from each processor.
-        # For two samples with total weight, mean, and standard deviation
-        # given by w, m, and s, their combined mean and standard deviation are:
-        # m12 = (m1 * w1 + m2 * w2) / (w1 + w2)
-        # s12 = (m1 * (s1**2 + (m1 - m12)**2) +
-        #        m2 * (s2**2 + (m2 - m12)**2)) / (w1 + w2)
-        # Here, the mvalues are m and the qvalues are s**2.
-        for p in sorted(all_store.keys()):
-            all_used += all_store[p].used
-            old_mean = all_mean.copy()
-            old_weight = all_weight.copy()
-            all_weight[all_store[p].used] += all_store[p].weight_values[
-                all_store[p].used
-            ]
-            for i, _field in enumerate(fields):
-                all_val[..., i][all_store[p].used] += all_store[p].values[..., i][
-                    all_store[p].used
-                ]
-
-                all_mean[..., i][all_store[p].used] = (
-                    all_mean[..., i] * old_weight
-                    + all_store[p].mvalues[..., i] * all_store[p].weight_values
-                )[all_store[p].used] / all_weight[all_store[p].used]
-
-                all_std[..., i][all_store[p].used] = (
-                    old_weight
-                    * (all_std[..., i] + (old_mean[..., i] - all_mean[..., i]) ** 2)
-                    + all_store[p].weight_values
-                    * (
-                        all_store[p].qvalues[..., i]
-                        + (all_store[p].mvalues[..., i] - all_mean[..., i]) ** 2
-                    )
-                )[all_store[p].used] / all_weight[all_store[p].used]
-
-        all_std = np.sqrt(all_std)
-        del all_store
-        self.used = all_used
-        blank = ~all_used
-
-        self.weight = all_weight
+    def _finalize_storage(self, fields, storage):
+        # This will fill _field_data from the accumulated values
+        blank = ~storage.used
+        self.used = storage.used.copy()
+        self.weight = storage.weight_values.copy()
         self.weight[blank] = 0.0
 
+        # q values are accumulated as q * weight but we want just q
+        variance = np.zeros_like(storage.qvalues)
+        variance[self.used] = (
+            storage.qvalues[self.used] / storage.weight_values[self.used][:, None]
+        )
+        std = np.sqrt(variance)
+
         for i, field in enumerate(fields):
             if self.weight_field is None:
                 self.field_data[field] = array_like_field(
-                    self.data_source, all_val[..., i], field
+                    self.data_source, storage.values[..., i].copy(), field
                 )
             else:
                 self.field_data[field] = array_like_field(
-                    self.data_source, all_mean[..., i], field
+                    self.data_source, storage.mvalues[..., i].copy(), field
                 )
                 self.standard_deviation[field] = array_like_field(
-                    self.data_source, all_std[..., i], field
+                    self.data_source, std[..., i], field
                 )
                 self.standard_deviation[field][blank] = 0.0
                 self.weight = array_like_field(
@@ -210,7 +394,57 @@ class ProfileND(ParallelAnalysisInterface):
             else:
                 self.field_map[field] = field
 
-    def _bin_chunk(self, chunk, fields, storage):
+    def _refinalize(self):
+        # Fill _field_data again after more values were accumulated, keeping
+        # the units set for the fields and their accumulation
+        field_units = self.field_units.copy()
+        for fields, storage in self._accumulators:
+            self._finalize_storage(fields, storage)
+        fields = [field for fields, _ in self._accumulators for field in fields]
+        self._apply_accumulation(fields)
+        for field, units in field_units.items():
+            self.field_units[field] = units
+
+    def _apply_accumulation(self, fields):
+        # Make the field values fractional or cumulative, as set by
+        # create_profile
+        fractional = getattr(self, "fractional", False)
+        accumulation = getattr(self, "accumulation", False)
+        if not is_sequence(accumulation):
+            accumulation = [accumulation] * len(self.bin_fields)
+        weight_field = self.weight_field
+        for field in fields:
+            if fractional:
+                self.field_data[field] /= self.field_data[field].sum()
+            for axis, acc in enumerate(accumulation):
+                if not acc:
+                    continue
+                temp = self.field_data[field]
+                temp = np.rollaxis(temp, axis)
+                if weight_field is not None:
+                    temp_weight = self.weight
+                    temp_weight = np.rollaxis(temp_weight, axis)
+                if acc < 0:
+                    temp = temp[::-1]
+                    if weight_field is not None:
+                        temp_weight = temp_weight[::-1]
+                if weight_field is None:
+                    temp = temp.cumsum(axis=0)
+                else:
+                    temp = (temp * temp_weight).cumsum(axis=0) / temp_weight.cumsum(
+                        axis=0
+                    )
+                if acc < 0:
+                    temp = temp[::-1]
+                    if weight_field is not None:
+                        temp_weight = temp_weight[::-1]
+                temp = np.rollaxis(temp, axis)
+                self.field_data[field] = temp
+                if weight_field is not None:
+                    temp_weight = np.rollaxis(temp_weight, axis)
+                    self.weight = temp_weight
+
+    def _bin_chunk(self, chunk, fields, storage, chunk_id=None):
         raise NotImplementedError
 
     def _filter(self, bin_fields):
@@ -222,9 +456,7 @@ class ProfileND(ParallelAnalysisInterface):
             pfilter &= data < ma
         return pfilter, [data[pfilter] for data in bin_fields]
 
-    def _get_data(self, chunk, fields):
-        # We are using chunks now, which will manage the field parameters and
-        # the like.
+    def _get_bin_fields(self, chunk):
         bin_fields = [chunk[bf] for bf in self.bin_fields]
         for i in range(1, len(bin_fields)):
             if bin_fields[0].shape != bin_fields[i].shape:
@@ -234,16 +466,56 @@ class ProfileND(ParallelAnalysisInterface):
                     self.bin_fields[i],
                     bin_fields[i].shape,
                 )
+        return bin_fields
+
+    def _get_data(self, chunk, fields):
+        # We are using chunks now, which will manage the field parameters and
+        # the like.
+        bin_fields = self._get_bin_fields(chunk)
         # We want to make sure that our fields are within the bounds of the
         # binning
         pfilter, bin_fields = self._filter(bin_fields)
         if not np.any(pfilter):
             return None
-        arr = np.zeros((bin_fields[0].size, len(fields)), dtype="float64")
+        arr, weight_data = self._get_field_data(chunk, fields, pfilter)
+        # So that we can pass these into
+        return arr, weight_data, bin_fields
+
+    def _get_indexed_data(self, chunk, fields, chunk_id=None):
+        # Like _get_data, with the bin indices of the values rather than the
+        # values of the bin fields
+        pfilter, bin_indices = self._get_bin_indices(chunk, chunk_id)
+        if not np.any(pfilter):
+            return None
+        arr, weight_data = self._get_field_data(chunk, fields, pfilter)
+        return arr, weight_data, bin_indices
+
+    def _get_bin_indices(self, chunk, chunk_id):
+        # The values within the bounds of the binning, and their bin indices.
+        # These are cached on the data object, so that the profiles of other
+        # fields with the same bins do not read the bin fields again.
+        cache = self._bin_index_cache
+        if cache is not None and chunk_id is not None:
+            key = (self._get_bin_index_key(), chunk_id)
+            rv = cache.get(key)
+            if rv is not None:
+                return rv
+        pfilter, bin_fields = self._filter(self._get_bin_fields(chunk))
+        bin_indices = []
+        for bf, bins in zip(bin_fields, self._get_all_bins()):
+            bf.convert_to_units(bins.units)
+            bin_indices.append(np.digitize(bf, bins) - 1)
+        if cache is not None and chunk_id is not None:
+            nbytes = pfilter.nbytes + sum(ind.nbytes for ind in bin_indices)
+            cache.put(key, (pfilter, bin_indices), nbytes)
+        return pfilter, bin_indices
+
+    def _get_field_data(self, chunk, fields, pfilter):
+        arr = np.zeros((pfilter.sum(), len(fields)), dtype="float64")
         for i, field in enumerate(fields):
             if pfilter.shape != chunk[field].shape:
                 raise YTProfileDataShape(
-                    self.bin_fields[0], bin_fields[0].shape, field, chunk[field].shape
+                    self.bin_fields[0], pfilter.shape, field, chunk[field].shape
                 )
             units = chunk.ds.field_info[field].output_units
             arr[:, i] = chunk[field][pfilter].in_units(units)
@@ -251,7 +523,7 @@ class ProfileND(ParallelAnalysisInterface):
             if pfilter.shape != chunk[self.weight_field].shape:
                 raise YTProfileDataShape(
                     self.bin_fields[0],
-                    bin_fields[0].shape,
+                    pfilter.shape,
                     self.weight_field,
                     chunk[self.weight_field].shape,
                 )
@@ -260,8 +532,7 @@ class ProfileND(ParallelAnalysisInterface):
         else:
             weight_data = np.ones(pfilter.shape, dtype="float64")
         weight_data = weight_data[pfilter]
-        # So that we can pass these into
-        return arr, weight_data, bin_fields
+        return arr, weight_data
 
     def __getitem__(self, field):
         if field in self.field_data:
@@ -377,6 +648,14 @@ class ProfileND(ParallelAnalysisInterface):
         if self.weight_field is not None:
             std_data = getattr(self, std)
             data.update({(std, field[1]): std_data[field] for field in self.field_data})
+        # The accumulated values, so that the profile can be resumed
+        acc = "accumulator"
+        for fields, storage in self._accumulators:
+            data[acc, "weight"] = storage.weight_values
+            for i, field in enumerate(fields):
+                data[acc, f"{field[1]}_values"] = storage.values[..., i]
+                data[acc, f"{field[1]}_mvalues"] = storage.mvalues[..., i]
+                data[acc, f"{field[1]}_qvalues"] = storage.qvalues[..., i]
 
         dimensionality = 0
         bin_data = []
@@ -399,7 +678,8 @@ class ProfileND(ParallelAnalysisInterface):
             data[getattr(self, f"{ax}_field")] = bin_fields[i]
 
         extra_attrs["dimensionality"] = dimensionality
-        ftypes = {field: "data" for field in data if field[0] != std}
+        ftypes = {field: "data" for field in data if field[0] not in (std, acc)}
+        ftypes.update({field: acc for field in data if field[0] == acc})
         if self.weight_field is not None:
             ftypes.update({(std, field[1]): std for field in self.field_data})
         save_as_dataset(
@@ -435,7 +715,8 @@ class ProfileNDFromDataset(ProfileND):
         profile_fields = [
             f
             for f in ds.field_list
-            if f[1] not in exclude_fields and f[0] != "standard_deviation"
+            if f[1] not in exclude_fields
+            and f[0] not in ("standard_deviation", "accumulator")
         ]
         for field in profile_fields:
             self.field_map[field[1]] = field
@@ -444,6 +725,17 @@ class ProfileNDFromDataset(ProfileND):
             self.field_units[field] = ds.data[field].units
             if ("standard_deviation", field[1]) in ds.field_list:
                 self.standard_deviation[field] = ds.data["standard_deviation", field[1]]
+        # Profiles saved with their accumulated values can be merged into
+        # other profiles
+        if ("accumulator", "weight") in ds.field_list:
+            storage = ProfileFieldAccumulator(len(profile_fields), self.used.shape)
+            storage.used[...] = self.used
+            storage.weight_values[...] = ds.data["accumulator", "weight"].d
+            for i, field in enumerate(profile_fields):
+                for name in ("values", "mvalues", "qvalues"):
+                    values = ds.data["accumulator", f"{field[1]}_{name}"].d
+                    getattr(storage, name)[..., i] = values
+            self._accumulators.append((profile_fields, storage))
 
 
 class Profile1D(ProfileND):
@@ -503,13 +795,11 @@ class Profile1D(ProfileND):
         self.bin_fields = (self.x_field,)
         self.x = 0.5 * (self.x_bins[1:] + self.x_bins[:-1])
 
-    def _bin_chunk(self, chunk, fields, storage):
-        rv = self._get_data(chunk, fields)
+    def _bin_chunk(self, chunk, fields, storage, chunk_id=None):
+        rv = self._get_indexed_data(chunk, fields, chunk_id)
         if rv is None:
             return
-        fdata, wdata, (bf_x,) = rv
-        bf_x.convert_to_units(self.field_info[self.x_field].output_units)
-        bin_ind = np.digitize(bf_x, self.x_bins) - 1
+        fdata, wdata, (bin_ind,) = rv
         new_bin_profile1d(
             bin_ind,
             wdata,
@@ -519,6 +809,7 @@ class Profile1D(ProfileND):
             storage.mvalues,
             storage.qvalues,
             storage.used,
+            num_threads=self._num_threads,
         )
 
         # We've binned it!
@@ -758,15 +1049,11 @@ class Profile2D(ProfileND):
         self.x = 0.5 * (self.x_bins[1:] + self.x_bins[:-1])
         self.y = 0.5 * (self.y_bins[1:] + self.y_bins[:-1])
 
-    def _bin_chunk(self, chunk, fields, storage):
-        rv = self._get_data(chunk, fields)
+    def _bin_chunk(self, chunk, fields, storage, chunk_id=None):
+        rv = self._get_indexed_data(chunk, fields, chunk_id)
         if rv is None:
             return
-        fdata, wdata, (bf_x, bf_y) = rv
-        bf_x.convert_to_units(self.field_info[self.x_field].output_units)
-        bin_ind_x = np.digitize(bf_x, self.x_bins) - 1
-        bf_y.convert_to_units(self.field_info[self.y_field].output_units)
-        bin_ind_y = np.digitize(bf_y, self.y_bins) - 1
+        fdata, wdata, (bin_ind_x, bin_ind_y) = rv
         new_bin_profile2d(
             bin_ind_x,
             bin_ind_y,
@@ -777,6 +1064,7 @@ class Profile2D(ProfileND):
             storage.mvalues,
             storage.qvalues,
             storage.used,
+            num_threads=self._num_threads,
         )
         # We've binned it!
 
@@ -919,7 +1207,7 @@ class ParticleProfile(Profile2D):
 
     # Either stick the particle field in the nearest bin,
     # or spread it out using the 2D CIC deposition function
-    def _bin_chunk(self, chunk, fields, storage):
+    def _bin_chunk(self, chunk, fields, storage, chunk_id=None):
         rv = self._get_data(chunk, fields)
         if rv is None:
             return
@@ -972,6 +1260,22 @@ class ParticleProfile(Profile2D):
             )
         # We've binned it!
 
+    def _merge_storage(self, storage, other):
+        # The values are deposited rather than averaged, so they are just
+        # added, and the weights of the unweighted profiles flag the bins
+        storage.values += other.values
+        if self.weight_field is None:
+            np.maximum(
+                storage.weight_values, other.weight_values, out=storage.weight_values
+            )
+        else:
+            storage.weight_values += other.weight_values
+        storage.used |= other.used
+        used = storage.used
+        storage.mvalues[used] = (
+            storage.values[used] / storage.weight_values[used][:, None]
+        )
+
 
 class Profile3D(ProfileND):
     """An object that represents a 2D profile.
@@ -1099,17 +1403,11 @@ class Profile3D(ProfileND):
         self.y = 0.5 * (self.y_bins[1:] + self.y_bins[:-1])
         self.z = 0.5 * (self.z_bins[1:] + self.z_bins[:-1])
 
-    def _bin_chunk(self, chunk, fields, storage):
-        rv = self._get_data(chunk, fields)
+    def _bin_chunk(self, chunk, fields, storage, chunk_id=None):
+        rv = self._get_indexed_data(chunk, fields, chunk_id)
         if rv is None:
             return
-        fdata, wdata, (bf_x, bf_y, bf_z) = rv
-        bf_x.convert_to_units(self.field_info[self.x_field].output_units)
-        bin_ind_x = np.digitize(bf_x, self.x_bins) - 1
-        bf_y.convert_to_units(self.field_info[self.y_field].output_units)
-        bin_ind_y = np.digitize(bf_y, self.y_bins) - 1
-        bf_z.convert_to_units(self.field_info[self.z_field].output_units)
-        bin_ind_z = np.digitize(bf_z, self.z_bins) - 1
+        fdata, wdata, (bin_ind_x, bin_ind_y, bin_ind_z) = rv
         new_bin_profile3d(
             bin_ind_x,
             bin_ind_y,
@@ -1121,6 +1419,7 @@ class Profile3D(ProfileND):
             storage.mvalues,
             storage.qvalues,
             storage.used,
+            num_threads=self._num_threads,
         )
         # We've binned it!
 
@@ -1456,34 +1755,7 @@ def create_profile(
     obj.fractional = fractional
     if fields is not None:
         obj.add_fields([field for field in fields])
-    for field in fields:
-        if fractional:
-            obj.field_data[field] /= obj.field_data[field].sum()
-        for axis, acc in enumerate(accumulation):
-            if not acc:
-                continue
-            temp = obj.field_data[field]
-            temp = np.rollaxis(temp, axis)
-            if weight_field is not None:
-                temp_weight = obj.weight
-                temp_weight = np.rollaxis(temp_weight, axis)
-            if acc < 0:
-                temp = temp[::-1]
-                if weight_field is not None:
-                    temp_weight = temp_weight[::-1]
-            if weight_field is None:
-                temp = temp.cumsum(axis=0)
-            else:
-                temp = (temp * temp_weight).cumsum(axis=0) / temp_weight.cumsum(axis=0)
-            if acc < 0:
-                temp = temp[::-1]
-                if weight_field is not None:
-                    temp_weight = temp_weight[::-1]
-            temp = np.rollaxis(temp, axis)
-            obj.field_data[field] = temp
-            if weight_field is not None:
-                temp_weight = np.rollaxis(temp_weight, axis)
-                obj.weight = temp_weight
+    obj._apply_accumulation(fields)
     if units is not None:
         for field, unit in units.items():
             field = data_source._determine_fields(field)[0]
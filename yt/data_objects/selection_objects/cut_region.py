@@ -99,12 +99,21 @@ class YTCutRegion(YTSelectionContainer3D):
     def chunks(self, fields, chunking_style, **kwargs):
         # We actually want to chunk the sub-chunk, not ourselves.  We have no
         # chunks to speak of, as we do not data IO.
-        for chunk in self.index._chunk(self.base_object, chunking_style, **kwargs):
+        chunk_ind = kwargs.pop("chunk_ind", None)
+        if chunk_ind is not None:
+            chunk_ind = list(always_iterable(chunk_ind))
+        chunks = self.index._chunk(self.base_object, chunking_style, **kwargs)
+        for ci, chunk in enumerate(chunks):
+            if chunk_ind is not None and ci not in chunk_ind:
+                continue
             with self.base_object._chunked_read(chunk):
                 with self._chunked_read(chunk):
                     self.get_data(fields)
                     yield self
 
+    def _count_chunks(self, chunking_style):
+        return self.base_object._count_chunks(chunking_style)
+
     def get_data(self, fields=None):
         fields = list(iter_fields(fields))
         self.base_object.get_data(fields)
@@ -9,10 +9,11 @@ from more_itertools import always_iterable
 from unyt.exceptions import UnitConversionError, UnitParseError
 
 import yt.geometry
+from yt.config import ytcfg
 from yt.data_objects.data_containers import YTDataContainer
 from yt.data_objects.derived_quantities import DerivedQuantityCollection
 from yt.data_objects.field_data import YTFieldData
-from yt.fields.field_exceptions import NeedsGridType
+from yt.fields.field_exceptions import NeedsGridType, NeedsParameter
 from yt.funcs import fix_axis, is_sequence, iter_fields, validate_width_tuple
 from yt.geometry.selection_routines import compose_selector
 from yt.units import YTArray, dimensions as ytdims
@@ -22,9 +23,11 @@ from yt.utilities.exceptions import (
     YTBooleanObjectsWrongDataset,
     YTDataSelectorNotImplemented,
     YTDimensionalityError,
+    YTFieldNotFound,
     YTFieldUnitError,
     YTFieldUnitParseError,
 )
+from yt.utilities.io_handler import ArrayCache
 from yt.utilities.lib.marching_cubes import march_cubes_grid, march_cubes_grid_flux
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.parallel_tools.parallel_analysis_interface import (
@@ -42,10 +45,23 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
     _max_level = None
     _min_level = None
     _derived_quantity_chunking = "io"
+    # Whether the intermediate fields needed to generate the requested fields
+    # are kept between the calls to get_data
+    _keep_intermediate_fields = True
+    _intermediate_fields = None
+    # The bin indices of the values of this data object, reused by the
+    # profiles with the same bins
+    _bin_indices = None
 
     def __init__(self, ds, field_parameters, data_source=None):
         ParallelAnalysisInterface.__init__(self)
         super().__init__(ds, field_parameters)
+        max_size = int(ytcfg.get("yt", "intermediate_field_cache_size") * 1024**2)
+        if self._keep_intermediate_fields and max_size > 0:
+            self._intermediate_fields = ArrayCache(max_size)
+        max_size = int(ytcfg.get("yt", "bin_index_cache_size") * 1024**2)
+        if max_size > 0:
+            self._bin_indices = ArrayCache(max_size)
         self._data_source = data_source
         if data_source is not None:
             if data_source.ds != self.ds:
@@ -100,6 +116,66 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
                 # NOTE: we yield before releasing the context
                 yield self
 
+    def _count_chunks(self, chunking_style):
+        # The number of chunks yielded by self.chunks for this chunking style
+        self.get_data()  # Ensure we have built ourselves
+        return sum(1 for _ in self.index._chunk(self, chunking_style))
+
+    def _restore_intermediate_field(self, field):
+        # Move an intermediate field kept from a previous call back to the
+        # field data, and return whether it was found
+        if self._intermediate_fields is None:
+            return False
+        value = self._intermediate_fields.pop(field)
+        if value is None:
+            return False
+        self.field_data[field] = value
+        return True
+
+    def _plan_field_generation(self, fields_to_generate):
+        """
+        Order the fields to generate so that each of them comes after the
+        derived fields it depends on, as found by the field detection. The
+        derived dependencies that are not generated yet are scheduled too, so
+        that every field is generated exactly once.
+
+        Returns the ordered fields, the scheduled dependencies, and for each
+        field, the fields it depends on, directly or not.
+        """
+        fd_map = self.ds.field_dependencies
+        field_info = self.ds.field_info
+        deps = {}
+        scheduled = set()
+        to_visit = list(fields_to_generate)
+        while to_visit:
+            field = to_visit.pop()
+            if field in deps:
+                continue
+            fd = fd_map.get(field, None) or fd_map.get(field[1], None)
+            if fd is None:
+                deps[field] = ()
+                continue
+            derived = [
+                f
+                for f in getattr(fd, "requested_derived", ())
+                if f != field and f in field_info
+            ]
+            deps[field] = set(fd.requested).union(derived) - {field}
+            for f in derived:
+                if f in self.field_data or f in deps:
+                    continue
+                if self._restore_intermediate_field(f):
+                    continue
+                scheduled.add(f)
+                to_visit.append(f)
+        # A derived field needs all the derived fields that its dependencies
+        # need, so sorting by the number of dependencies is a topological sort
+        plan = sorted(
+            list(fields_to_generate) + sorted(scheduled - set(fields_to_generate)),
+            key=lambda f: len(deps[f]),
+        )
+        return plan, scheduled.difference(fields_to_generate), deps
+
     def _identify_dependencies(self, fields_to_get, spatial=False):
         inspected = 0
         fields_to_get = fields_to_get[:]
@@ -180,10 +256,18 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
         ofields = set(list(self.field_data.keys()) + fields_to_get + fields_to_generate)
         # At this point, we want to figure out *all* our dependencies.
         fields_to_get = self._identify_dependencies(fields_to_get, self._spatial)
+        # Restore the dependencies kept from the previous calls
+        cache = self._intermediate_fields
+        if cache is not None:
+            for field in fields_to_get:
+                if field not in self.field_data:
+                    self._restore_intermediate_field(field)
         # We now split up into readers for the types of fields
         fluids, particles = [], []
         finfos = {}
         for ftype, fname in fields_to_get:
+            if cache is not None and (ftype, fname) in self.field_data:
+                continue
             finfo = self.ds._get_field_info(ftype, fname)
             finfos[ftype, fname] = finfo
             if finfo.sampling_type == "particle":
@@ -209,12 +293,69 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             self.field_data[f].convert_to_units(finfos[f].output_units)
 
         fields_to_generate += gen_fluids + gen_particles
-        self._generate_fields(fields_to_generate)
+        # Unless they are kept in the cache, the intermediate fields are freed
+        # as soon as they are not needed anymore
+        keep = ofields if cache is None else None
+        self._generate_fields(fields_to_generate, keep=keep)
         for field in list(self.field_data.keys()):
             if field not in ofields:
-                self.field_data.pop(field)
+                value = self.field_data.pop(field)
+                if cache is not None:
+                    cache.put(field, value, value.nbytes)
+
+    def clear_data(self):
+        super().clear_data()
+        if self._intermediate_fields is not None:
+            self._intermediate_fields.clear()
+        if self._bin_indices is not None:
+            self._bin_indices.clear()
+
+    def set_field_parameter(self, name, val):
+        super().set_field_parameter(name, val)
+        # The intermediate fields and the bin fields may depend on the field
+        # parameters
+        if self._intermediate_fields is not None:
+            self._intermediate_fields.clear()
+        if self._bin_indices is not None:
+            self._bin_indices.clear()
+
+    def get_intermediate_field_cache_stats(self):
+        """
+        Return the statistics of the cache of the intermediate fields of this
+        data object, as a dictionary with the number of "hits" and "misses" of
+        the lookups of the dependencies of the requested fields, and the
+        number of "fields" and "nbytes" held by the cache.
 
-    def _generate_fields(self, fields_to_generate):
+        The size of the cache is set, in megabytes, by the
+        ``intermediate_field_cache_size`` configuration option.
+        """
+        cache = self._intermediate_fields
+        if cache is None:
+            return {"hits": 0, "misses": 0, "fields": 0, "nbytes": 0}
+        return {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "fields": len(cache),
+            "nbytes": cache.size,
+        }
+
+    def _generate_fields(self, fields_to_generate, keep=None):
+        """
+        Generate the fields_to_generate, following the order of their
+        dependencies. If keep is given, the other fields are removed from the
+        field data once all the fields that depend on them are generated.
+        """
+        fields_to_generate, scheduled, deps = self._plan_field_generation(
+            fields_to_generate
+        )
+        consumers = defaultdict(int)
+        if keep is not None:
+            keep = set(keep)
+            for field in fields_to_generate:
+                for dep in deps[field]:
+                    consumers[dep] += 1
+        # The scheduled fields that are skipped or freed are considered done
+        freed = set()
         index = 0
         with self._field_lock():
             # At this point, we assume that any fields that are necessary to
@@ -223,14 +364,30 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             # fields have a spatial requirement.  This will be checked inside
             # _generate_field, at which point additional dependencies may
             # actually be noted.
-            while any(f not in self.field_data for f in fields_to_generate):
+            while any(
+                f not in self.field_data and f not in freed for f in fields_to_generate
+            ):
                 field = fields_to_generate[index % len(fields_to_generate)]
                 index += 1
-                if field in self.field_data:
+                if field in self.field_data or field in freed:
                     continue
                 fi = self.ds._get_field_info(*field)
                 try:
-                    fd = self._generate_field(field)
+                    if field in scheduled:
+                        # Only make one attempt at the scheduled fields, since
+                        # they may not be needed with these field parameters
+                        scheduled.discard(field)
+                        try:
+                            fd = self._generate_field(field)
+                        except (
+                            GenerationInProgress,
+                            NeedsParameter,
+                            YTFieldNotFound,
+                        ):
+                            freed.add(field)
+                            continue
+                    else:
+                        fd = self._generate_field(field)
                     if hasattr(fd, "units"):
                         fd.units.registry = self.ds.unit_registry
                     if fd is None:
@@ -273,9 +430,31 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
                         raise YTFieldUnitParseError(fi) from e
                     self.field_data[field] = fd
                 except GenerationInProgress as gip:
+                    refetch = []
                     for f in gip.fields:
-                        if f not in fields_to_generate:
+                        if f in freed:
+                            refetch.append(f)
+                        elif f not in fields_to_generate:
                             fields_to_generate.append(f)
+                    if refetch:
+                        # The fields skipped or freed too early are needed
+                        # after all: get them again, and keep them
+                        freed.difference_update(refetch)
+                        if keep is not None:
+                            keep.update(refetch)
+                        self._locked = False
+                        try:
+                            self.get_data(refetch)
+                        finally:
+                            self._locked = True
+                    continue
+                if keep is None:
+                    continue
+                for dep in deps.get(field, ()):
+                    consumers[dep] -= 1
+                    if consumers[dep] == 0 and dep not in keep:
+                        if self.field_data.pop(dep, None) is not None:
+                            freed.add(dep)
 
     def __or__(self, other):
         if not isinstance(other, YTSelectionContainer):
@@ -337,8 +516,10 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
     @contextmanager
     def _field_lock(self):
         self._locked = True
-        yield
-        self._locked = False
+        try:
+            yield
+        finally:
+            self._locked = False
 
     @contextmanager
     def _ds_hold(self, new_ds):
@@ -379,13 +560,18 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
         old_field_data, self.field_data = self.field_data, YTFieldData()
         old_chunk, self._current_chunk = self._current_chunk, chunk
         old_locked, self._locked = self._locked, False
-        yield
-        self.field_data = old_field_data
-        self._current_chunk = old_chunk
-        self._locked = old_locked
-        if hasattr(chunk, "objs"):
-            for obj in chunk.objs:
-                obj.field_data = obj_field_data.pop(0)
+        # The intermediate fields of a chunk are not kept
+        old_cache, self._intermediate_fields = self._intermediate_fields, None
+        try:
+            yield
+        finally:
+            self.field_data = old_field_data
+            self._current_chunk = old_chunk
+            self._locked = old_locked
+            self._intermediate_fields = old_cache
+            if hasattr(chunk, "objs"):
+                for obj in chunk.objs:
+                    obj.field_data = obj_field_data.pop(0)
 
     @contextmanager
     def _activate_cache(self):
@@ -136,7 +136,6 @@ class Dataset(abc.ABC):
     known_filters = None
     _index_class: Type[Index]
     field_units = None
-    derived_field_list = requires_index("derived_field_list")
     fields = requires_index("fields")
     _instantiated = False
     _unique_identifier: Optional[Union[str, int]] = None
@@ -601,6 +600,17 @@ class Dataset(abc.ABC):
     def field_list(self):
         return self.index.field_list
 
+    @property
+    def derived_field_list(self):
+        self.index
+        # Complete the list with the fields whose detection was deferred
+        self.field_info.check_lazy_fields()
+        return self.__dict__["derived_field_list"]
+
+    @derived_field_list.setter
+    def derived_field_list(self, value):
+        self.__dict__["derived_field_list"] = value
+
     def create_field_info(self):
         self.field_dependencies = {}
         self.derived_field_list = []
@@ -635,8 +645,7 @@ class Dataset(abc.ABC):
                     mylog.debug("zero common fields, skipping particle union 'nbody'")
         self.field_info.setup_extra_union_fields()
         self.field_info.load_all_plugins(self.default_fluid_type)
-        deps, unloaded = self.field_info.check_derived_fields()
-        self.field_dependencies.update(deps)
+        self._check_derived_fields()
         self.fields = FieldTypeContainer(self)
         self.index.field_list = sorted(self.field_list)
         # Now that we've detected the fields, set this flag so that
@@ -644,6 +653,14 @@ class Dataset(abc.ABC):
         self.fields_detected = True
         self._last_freq = (None, None)
 
+    def _check_derived_fields(self):
+        if self.field_info.lazy_field_detection:
+            # Each field is checked the first time it is used
+            self.field_info.defer_derived_fields()
+            return
+        deps, unloaded = self.field_info.check_derived_fields(cache=True)
+        self.field_dependencies.update(deps)
+
     def set_field_label_format(self, format_property, value):
         """
         Set format properties for how fields will be written
@@ -849,6 +866,13 @@ class Dataset(abc.ABC):
     def _get_field_info(self, ftype, fname=None):
         field_info, is_ambiguous = self._get_field_info_helper(ftype, fname)
 
+        lazy_fields = self.field_info._lazy_fields
+        if lazy_fields and field_info.name in lazy_fields:
+            self.field_info.check_lazy_fields([field_info.name])
+            if field_info.name not in self.field_info:
+                self._last_freq = (None, None)
+                raise YTFieldNotFound(field_info.name, self)
+
         if is_ambiguous:
             ft, fn = field_info.name
             msg = (
@@ -1926,6 +1950,11 @@ class ParticleDataset(Dataset):
 
 
 def validate_index_order(index_order):
+    if isinstance(index_order, dict):
+        # One index per particle type, each with its own orders
+        return {
+            ptype: validate_index_order(order) for ptype, order in index_order.items()
+        }
     if index_order is None:
         index_order = (6, 2)
     elif not is_sequence(index_order):
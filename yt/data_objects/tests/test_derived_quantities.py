@@ -288,3 +288,74 @@ def test_derived_quantities_with_particle_types():
         ),
         1309.164886405665,
     )
+
+
+def test_derived_quantity_backends():
+    from yt.config import ytcfg
+
+    ds = fake_random_ds(
+        16,
+        nprocs=8,
+        fields=("density", "velocity_x", "velocity_y", "velocity_z"),
+        units=("g/cm**3", "cm/s", "cm/s", "cm/s"),
+        particles=16**3,
+    )
+    sp = ds.sphere("c", 0.3)
+    quantities = [
+        ("weighted_average_quantity", (("gas", "density"), ("gas", "mass"))),
+        ("extrema", (("gas", "velocity_x"),)),
+        ("center_of_mass", ()),
+        ("angular_momentum_vector", ()),
+        ("max_location", (("gas", "density"),)),
+    ]
+    old_backend = ytcfg.get("yt", "derived_quantity_backend")
+    old_nprocs = ytcfg.get("yt", "derived_quantity_nprocs")
+    ytcfg["yt", "derived_quantity_nprocs"] = 3
+    try:
+        ref = [getattr(sp.quantities, name)(*args) for name, args in quantities]
+        for backend in ["serial", "threads", "processes"]:
+            ytcfg["yt", "derived_quantity_backend"] = backend
+            for (name, args), v1 in zip(quantities, ref):
+                v2 = getattr(sp.quantities, name)(*args)
+                assert_rel_equal(np.array(v1, "f8"), np.array(v2, "f8"), 12)
+    finally:
+        ytcfg["yt", "derived_quantity_backend"] = old_backend
+        ytcfg["yt", "derived_quantity_nprocs"] = old_nprocs
+
+
+def test_evaluate_quantities():
+    ds = fake_random_ds(
+        16,
+        nprocs=8,
+        fields=("density", "velocity_x", "velocity_y", "velocity_z"),
+        units=("g/cm**3", "cm/s", "cm/s", "cm/s"),
+        particles=16**3,
+    )
+    read_fields = []
+    _read_fluid_selection = ds.index.io._read_fluid_selection
+
+    def _counting_read(chunks, selector, fields, size):
+        read_fields.extend(fields)
+        return _read_fluid_selection(chunks, selector, fields, size)
+
+    ds.index.io._read_fluid_selection = _counting_read
+    sp = ds.sphere("c", 0.3)
+    requests = [
+        ("extrema", [("gas", "density")]),
+        ("WeightedAverageQuantity", [("gas", "density"), ("gas", "mass")]),
+        ("bulk_velocity", [], {"use_particles": False}),
+        "total_mass",
+    ]
+    values = sp.quantities.evaluate(requests)
+    # The fields shared by the quantities are only read once
+    assert_equal(len(read_fields), len(set(read_fields)))
+    nreads = len(read_fields)
+    ref = [
+        sp.quantities.extrema(("gas", "density")),
+        sp.quantities.weighted_average_quantity(("gas", "density"), ("gas", "mass")),
+        sp.quantities.bulk_velocity(use_particles=False),
+        sp.quantities.total_mass(),
+    ]
+    assert nreads < len(read_fields) - nreads
+    for v1, v2 in zip(values, ref):
+        assert_equal(v1, v2)
@@ -0,0 +1,55 @@
+from collections import Counter
+
+from yt.testing import assert_allclose_units, assert_equal, fake_random_ds
+
+_fields = ("density", "velocity_x", "velocity_y", "velocity_z")
+_units = ("g/cm**3", "cm/s", "cm/s", "cm/s")
+
+
+def _track_generation(dobj):
+    generated = Counter()
+    field_data_sizes = []
+    _generate_field = dobj._generate_field
+
+    def _tracking_generate_field(field):
+        generated[field] += 1
+        field_data_sizes.append(len(dobj.field_data))
+        return _generate_field(field)
+
+    dobj._generate_field = _tracking_generate_field
+    return generated, field_data_sizes
+
+
+def test_fields_generated_once():
+    ds = fake_random_ds(16, fields=_fields, units=_units, nprocs=4)
+    fields = [
+        ("gas", "angular_momentum_x"),
+        ("gas", "kinetic_energy_density"),
+        ("gas", "velocity_magnitude"),
+    ]
+    sp = ds.sphere("c", 0.3)
+    generated, _ = _track_generation(sp)
+    sp.get_data(fields)
+    assert generated[("gas", "cell_mass")] > 0
+    assert_equal(max(generated.values()), 1)
+    assert_equal(sorted(sp.keys()), sorted(fields))
+
+    ref = ds.sphere("c", 0.3)
+    for field in fields:
+        assert_allclose_units(sp[field], ref[field])
+
+
+def test_intermediate_fields_freed():
+    ds = fake_random_ds(16, fields=_fields, units=_units, nprocs=4)
+    ad = ds.all_data()
+    _, field_data_sizes = _track_generation(ad)
+    fields = [
+        ("gas", "specific_angular_momentum_magnitude"),
+        ("gas", "kinetic_energy_density"),
+        ("gas", "radial_velocity"),
+    ]
+    ad.get_data(fields)
+    # The intermediate fields are freed as soon as the last field that
+    # depends on them is generated
+    assert any(b < a for a, b in zip(field_data_sizes, field_data_sizes[1:]))
+    assert_equal(sorted(ad.keys()), sorted(fields))
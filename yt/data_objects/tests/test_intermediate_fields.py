@@ -0,0 +1,89 @@
+from collections import Counter
+
+from yt.config import ytcfg
+from yt.testing import assert_equal, fake_random_ds
+
+_fields = ("density", "velocity_x", "velocity_y", "velocity_z")
+_units = ("g/cm**3", "cm/s", "cm/s", "cm/s")
+
+
+def _count_reads(ds):
+    io = ds.index.io
+    read_fields = []
+    _read_fluid_selection = io._read_fluid_selection
+
+    def _counting_read(chunks, selector, fields, size):
+        read_fields.extend(fields)
+        return _read_fluid_selection(chunks, selector, fields, size)
+
+    io._read_fluid_selection = _counting_read
+    return read_fields
+
+
+def _get_data(cache_size, dims=16):
+    old_size = ytcfg.get("yt", "intermediate_field_cache_size")
+    ytcfg["yt", "intermediate_field_cache_size"] = cache_size
+    try:
+        ds = fake_random_ds(dims, fields=_fields, units=_units, nprocs=4)
+        read_fields = _count_reads(ds)
+        sp = ds.sphere("c", 0.3) if dims == 16 else ds.all_data()
+        data = [
+            sp["gas", "kinetic_energy_density"],
+            sp["gas", "velocity_magnitude"],
+        ]
+    finally:
+        ytcfg["yt", "intermediate_field_cache_size"] = old_size
+    return sp, data, read_fields
+
+
+def test_intermediate_fields():
+    _, ref, ref_reads = _get_data(0)
+    sp, data, read_fields = _get_data(10)
+    for v1, v2 in zip(ref, data):
+        assert_equal(v1, v2)
+    # The velocities are only read once
+    assert len(read_fields) < len(ref_reads)
+    assert_equal(len(read_fields), len(set(read_fields)))
+    keys = [("gas", "kinetic_energy_density"), ("gas", "velocity_magnitude")]
+    assert_equal(sorted(sp.keys()), keys)
+
+    stats = sp.get_intermediate_field_cache_stats()
+    assert stats["hits"] > 0
+    assert stats["fields"] > 0
+    assert stats["nbytes"] > 0
+
+    sp.clear_data()
+    stats = sp.get_intermediate_field_cache_stats()
+    assert_equal(stats["fields"], 0)
+    assert_equal(stats["nbytes"], 0)
+
+
+def test_intermediate_fields_memory_budget():
+    # The fields larger than the cache (2MB each here) are never kept
+    sp, _, read_fields = _get_data(1, dims=64)
+    stats = sp.get_intermediate_field_cache_stats()
+    assert_equal(stats["fields"], 0)
+    assert_equal(stats["hits"], 0)
+
+
+def test_derived_intermediate_fields():
+    old_size = ytcfg.get("yt", "intermediate_field_cache_size")
+    ytcfg["yt", "intermediate_field_cache_size"] = 10
+    try:
+        ds = fake_random_ds(16, fields=_fields, units=_units, nprocs=4)
+        sp = ds.sphere("c", 0.3)
+    finally:
+        ytcfg["yt", "intermediate_field_cache_size"] = old_size
+    generated = Counter()
+    _generate_field = sp._generate_field
+
+    def _counting_generate_field(field):
+        generated[field] += 1
+        return _generate_field(field)
+
+    sp._generate_field = _counting_generate_field
+    sp["gas", "specific_angular_momentum_magnitude"]
+    sp["gas", "angular_momentum_magnitude"]
+    # The derived intermediate fields are restored from the cache
+    assert generated["gas", "specific_angular_momentum_x"] == 1
+    assert_equal(max(generated.values()), 1)
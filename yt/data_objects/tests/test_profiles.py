@@ -9,6 +9,7 @@ import yt
 from yt.data_objects.particle_filters import add_particle_filter
 from yt.data_objects.profiles import Profile1D, Profile2D, Profile3D, create_profile
 from yt.testing import (
+    assert_allclose_units,
     assert_equal,
     assert_raises,
     assert_rel_equal,
@@ -16,7 +17,11 @@ from yt.testing import (
     fake_sph_orientation_ds,
     requires_module,
 )
-from yt.utilities.exceptions import YTIllDefinedProfile, YTProfileDataShape
+from yt.utilities.exceptions import (
+    YTIllDefinedProfile,
+    YTIncompatibleProfiles,
+    YTProfileDataShape,
+)
 from yt.visualization.profile_plotter import PhasePlot, ProfilePlot
 
 _fields = ("density", "temperature", "dinosaurs", "tribbles")
@@ -537,6 +542,173 @@ def test_profile_sph_data():
     )
 
 
+def test_profile_threads():
+    from yt.config import ytcfg
+
+    ds = fake_random_ds(32, nprocs=8, fields=_fields, units=_units)
+    ad = ds.all_data()
+    sources = [ad, ds.cut_region(ad, ['obj["gas", "density"] > 0.5'])]
+    bin_fields = [
+        [("gas", "density")],
+        [("gas", "density"), ("gas", "temperature")],
+        [("gas", "density"), ("gas", "temperature"), ("stream", "dinosaurs")],
+    ]
+    old_threads = ytcfg.get("yt", "profile_threads")
+    try:
+        for source in sources:
+            for bf in bin_fields:
+                for weight_field in [None, ("gas", "mass")]:
+                    profiles = []
+                    for nthreads in [1, 4, 64]:
+                        ytcfg["yt", "profile_threads"] = nthreads
+                        profiles.append(
+                            create_profile(
+                                source,
+                                bf,
+                                [("stream", "tribbles")],
+                                weight_field=weight_field,
+                                n_bins=8,
+                            )
+                        )
+                    ref = profiles[0]
+                    for profile in profiles[1:]:
+                        assert_equal(profile.used, ref.used)
+                        assert_allclose_units(profile.weight, ref.weight, 1e-12)
+                        field = ("stream", "tribbles")
+                        assert_allclose_units(profile[field], ref[field], 1e-12)
+                        if weight_field is not None:
+                            assert_allclose_units(
+                                profile.standard_deviation[field],
+                                ref.standard_deviation[field],
+                                1e-10,
+                            )
+    finally:
+        ytcfg["yt", "profile_threads"] = old_threads
+
+
+def test_profile_bin_index_cache():
+    from yt.config import ytcfg
+
+    options = ("bin_index_cache_size", "profile_threads")
+    old_values = [ytcfg.get("yt", opt) for opt in options]
+    bin_fields = [("gas", "density"), ("gas", "temperature")]
+    # The extrema are given, so that create_profile does not read the bin fields
+    kwargs = {
+        "extrema": {field: (1e-3, 1) for field in bin_fields},
+        "weight_field": None,
+    }
+    try:
+        for nthreads in [1, 4]:
+            ytcfg["yt", "profile_threads"] = nthreads
+            ytcfg["yt", "bin_index_cache_size"] = 0
+            ds = fake_random_ds(32, nprocs=8, fields=_fields, units=_units)
+            refs = [
+                create_profile(ds.all_data(), bin_fields, field, n_bins=8, **kwargs)
+                for field in [("stream", "tribbles"), ("stream", "dinosaurs")]
+            ]
+
+            ytcfg["yt", "bin_index_cache_size"] = 64
+            ds = fake_random_ds(32, nprocs=8, fields=_fields, units=_units)
+            ad = ds.all_data()
+            create_profile(ad, bin_fields, ("stream", "tribbles"), n_bins=8, **kwargs)
+            io = ds.index.io
+            read_fields = []
+            _read_fluid_selection = io._read_fluid_selection
+
+            def _counting_read(chunks, selector, fields, size):
+                read_fields.extend(fields)
+                return _read_fluid_selection(chunks, selector, fields, size)
+
+            io._read_fluid_selection = _counting_read
+            profiles = [
+                create_profile(ad, bin_fields, field, n_bins=8, **kwargs)
+                for field in [("stream", "tribbles"), ("stream", "dinosaurs")]
+            ]
+            # Only the profiled fields are read again
+            assert_equal(
+                set(read_fields), {("stream", "tribbles"), ("stream", "dinosaurs")}
+            )
+            for profile, ref in zip(profiles, refs):
+                _check_profiles(profile, ref, ref.field_data)
+
+            # Other bins need other bin indices
+            read_fields.clear()
+            create_profile(ad, bin_fields, ("stream", "tribbles"), n_bins=4, **kwargs)
+            assert ("stream", "density") in read_fields
+    finally:
+        for opt, value in zip(options, old_values):
+            ytcfg["yt", opt] = value
+
+
+def _check_profiles(profile, ref, fields):
+    assert_equal(profile.used, ref.used)
+    assert_allclose_units(profile.weight, ref.weight, 1e-12)
+    for field in fields:
+        assert_allclose_units(profile[field], ref[field], 1e-10)
+        if ref.weight_field is not None:
+            assert_allclose_units(
+                profile.standard_deviation[field],
+                ref.standard_deviation[field],
+                1e-8,
+            )
+
+
+def test_profile_accumulate():
+    ds = fake_random_ds(32, nprocs=8, fields=_fields, units=_units)
+    ad = ds.all_data()
+    halves = [
+        ds.cut_region(ad, ['obj["index", "x"] < 0.5']),
+        ds.cut_region(ad, ['obj["index", "x"] >= 0.5']),
+    ]
+    bin_fields = [("gas", "density"), ("gas", "temperature")]
+    fields = [("stream", "tribbles"), ("stream", "dinosaurs")]
+    extrema = {("gas", "density"): (1e-3, 1), ("gas", "temperature"): (1e-3, 1)}
+    for weight_field in [None, ("gas", "mass")]:
+        kwargs = {"weight_field": weight_field, "extrema": extrema, "n_bins": 8}
+        ref = create_profile(ad, bin_fields, fields, **kwargs)
+
+        profile = create_profile(halves[0], bin_fields, fields, **kwargs)
+        profile.accumulate(halves[1])
+        _check_profiles(profile, ref, fields)
+
+        profiles = [
+            create_profile(half, bin_fields, fields, **kwargs) for half in halves
+        ]
+        profiles[0].merge(profiles[1])
+        _check_profiles(profiles[0], ref, fields)
+
+        # The profiles need to have the same bins
+        other = create_profile(
+            halves[1], bin_fields, fields, weight_field=weight_field, n_bins=8
+        )
+        assert_raises(YTIncompatibleProfiles, profile.merge, other)
+
+
+@requires_module("h5py")
+def test_profile_resume():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+    try:
+        ds = fake_random_ds(32, nprocs=8, fields=_fields, units=_units)
+        ad = ds.all_data()
+        left = ds.cut_region(ad, ['obj["index", "x"] < 0.5'])
+        right = ds.cut_region(ad, ['obj["index", "x"] >= 0.5'])
+        fields = [("stream", "tribbles")]
+        bin_field = ("gas", "density")
+        kwargs = {"weight_field": ("gas", "mass"), "extrema": {bin_field: (1e-3, 1)}}
+        ref = create_profile(ad, bin_field, fields, **kwargs)
+
+        # A saved profile can be merged into a new one to resume it
+        fn = create_profile(left, bin_field, fields, **kwargs).save_as_dataset()
+        profile = create_profile(right, bin_field, fields, **kwargs)
+        profile.merge(yt.load(fn).profile)
+        _check_profiles(profile, ref, fields)
+    finally:
+        os.chdir(curdir)
+        shutil.rmtree(tmpdir)
+
+
 def test_profile_override_limits():
     ds = fake_random_ds(64, nprocs=8, fields=_fields, units=_units)
 
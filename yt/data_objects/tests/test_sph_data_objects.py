@@ -1,7 +1,13 @@
 import numpy as np
 
-from yt import SlicePlot
-from yt.testing import assert_equal, fake_sph_grid_ds, fake_sph_orientation_ds
+from yt import OffAxisProjectionPlot, ProjectionPlot, SlicePlot
+from yt.config import ytcfg
+from yt.testing import (
+    assert_allclose_units,
+    assert_equal,
+    fake_sph_grid_ds,
+    fake_sph_orientation_ds,
+)
 
 
 def test_point():
@@ -332,3 +338,87 @@ def test_covering_grid_gather():
     cg_dens = cg[field].to("g*cm**-3").d
 
     assert_equal(ag_dens, cg_dens)
+
+
+def test_projection_fields_together():
+    ds = fake_sph_grid_ds()
+    fields = [("gas", "density"), ("gas", "mass"), ("io", "particle_mass")]
+    for weight_field in [None, ("gas", "density")]:
+        for ax in range(3):
+            proj = ds.proj(fields, ax, weight_field=weight_field)
+            frb = proj.to_frb(ds.domain_width[0], 32)
+            # The SPH fields are projected in a single pass
+            frb._get_fields(fields)
+            for field in fields:
+                ref = ds.proj(field, ax, weight_field=weight_field)
+                ref = ref.to_frb(ds.domain_width[0], 32)[field]
+                assert_equal(frb[field].units, ref.units)
+                assert_allclose_units(frb[field], ref, 1e-12)
+
+
+def test_sph_num_threads():
+    ds = fake_sph_orientation_ds()
+    field = ("gas", "density")
+    c = np.array([0.0, 0.0, 0.0])
+    width = 1.5
+
+    images = []
+    for num_threads in [1, 4]:
+        plots = [
+            SlicePlot(ds, "z", field, center=c, width=width),
+            ProjectionPlot(ds, "z", field, center=c, width=width),
+            OffAxisProjectionPlot(ds, [1, 1, 1], field, center=c, width=width),
+        ]
+        for p in plots:
+            p.set_buff_size(64)
+            p.set_num_threads(num_threads)
+        images.append([p.frb[field] for p in plots])
+    for image1, image2 in zip(*images):
+        assert_allclose_units(image1, image2, 1e-12)
+
+    grids = []
+    old_num_threads = ytcfg.get("yt", "num_threads")
+    try:
+        for num_threads in [1, 4]:
+            ytcfg["yt", "num_threads"] = num_threads
+            ag = ds.arbitrary_grid(c - width / 2, c + width / 2, [32] * 3)
+            grids.append(ag[field])
+    finally:
+        ytcfg["yt", "num_threads"] = old_num_threads
+    # Each voxel is filled by a single thread
+    assert_equal(grids[0], grids[1])
+
+
+def _sph_images(ds):
+    field = ("gas", "density")
+    c = np.array([0.0, 0.0, 0.0])
+    width = 1.5
+    plots = [
+        SlicePlot(ds, "z", field, center=c, width=width),
+        ProjectionPlot(ds, "z", field, center=c, width=width),
+        OffAxisProjectionPlot(ds, [1, 1, 1], field, center=c, width=width),
+    ]
+    images = [p.frb[field] for p in plots]
+    ag = ds.arbitrary_grid(c - width / 2, c + width / 2, [16] * 3)
+    return images + [ag[field]]
+
+
+def test_sph_particle_order():
+    ref = _sph_images(fake_sph_orientation_ds())
+    old_size = ytcfg.get("yt", "sph_particle_order_cache_size")
+    ytcfg["yt", "sph_particle_order_cache_size"] = 1
+    try:
+        ds = fake_sph_orientation_ds()
+        images = _sph_images(ds)
+    finally:
+        ytcfg["yt", "sph_particle_order_cache_size"] = old_size
+    for image, ref_image in zip(images, ref):
+        assert_allclose_units(image, ref_image, 1e-12)
+
+    # The orders are cached, and reused by the same images
+    orders = ds.index._particle_orders
+    nmisses = orders.misses
+    assert len(orders) > 0
+    _sph_images(ds)
+    assert_equal(orders.misses, nmisses)
+    assert orders.hits > 0
@@ -102,3 +102,42 @@ def test_init_fake_dataseries():
         finally:
             # tear down to avoid possible breakage in following tests
             output_type_registry.pop("FakeDataset")
+
+
+def test_piter_processes():
+    from yt.testing import assert_equal, fake_random_ds
+
+    datasets = [fake_random_ds(8, nprocs=2) for _ in range(5)]
+    ts = DatasetSeries(datasets)
+    ref = {}
+    for sto, ds in ts.piter(storage=ref):
+        sto.result = (str(ds), ds.all_data()["gas", "density"].sum())
+    for njobs in [1, 3, 8]:
+        storage = {}
+        for sto, ds in ts.piter(storage=storage, backend="processes", njobs=njobs):
+            sto.result = (str(ds), ds.all_data()["gas", "density"].sum())
+        assert_equal(sorted(storage), list(range(len(datasets))))
+        for i in ref:
+            assert_equal(storage[i][0], ref[i][0])
+            assert_equal(storage[i][1], ref[i][1])
+    assert_raises(ValueError, next, ts.piter(backend="threads"))
+
+
+def test_piter_processes_error():
+    from yt.testing import assert_equal, fake_random_ds
+
+    datasets = [fake_random_ds(8) for _ in range(4)]
+    ts = DatasetSeries(datasets)
+    storage = {}
+    try:
+        for sto, ds in ts.piter(storage=storage, backend="processes", njobs=2):
+            if ds is datasets[1]:
+                raise ValueError("Failed on purpose")
+            sto.result = str(ds)
+    except RuntimeError as error:
+        # The failed dataset is reported, and the results of the other
+        # datasets are sent back
+        assert "while processing the object 1." in str(error)
+    else:
+        raise AssertionError("The iteration did not fail")
+    assert_equal(sorted(storage), [0, 2, 3])
@@ -25,6 +25,7 @@ from yt.utilities.parallel_tools.parallel_analysis_interface import (
     communication_system,
     parallel_objects,
     parallel_root_only,
+    process_parallel_objects,
 )
 
 
@@ -229,7 +230,7 @@ class DatasetSeries:
     def outputs(self):
         return self._pre_outputs
 
-    def piter(self, storage=None, dynamic=False):
+    def piter(self, storage=None, dynamic=False, backend="mpi", njobs=0):
         r"""Iterate over time series components in parallel.
 
         This allows you to iterate over a time series while dispatching
@@ -263,6 +264,19 @@ class DatasetSeries:
             is enabled with a set of 128 processors available, only
             127 will be available to iterate over objects as one will
             be load balancing the rest.
+        backend : "mpi" or "processes"
+            With "mpi", the datasets are dispatched to the MPI tasks when yt
+            is run in parallel with MPI. With "processes", they are
+            dispatched to local processes, forked when the iteration starts,
+            which each run the body of the loop for their datasets (see
+            :func:`~yt.utilities.parallel_tools.parallel_analysis_interface.process_parallel_objects`).
+            The stored results are then sent back, so they need to be
+            picklable. The MPI backend is used when yt is run in parallel with
+            MPI, and the datasets are iterated over serially when processes
+            cannot be forked.
+        njobs : integer
+            The number of processes used by the "processes" backend. By
+            default, one process is forked for each available CPU.
 
 
         Examples
@@ -291,6 +305,16 @@ class DatasetSeries:
         ...     print("% 4i  %0.3e" % (i, v))
         ...
 
+        This analyses the datasets concurrently on 8 local processes, without
+        MPI:
+
+        >>> my_storage = {}
+        >>> for sto, ds in ts.piter(
+        ...     storage=my_storage, backend="processes", njobs=8
+        ... ):
+        ...     sto.result = ds.all_data().quantities.total_mass()
+        ...
+
         This shows how to dispatch 4 processors to each dataset:
 
         >>> ts = DatasetSeries("DD*/DD*.index", parallel=4)
@@ -299,26 +323,39 @@ class DatasetSeries:
         ...
 
         """
-        if not self.parallel:
-            njobs = 1
-        elif not dynamic:
-            if self.parallel:
-                njobs = -1
-            else:
-                njobs = self.parallel
+        if backend not in ("mpi", "processes"):
+            raise ValueError(
+                f"Unknown backend {backend!r}, expected 'mpi' or 'processes'"
+            )
+        if communication_system.communicators[-1].size > 1:
+            backend = "mpi"
+
+        if backend == "processes":
+            oiter = process_parallel_objects(
+                self._pre_outputs, njobs=njobs, storage=storage
+            )
         else:
-            my_communicator = communication_system.communicators[-1]
-            nsize = my_communicator.size
-            if nsize == 1:
-                self.parallel = False
-                dynamic = False
+            if not self.parallel:
                 njobs = 1
+            elif not dynamic:
+                if self.parallel:
+                    njobs = -1
+                else:
+                    njobs = self.parallel
             else:
-                njobs = nsize - 1
+                my_communicator = communication_system.communicators[-1]
+                nsize = my_communicator.size
+                if nsize == 1:
+                    self.parallel = False
+                    dynamic = False
+                    njobs = 1
+                else:
+                    njobs = nsize - 1
+            oiter = parallel_objects(
+                self._pre_outputs, njobs=njobs, storage=storage, dynamic=dynamic
+            )
 
-        for output in parallel_objects(
-            self._pre_outputs, njobs=njobs, storage=storage, dynamic=dynamic
-        ):
+        for output in oiter:
             if storage is not None:
                 sto, output = output
 
@@ -335,9 +372,9 @@ class DatasetSeries:
 
             yield next_ret
 
-    def eval(self, tasks, obj=None):
+    def eval(self, tasks, obj=None, backend="mpi", njobs=0):
         return_values = {}
-        for store, ds in self.piter(return_values):
+        for store, ds in self.piter(return_values, backend=backend, njobs=njobs):
             store.result = []
             for task in always_iterable(tasks):
                 try:
@@ -20,6 +20,7 @@ from .derived_field import (
     ValidateProperty,
     ValidateSpatial,
 )
+from .field_dependency_cache import clear_field_dependency_cache
 from .field_detector import FieldDetector
 from .field_info_container import FieldInfoContainer
 from .field_plugin_registry import field_plugins, register_field_plugin
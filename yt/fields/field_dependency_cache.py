@@ -0,0 +1,174 @@
+"""
+Persistent cache of the dependencies of derived fields.
+
+Detecting the dependencies of the derived fields requires calling each of
+them on a :class:`~yt.fields.field_detector.FieldDetector`, which can be
+the slowest part of the setup of a dataset. With the
+``field_dependency_cache`` configuration option, the result of the detection
+is stored in the yt configuration directory, and reused by the datasets with
+the same frontend, on-disk fields, particle types and derived field
+definitions.
+
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from yt.config import config_dir
+from yt.funcs import mylog
+
+_cache_version = 2
+
+_simple_types = (str, bytes, int, float, bool, tuple, type(None))
+
+
+class CachedFieldDependencies:
+    """
+    The dependencies of a derived field, as detected by a
+    :class:`~yt.fields.field_detector.FieldDetector`, restored from the
+    cache.
+    """
+
+    def __init__(self, requested, requested_parameters, requested_derived):
+        self.requested = requested
+        self.requested_parameters = requested_parameters
+        self.requested_derived = requested_derived
+
+
+def field_dependency_cache_dir():
+    return os.path.join(config_dir(), "field_dependencies")
+
+
+def clear_field_dependency_cache():
+    """
+    Remove all the cached field dependencies.
+
+    The cache is keyed by the definitions of the derived fields, so this is
+    only needed if a field function depends on something that is not part
+    of its own code, such as a global variable or another module.
+    """
+    shutil.rmtree(field_dependency_cache_dir(), ignore_errors=True)
+
+
+def _function_signature(func):
+    # Describe a field function by its code and the simple values of its
+    # closure, such as the aliased field name of a TranslationFunc
+    func = getattr(func, "func", func)  # functools.partial
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return type(func).__qualname__
+    ret = [func.__qualname__, code.co_code.hex(), code.co_names]
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(value, _simple_types):
+            ret.append(repr(value))
+        else:
+            ret.append(type(value).__qualname__)
+    return repr(ret)
+
+
+def field_dependency_cache_key(field_info, fields_to_check=None):
+    """
+    Return the key of the cached dependencies of the fields_to_check (or all
+    the fields) of a field info container.
+    """
+    from yt import __version__
+
+    ds = field_info.ds
+    items = [
+        _cache_version,
+        __version__,
+        f"{type(ds).__module__}.{type(ds).__qualname__}",
+        f"{type(field_info).__module__}.{type(field_info).__qualname__}",
+        sorted(map(repr, field_info.field_list)),
+        sorted(ds.particle_types),
+        sorted(ds.particle_types_raw),
+        str(ds.geometry),
+        ds.dimensionality,
+        bool(getattr(ds, "cosmological_simulation", False)),
+        ds.default_fluid_type,
+        None if fields_to_check is None else sorted(map(repr, fields_to_check)),
+    ]
+    for field in sorted(field_info, key=repr):
+        fi = field_info[field]
+        func = _function_signature(fi._function)
+        items.append((repr(field), fi.sampling_type, func))
+    return hashlib.sha256(repr(items).encode("utf-8")).hexdigest()
+
+
+def _as_field(value):
+    # JSON turns the field tuples into lists
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def load_field_dependencies(key):
+    """
+    Return the (dependencies, unavailable, failed) fields cached for key, or
+    None if they have not been cached.
+    """
+    fname = os.path.join(field_dependency_cache_dir(), f"{key}.json")
+    try:
+        with open(fname) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != _cache_version:
+        return None
+    deps = {
+        _as_field(field): CachedFieldDependencies(
+            {_as_field(r) for r in requested},
+            list(requested_parameters),
+            [_as_field(r) for r in requested_derived],
+        )
+        for field, requested, requested_parameters, requested_derived in data[
+            "dependencies"
+        ]
+    }
+    unavailable = [_as_field(field) for field in data["unavailable"]]
+    failed = [_as_field(field) for field in data["failed"]]
+    mylog.debug("Loaded field dependencies from %s", fname)
+    return deps, unavailable, failed
+
+
+def save_field_dependencies(key, deps, unavailable, failed):
+    """
+    Cache the dependencies of the derived fields, and the fields that are
+    unavailable or whose detection failed.
+    """
+    data = {
+        "version": _cache_version,
+        "dependencies": [
+            (
+                field,
+                sorted(fd.requested, key=repr),
+                list(fd.requested_parameters),
+                list(fd.requested_derived),
+            )
+            for field, fd in deps.items()
+        ],
+        "unavailable": unavailable,
+        "failed": failed,
+    }
+    try:
+        content = json.dumps(data)
+    except TypeError as e:
+        mylog.debug("Could not cache field dependencies: %s", e)
+        return
+    dirname = field_dependency_cache_dir()
+    try:
+        os.makedirs(dirname, exist_ok=True)
+        # Write to a temporary file first, so that concurrent processes never
+        # read a partially written file
+        fd, tmpname = tempfile.mkstemp(dir=dirname, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmpname, os.path.join(dirname, f"{key}.json"))
+    except OSError as e:
+        mylog.debug("Could not cache field dependencies: %s", e)
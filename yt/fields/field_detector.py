@@ -80,6 +80,9 @@ class FieldDetector(defaultdict):
         self.index = fake_index()
         self.requested = []
         self.requested_parameters = []
+        # The derived fields evaluated along the way, in the order in which
+        # they are completed
+        self.requested_derived = []
         if not self.flat:
             defaultdict.__init__(
                 self,
@@ -140,7 +143,12 @@ class FieldDetector(defaultdict):
                 for i in nfd.requested_parameters:
                     if i not in self.requested_parameters:
                         self.requested_parameters.append(i)
+                for i in nfd.requested_derived:
+                    if i not in self.requested_derived:
+                        self.requested_derived.append(i)
             if vv is not None:
+                if item not in self.requested_derived:
+                    self.requested_derived.append(item)
                 if not self.flat:
                     self[item] = vv
                 else:
@@ -6,6 +6,12 @@ import numpy as np
 from unyt.exceptions import UnitConversionError
 
 from yt._typing import KnownFieldsT
+from yt.config import ytcfg
+from yt.fields.field_dependency_cache import (
+    field_dependency_cache_key,
+    load_field_dependencies,
+    save_field_dependencies,
+)
 from yt.fields.field_exceptions import NeedsConfiguration
 from yt.funcs import mylog, only_on_root
 from yt.geometry.geometry_handler import is_curvilinear
@@ -56,6 +62,10 @@ class FieldInfoContainer(dict):
 
     def __init__(self, ds, field_list, slice_info=None):
         self._show_field_errors = []
+        # Fields whose dependencies are only detected when they are first used,
+        # and the fields detected since
+        self._lazy_fields = set()
+        self._lazy_detected = {}
         self.ds = ds
         # Now we start setting things up.
         self.field_list = field_list
@@ -385,7 +395,7 @@ class FieldInfoContainer(dict):
         for n in sorted(field_plugins):
             loaded += self.load_plugin(n, ftype)
             only_on_root(mylog.debug, "Loaded %s (%s new fields)", n, len(loaded))
-        self.find_dependencies(loaded)
+        self.find_dependencies(loaded, cache=True)
 
     def load_plugin(self, plugin_name, ftype="gas", skip_check=False):
         if callable(plugin_name):
@@ -397,8 +407,11 @@ class FieldInfoContainer(dict):
         loaded = [n for n, v in set(self.items()).difference(orig)]
         return loaded
 
-    def find_dependencies(self, loaded):
-        deps, unavailable = self.check_derived_fields(loaded)
+    def find_dependencies(self, loaded, cache=False):
+        if self.lazy_field_detection:
+            self.defer_derived_fields(loaded)
+            return loaded, []
+        deps, unavailable = self.check_derived_fields(loaded, cache=cache)
         self.ds.field_dependencies.update(deps)
         # Note we may have duplicated
         dfl = set(self.ds.derived_field_list).union(deps.keys())
@@ -559,8 +572,58 @@ class FieldInfoContainer(dict):
             keys += list(self.fallback.keys())
         return keys
 
-    def check_derived_fields(self, fields_to_check=None):
+    @property
+    def lazy_field_detection(self):
+        return ytcfg.get("yt", "lazy_field_detection") and not hasattr(
+            self.ds, "_field_test_dataset"
+        )
+
+    def defer_derived_fields(self, fields=None):
+        """
+        Defer the detection of the dependencies of fields (by default, of all
+        the fields whose dependencies are not known yet) to the first time
+        they are used.
+        """
+        if fields is None:
+            fields = [f for f in self if f not in self.ds.field_dependencies]
+        self._lazy_fields.update(fields)
 
+    def check_lazy_fields(self, fields=None):
+        """
+        Detect the dependencies of the deferred fields among fields, or of all
+        of them, removing the fields that are not available. Once all of them
+        have been checked, the derived field list of the dataset is updated.
+        """
+        if fields is None:
+            fields = list(self._lazy_fields)
+            complete = True
+        else:
+            fields = [f for f in fields if f in self._lazy_fields]
+            complete = False
+        if not fields and not (complete and self._lazy_detected):
+            return
+        self._lazy_fields.difference_update(fields)
+        fields = [f for f in fields if f in self]
+        if fields:
+            # Deprecated fields should only warn when they are actually used
+            fields_detected = self.ds.fields_detected
+            self.ds.fields_detected = False
+            try:
+                deps, _ = self._detect_dependencies(fields, cache=complete)
+            finally:
+                self.ds.fields_detected = fields_detected
+            self.ds.field_dependencies.update(deps)
+            self._lazy_detected.update(deps)
+            self._set_linear_fields(deps)
+        if complete:
+            detected, self._lazy_detected = self._lazy_detected, {}
+            self._set_derived_field_list(detected, [])
+
+    def check_derived_fields(self, fields_to_check=None, cache=False):
+        deps, unavailable = self._detect_dependencies(fields_to_check, cache=cache)
+        return self._set_derived_field_list(deps, unavailable)
+
+    def _detect_dependencies(self, fields_to_check=None, cache=False):
         # The following exceptions lists were obtained by expanding an
         # all-catching `except Exception`.
         # We define
@@ -588,8 +651,26 @@ class FieldInfoContainer(dict):
             RecursionError,
         )
 
+        # The dependencies may be cached, unless we want the errors raised
+        # during the detection
+        use_cache = (
+            cache
+            and ytcfg.get("yt", "field_dependency_cache")
+            and not self._show_field_errors
+            and not hasattr(self.ds, "_field_test_dataset")
+        )
+        if use_cache:
+            cache_key = field_dependency_cache_key(self, fields_to_check)
+            cached = load_field_dependencies(cache_key)
+            if cached is not None:
+                deps, unavailable, failed = cached
+                for field in unavailable + failed:
+                    self.pop(field, None)
+                return deps, unavailable
+
         deps = {}
         unavailable = []
+        failed = []
         fields_to_check = fields_to_check or list(self.keys())
         for field in fields_to_check:
             fi = self[field]
@@ -611,6 +692,7 @@ class FieldInfoContainer(dict):
                         "Raises %s during field %s detection.", str(type(e)), field
                     )
                 self.pop(field)
+                failed.append(field)
                 continue
             # This next bit checks that we can't somehow generate everything.
             # We also manually update the 'requested' attribute
@@ -623,6 +705,17 @@ class FieldInfoContainer(dict):
             deps[field] = fd
             mylog.debug("Succeeded with %s (needs %s)", field, fd.requested)
 
+        if use_cache:
+            save_field_dependencies(cache_key, deps, unavailable, failed)
+        return deps, unavailable
+
+    def _set_derived_field_list(self, deps, unavailable):
+        if self._lazy_fields:
+            # the derived field list is completed when it is first accessed
+            self._lazy_detected.update(deps)
+            self._set_linear_fields(deps)
+            return deps, unavailable
+
         # now populate the derived field list with results
         # this violates isolation principles and should be refactored
         dfl = set(self.ds.derived_field_list).union(deps.keys())
@@ -655,7 +748,7 @@ class FieldInfoContainer(dict):
         self._set_linear_fields()
         return deps, unavailable
 
-    def _set_linear_fields(self):
+    def _set_linear_fields(self, fields=None):
         """
         Sets which fields use linear as their default scaling in Profiles and
         PhasePlots. Default for all fields is set to log, so this sets which
@@ -667,6 +760,8 @@ class FieldInfoContainer(dict):
         non_log_fields = [
             prefix + coord for prefix in non_log_prefixes for coord in coords
         ]
-        for field in self.ds.derived_field_list:
+        if fields is None:
+            fields = self.ds.derived_field_list
+        for field in fields:
             if field[1] in non_log_fields:
                 self[field].take_log = False
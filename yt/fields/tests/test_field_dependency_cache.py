@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from yt.config import ytcfg
+from yt.fields.api import add_field, clear_field_dependency_cache
+from yt.fields.field_dependency_cache import field_dependency_cache_dir
+from yt.fields.local_fields import local_fields
+from yt.testing import fake_random_ds
+
+
+@pytest.fixture
+def dependency_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    old_value = ytcfg.get("yt", "field_dependency_cache")
+    ytcfg["yt", "field_dependency_cache"] = True
+    yield
+    ytcfg["yt", "field_dependency_cache"] = old_value
+
+
+def _field_state(ds):
+    ds.index
+    deps = {
+        field: sorted(map(repr, fd.requested))
+        for field, fd in ds.field_dependencies.items()
+    }
+    return sorted(map(repr, ds.derived_field_list)), deps
+
+
+def test_field_dependency_cache(dependency_cache):
+    ytcfg["yt", "field_dependency_cache"] = False
+    ref = _field_state(fake_random_ds(16, particles=10))
+    ytcfg["yt", "field_dependency_cache"] = True
+    assert _field_state(fake_random_ds(16, particles=10)) == ref
+    nfiles = len(os.listdir(field_dependency_cache_dir()))
+    assert nfiles > 0
+    # The second dataset is set up from the cache
+    assert _field_state(fake_random_ds(16, particles=10)) == ref
+    assert len(os.listdir(field_dependency_cache_dir())) == nfiles
+
+    clear_field_dependency_cache()
+    assert not os.path.exists(field_dependency_cache_dir())
+
+
+def test_field_dependency_cache_new_field(dependency_cache):
+    fake_random_ds(16).index
+
+    def _double_density(field, data):
+        return 2 * data["gas", "density"]
+
+    # Adding a field invalidates the cached dependencies
+    add_field(
+        ("gas", "double_density"),
+        function=_double_density,
+        sampling_type="cell",
+        units="g/cm**3",
+    )
+    try:
+        ds = fake_random_ds(16)
+        ds.index
+        assert ("gas", "double_density") in ds.derived_field_list
+        fd = ds.field_dependencies["gas", "double_density"]
+        assert ("stream", "density") in fd.requested
+    finally:
+        local_fields.pop(("gas", "double_density"))
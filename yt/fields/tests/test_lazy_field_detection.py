@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from yt.config import ytcfg
+from yt.testing import assert_equal, fake_random_ds
+from yt.utilities.exceptions import YTFieldNotFound
+
+
+@pytest.fixture
+def lazy_detection():
+    old_value = ytcfg.get("yt", "lazy_field_detection")
+    ytcfg["yt", "lazy_field_detection"] = True
+    yield
+    ytcfg["yt", "lazy_field_detection"] = old_value
+
+
+def _make_ds():
+    return fake_random_ds(16, particles=10)
+
+
+def test_lazy_field_detection(lazy_detection):
+    ytcfg["yt", "lazy_field_detection"] = False
+    ds_ref = _make_ds()
+    ad_ref = ds_ref.all_data()
+    ytcfg["yt", "lazy_field_detection"] = True
+    ds = _make_ds()
+    ad = ds.all_data()
+
+    # Nothing has been detected when the dataset is set up
+    ds.index
+    assert len(ds.field_dependencies) < len(ds_ref.field_dependencies)
+    nlazy = len(ds.field_info._lazy_fields)
+    assert nlazy > 0
+
+    for field in [("gas", "kinetic_energy_density"), ("all", "particle_mass")]:
+        assert_equal(ad[field], ad_ref[field])
+        assert field in ds.field_dependencies
+    assert len(ds.field_info._lazy_fields) < nlazy
+    assert not ds.field_info["gas", "velocity_x"].take_log
+
+    # Unavailable fields are only rejected when they are requested
+    assert ("gas", "metallicity") in ds.field_info
+    with pytest.raises(YTFieldNotFound):
+        ad["gas", "metallicity"]
+    assert ("gas", "metallicity") not in ds.field_info
+
+    # Accessing the derived field list completes the detection
+    assert ds.derived_field_list == ds_ref.derived_field_list
+    assert len(ds.field_info._lazy_fields) == 0
+    assert set(ds.field_dependencies) == set(ds_ref.field_dependencies)
+    for field, fd in ds_ref.field_dependencies.items():
+        assert set(ds.field_dependencies[field].requested) == set(fd.requested)
+
+
+def test_lazy_field_detection_add_field(lazy_detection):
+    ds = _make_ds()
+
+    def _double_density(field, data):
+        return 2 * data["gas", "density"]
+
+    ds.add_field(
+        ("gas", "double_density"),
+        function=_double_density,
+        sampling_type="cell",
+        units="g/cm**3",
+    )
+    # Adding a field does not detect all the others
+    assert len(ds.field_info._lazy_fields) > 0
+    ad = ds.all_data()
+    np.testing.assert_allclose(ad["gas", "double_density"], 2 * ad["gas", "density"])
+    assert ("gas", "double_density") in ds.derived_field_list
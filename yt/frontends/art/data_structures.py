@@ -735,10 +735,8 @@ class ARTDomainSubset(OctreeSubset):
         fields = [f for ft, f in ftfields]
         field_idxs = [all_fields.index(f) for f in fields]
         source, tr = {}, {}
-        cell_count = selector.count_oct_cells(self.oct_handler, self.domain_id)
-        levels, cell_inds, file_inds = self.oct_handler.file_index_octs(
-            selector, self.domain_id, cell_count
-        )
+        levels, cell_inds, file_inds = self._file_index_octs(selector)
+        cell_count = levels.size
         for field in fields:
             tr[field] = np.zeros(cell_count, "float64")
         data = _read_root_level(
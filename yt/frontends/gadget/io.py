@@ -46,13 +46,15 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
 
     def _read_particle_coords(self, chunks, ptf):
         for data_file in self._sorted_chunk_iterator(chunks):
-            si, ei = data_file.start, data_file.end
             f = h5py.File(data_file.filename, mode="r")
             # This double-reads
             for ptype in sorted(ptf):
                 if data_file.total_particles[ptype] == 0:
                     continue
-                c = f[f"/{ptype}/{self._coord_name}"][si:ei, :].astype("float64")
+                c = self._get_coordinates(
+                    data_file, ptype, f[f"/{ptype}/{self._coord_name}"]
+                )
+                c = c.astype("float64", copy=False)
                 x, y, z = (np.squeeze(_) for _ in np.split(c, 3, axis=1))
                 if ptype == self.ds._sph_ptypes[0]:
                     pdtype = c.dtype
@@ -72,14 +74,13 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
         for key in f.keys():
             if not key.startswith("PartType"):
                 continue
-            if "Coordinates" not in f[key]:
+            if self._coord_name not in f[key]:
                 continue
             if needed_ptype and key != needed_ptype:
                 continue
-            ds = f[key]["Coordinates"][si:ei, ...]
+            ds = self._read_dataset(f[key][self._coord_name], si, ei)
             dt = ds.dtype.newbyteorder("N")  # Native
-            pos = np.empty(ds.shape, dtype=dt)
-            pos[:] = ds
+            pos = ds.astype(dt, copy=False)
             yield key, pos
         f.close()
 
@@ -144,7 +145,7 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
         else:
             fn = data_file.filename
         with h5py.File(fn, mode="r") as f:
-            ds = f[ptype]["SmoothingLength"][si:ei, ...]
+            ds = self._read_dataset(f[ptype]["SmoothingLength"], si, ei)
             dt = ds.dtype.newbyteorder("N")  # Native
             if position_dtype is not None and dt < position_dtype:
                 # Sometimes positions are stored in double precision
@@ -152,9 +153,7 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                 # In these cases upcast smoothing length to double precision
                 # to avoid ValueErrors when we pass these arrays to Cython.
                 dt = position_dtype
-            hsml = np.empty(ds.shape, dtype=dt)
-            hsml[:] = ds
-            return hsml
+            return ds.astype(dt, copy=False)
 
     def _read_particle_data_file(self, data_file, ptf, selector=None):
         si, ei = data_file.start, data_file.end
@@ -171,7 +170,8 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                 mask_sum = data_file.total_particles[ptype]
                 hsmls = None
             else:
-                coords = g["Coordinates"][si:ei].astype("float64")
+                coords = self._get_coordinates(data_file, ptype, g[self._coord_name])
+                coords = coords.astype("float64", copy=False)
                 if ptype == "PartType0":
                     hsmls = self._get_smoothing_length(
                         data_file, g["Coordinates"].dtype, g["Coordinates"].shape
@@ -192,21 +192,25 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                     data = np.empty(mask_sum, dtype="float64")
                     ind = self._known_ptypes.index(ptype)
                     data[:] = self.ds["Massarr"][ind]
+                elif field == self._coord_name and self._coordinate_cache.max_size > 0:
+                    data = self._get_coordinates(data_file, ptype)[mask, ...]
                 elif field in self._element_names:
                     rfield = "ElementAbundance/" + field
-                    data = g[rfield][si:ei][mask, ...]
+                    data = self._read_dataset(g[rfield], si, ei, mask)
                 elif field.startswith("Metallicity_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["Metallicity"][si:ei, col][mask]
+                    data = self._read_dataset(g["Metallicity"], si, ei, mask, col)
                 elif field.startswith("GFM_Metals_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["GFM_Metals"][si:ei, col][mask]
+                    data = self._read_dataset(g["GFM_Metals"], si, ei, mask, col)
                 elif field.startswith("Chemistry_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["ChemistryAbundances"][si:ei, col][mask]
+                    data = self._read_dataset(
+                        g["ChemistryAbundances"], si, ei, mask, col
+                    )
                 elif field.startswith("PassiveScalars_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["PassiveScalars"][si:ei, col][mask]
+                    data = self._read_dataset(g["PassiveScalars"], si, ei, mask, col)
                 elif field == "smoothing_length":
                     # This is for frontends which do not store
                     # the smoothing length on-disk, so we do not
@@ -220,7 +224,7 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                         ).astype("float64")
                     data = hsmls[mask]
                 else:
-                    data = g[field][si:ei][mask, ...]
+                    data = self._read_dataset(g[field], si, ei, mask)
 
                 data_return[(ptype, field)] = data
 
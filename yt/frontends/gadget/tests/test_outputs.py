@@ -3,11 +3,15 @@ import shutil
 import tempfile
 from collections import OrderedDict
 from itertools import product
+from unittest import mock
+
+import numpy as np
 
 import yt
+from yt.config import ytcfg
 from yt.frontends.gadget.api import GadgetDataset, GadgetHDF5Dataset
 from yt.frontends.gadget.testing import fake_gadget_binary
-from yt.testing import ParticleSelectionComparison, requires_file
+from yt.testing import ParticleSelectionComparison, assert_equal, requires_file
 from yt.utilities.answer_testing.framework import data_dir_load, requires_ds, sph_answer
 
 isothermal_h5 = "IsothermalCollapse/snap_505.hdf5"
@@ -104,6 +108,140 @@ def test_multifile_read():
     assert isinstance(data_dir_load(snap_33_dir), GadgetDataset)
 
 
+@requires_file(snap_33)
+def test_index_nprocs():
+    # The index built with several processes should be identical to the one
+    # built serially
+    tmpdir = tempfile.mkdtemp()
+    old_nprocs = ytcfg.get("yt", "index_nprocs")
+    bitmasks = []
+    try:
+        for nprocs in (1, 2):
+            ytcfg["yt", "index_nprocs"] = nprocs
+            fname = os.path.join(tmpdir, f"snap_033.{nprocs}.ewah")
+            ds = data_dir_load(snap_33, kwargs={"index_filename": fname})
+            ds.index
+            with open(fname, "rb") as f:
+                bitmasks.append(f.read())
+    finally:
+        ytcfg["yt", "index_nprocs"] = old_nprocs
+        shutil.rmtree(tmpdir)
+    assert bitmasks[0] == bitmasks[1]
+
+
+def test_particle_extents_cache():
+    # The extents of the data files are cached in a sidecar file, which is
+    # ignored when the data files change and is optional
+    def check_extents(ds, extents):
+        pos = ds.all_data()["all", "particle_position"].to("code_length").d
+        assert_equal(extents, [[pos.min(axis=0), pos.max(axis=0)]])
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fake_snap = fake_gadget_binary(os.path.join(tmpdir, "fake_gadget_binary"))
+        ds = yt.load(fake_snap)
+        extents = ds.index._get_particle_extents()
+        check_extents(ds, extents)
+        fname = ds.index._extents_filename
+        assert os.path.isfile(fname)
+
+        # A second load reads the cached extents instead of the positions
+        ds = yt.load(fake_snap)
+        io = ds.index.io
+        with mock.patch.object(io, "_yield_coordinates", side_effect=RuntimeError):
+            assert_equal(ds.index._get_particle_extents(), extents)
+
+        # Changing the data files invalidates the cached extents
+        fake_gadget_binary(fake_snap)
+        ds = yt.load(fake_snap)
+        new_extents = ds.index._get_particle_extents()
+        check_extents(ds, new_extents)
+        assert np.any(new_extents != extents)
+
+        # A missing, corrupt or unwritable sidecar falls back to a full scan
+        os.remove(fname)
+        ds = yt.load(fake_snap)
+        assert_equal(ds.index._get_particle_extents(), new_extents)
+        assert os.path.isfile(fname)
+        with open(fname, "wb") as f:
+            f.write(b"not an npz file")
+        ds = yt.load(fake_snap)
+        assert_equal(ds.index._get_particle_extents(), new_extents)
+        os.remove(fname)
+        os.mkdir(fname)
+        ds = yt.load(fake_snap)
+        assert_equal(ds.index._get_particle_extents(), new_extents)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+@requires_file(snap_33)
+def test_index_per_ptype():
+    # Indexing each particle type separately should select the same particles
+    # as the shared index
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, "snap_033.ewah")
+        ds = data_dir_load(snap_33, kwargs={"index_filename": fname})
+        index_order = {"PartType0": (5, 3), "PartType1": (4, 1)}
+        ds_pt = data_dir_load(
+            snap_33, kwargs={"index_filename": fname, "index_order": index_order}
+        )
+        assert set(ds_pt.index.ptype_regions) == set(ds_pt.particle_types_raw)
+        for ptype in ds_pt.index.ptype_regions:
+            assert os.path.exists(f"{fname}.{ptype}")
+        sp = ds.sphere("c", (1, "Mpc"))
+        sp_pt = ds_pt.sphere("c", (1, "Mpc"))
+        for field in [("PartType0", "Density"), ("all", "particle_mass")]:
+            assert_equal(np.sort(sp[field]), np.sort(sp_pt[field]))
+        psc = ParticleSelectionComparison(ds_pt)
+        psc.run_defaults()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+@requires_file(snap_33)
+def test_hdf5_memmap():
+    # Memory-mapping the datasets should not change the data
+    fields = [("PartType0", "Density"), ("all", "particle_velocity")]
+    data = []
+    old_memmap = ytcfg.get("yt", "hdf5_memmap")
+    try:
+        for memmap in (False, True):
+            ytcfg["yt", "hdf5_memmap"] = memmap
+            ds = data_dir_load(snap_33)
+            sp = ds.sphere("c", (1, "Mpc"))
+            data.append([sp[field] for field in fields])
+    finally:
+        ytcfg["yt", "hdf5_memmap"] = old_memmap
+    for ref, val in zip(*data):
+        assert_equal(ref, val)
+
+
+@requires_file(snap_33)
+def test_coordinate_cache():
+    # The cached coordinates should give the same data, and be reused by the
+    # data selection after building the index
+    tmpdir = tempfile.mkdtemp()
+    fields = [("PartType0", "Density"), ("all", "particle_velocity")]
+    data = []
+    old_size = ytcfg.get("yt", "coordinate_cache_size")
+    try:
+        for size in (0, 100):
+            ytcfg["yt", "coordinate_cache_size"] = size
+            fname = os.path.join(tmpdir, f"snap_033.{size}.ewah")
+            ds = data_dir_load(snap_33, kwargs={"index_filename": fname})
+            sp = ds.sphere("c", (1, "Mpc"))
+            data.append([sp[field] for field in fields])
+            cache = ds.index.io._coordinate_cache
+            assert (cache.hits > 0) == (size > 0)
+    finally:
+        ytcfg["yt", "coordinate_cache_size"] = old_size
+        shutil.rmtree(tmpdir)
+    for ref, val in zip(*data):
+        assert_equal(ref, val)
+
+
 @requires_file(snap_33)
 def test_particle_subselection():
     # This checks that we correctly subselect from a dataset, first by making
@@ -29,7 +29,8 @@ from .definitions import (
 )
 from .field_handlers import get_field_handlers
 from .fields import _X, RAMSESFieldInfo
-from .hilbert import get_cpu_list
+from .hilbert import get_cpu_cells, get_cpu_list
+from .index_cache import RAMSESIndexCache
 from .io_utils import fill_hydro, read_amr
 from .particle_handlers import get_particle_handlers
 
@@ -143,12 +144,13 @@ class RAMSESFileSanitizer:
 
 
 class RAMSESDomainFile:
-    _last_mask = None
-    _last_selector_id = None
-
-    def __init__(self, ds, domain_id):
+    def __init__(
+        self, ds, domain_id, index_cache=None, keep_oct_records=False, lazy=False
+    ):
         self.ds = ds
         self.domain_id = domain_id
+        self._index_cache = index_cache
+        self._keep_oct_records = keep_oct_records
 
         num = os.path.basename(ds.parameter_filename).split(".")[0].split("_")[1]
         rootdir = ds.root_folder
@@ -168,7 +170,10 @@ class RAMSESDomainFile:
         for t in ["grav", "amr"]:
             setattr(self, f"{t}_fn", basename % t)
         self._part_file_descriptor = part_file_descriptor
-        self._read_amr_header()
+        if index_cache is None:
+            self._read_amr_header()
+        else:
+            self._load_amr_header()
 
         # Autodetect field files
         field_handlers = [FH(self) for FH in get_field_handlers() if FH.any_exist(ds)]
@@ -176,6 +181,10 @@ class RAMSESDomainFile:
         for fh in field_handlers:
             mylog.debug("Detected fluid type %s in domain_id=%s", fh.ftype, domain_id)
             fh.detect_fields(ds)
+            if index_cache is not None:
+                cached = index_cache.field_offsets(domain_id, fh.ftype)
+                if cached is not None:
+                    fh._offset, fh._level_count = cached
             # self._add_ftype(fh.ftype)
 
         # Autodetect particle files
@@ -190,15 +199,30 @@ class RAMSESDomainFile:
             ph.read_header()
             # self._add_ptype(ph.ptype)
 
-        # Load the AMR structure
-        self._read_amr()
+        # Load the AMR structure, unless this is deferred until the oct
+        # handler is first accessed
+        if not lazy:
+            self._load_oct_handler()
 
     _hydro_offset = None
     _level_count = None
+    _oct_handler = None
 
     def __repr__(self):
         return "RAMSESDomainFile: %i" % self.domain_id
 
+    @property
+    def oct_handler(self):
+        if self._oct_handler is None:
+            self._load_oct_handler()
+        return self._oct_handler
+
+    def _load_oct_handler(self):
+        if self._index_cache is None:
+            self._read_amr()
+        else:
+            self._load_amr()
+
     @property
     def level_count(self):
         lvl_count = None
@@ -256,10 +280,29 @@ class RAMSESDomainFile:
             force_max_level, self.amr_header["nlevelmax"]
         )
         self.amr_offset = f.tell()
-        self.local_oct_count = hvals["numbl"][
-            self.ds.min_level :, self.domain_id - 1
-        ].sum()
-        self.total_oct_count = hvals["numbl"][self.ds.min_level :, :].sum(axis=0)
+        self._set_oct_counts()
+
+    def _load_amr_header(self):
+        # Same as _read_amr_header, using the values stored in the index cache
+        self.amr_header = self._index_cache.amr_header
+        self.ngridbound = self._index_cache.ngridbound(self.domain_id)
+        self.max_level = self._index_cache.max_level(self.domain_id)
+        self.amr_offset = None
+        self._set_oct_counts()
+
+    def _set_oct_counts(self):
+        numbl = self.amr_header["numbl"]
+        self.local_oct_count = numbl[self.ds.min_level :, self.domain_id - 1].sum()
+        self.total_oct_count = numbl[self.ds.min_level :, :].sum(axis=0)
+
+    def _allocate_oct_handler(self):
+        self._oct_handler = RAMSESOctreeContainer(
+            self.ds.domain_dimensions / 2,
+            self.ds.domain_left_edge,
+            self.ds.domain_right_edge,
+        )
+        root_nodes = self.amr_header["numbl"][self.ds.min_level, :].sum()
+        self._oct_handler.allocate_domains(self.total_oct_count, root_nodes)
 
     def _read_amr(self):
         """Open the oct file, read in octs level-by-level.
@@ -268,13 +311,7 @@ class RAMSESDomainFile:
         The most important is finding all the information to feed
         oct_handler.add
         """
-        self.oct_handler = RAMSESOctreeContainer(
-            self.ds.domain_dimensions / 2,
-            self.ds.domain_left_edge,
-            self.ds.domain_right_edge,
-        )
-        root_nodes = self.amr_header["numbl"][self.ds.min_level, :].sum()
-        self.oct_handler.allocate_domains(self.total_oct_count, root_nodes)
+        self._allocate_oct_handler()
         mylog.debug(
             "Reading domain AMR % 4i (%0.3e, %0.3e)",
             self.domain_id,
@@ -286,8 +323,17 @@ class RAMSESDomainFile:
         f.seek(self.amr_offset)
 
         min_level = self.ds.min_level
+        if self._keep_oct_records:
+            self._oct_records = []
+        else:
+            self._oct_records = None
         max_level = read_amr(
-            f, self.amr_header, self.ngridbound, min_level, self.oct_handler
+            f,
+            self.amr_header,
+            self.ngridbound,
+            min_level,
+            self.oct_handler,
+            self._oct_records,
         )
 
         self.max_level = max_level
@@ -296,9 +342,33 @@ class RAMSESDomainFile:
         # Close AMR file
         f.close()
 
+    def _load_amr(self):
+        """Rebuild the oct tree from the positions stored in the index cache.
+        This is equivalent to _read_amr, but does not touch the AMR file."""
+        self._allocate_oct_handler()
+        mylog.debug(
+            "Loading domain AMR % 4i from index cache (%0.3e, %0.3e)",
+            self.domain_id,
+            self.total_oct_count.sum(),
+            self.ngridbound.sum(),
+        )
+        for icpu, level, pos in self._index_cache.oct_records(self.domain_id):
+            self.oct_handler.add(icpu + 1, level, pos, count_boundary=1)
+
+        self.oct_handler.finalize()
+
     def included(self, selector):
         if getattr(selector, "domain_id", None) is not None:
             return selector.domain_id == self.domain_id
+        # First match the selector against the cells of the Hilbert curve
+        # enclosing the domain, so that the oct tree is only walked (and,
+        # in lazy mode, read) for the domains that may intersect with it.
+        cells = self.ds.index._get_hilbert_cells(self.domain_id)
+        if cells is not None:
+            left_edges, right_edges = cells
+            levels = np.full((left_edges.shape[0], 1), selector.min_level, "int32")
+            if not selector.select_grids(left_edges, right_edges, levels).any():
+                return False
         domain_ids = self.oct_handler.domain_identify(selector)
         return self.domain_id in domain_ids
 
@@ -347,11 +417,8 @@ class RAMSESDomainSubset(OctreeSubset):
         all_fields = [f for ft, f in file_handler.field_list]
         fields = [f for ft, f in fields]
         data = {}
-        cell_count = selector.count_oct_cells(self.oct_handler, self.domain_id)
-
-        levels, cell_inds, file_inds = self.oct_handler.file_index_octs(
-            selector, self.domain_id, cell_count
-        )
+        levels, cell_inds, file_inds = self._file_index_octs(selector)
+        cell_count = levels.size
 
         # Initializing data container
         for field in fields:
@@ -524,18 +591,70 @@ class RAMSESIndex(OctreeIndex):
         else:
             cpu_list = range(self.dataset["ncpu"])
 
-        self.domains = [RAMSESDomainFile(self.dataset, i + 1) for i in cpu_list]
+        index_cache = self._load_index_cache()
+        lazy = self.ds._lazy_index
+        # The cache can only be written once all the domains have been read
+        keep_oct_records = (
+            index_cache is None and self._cache_filename is not None and not lazy
+        )
+        self.domains = [
+            RAMSESDomainFile(
+                self.dataset,
+                i + 1,
+                index_cache=index_cache,
+                keep_oct_records=keep_oct_records,
+                lazy=lazy,
+            )
+            for i in cpu_list
+        ]
+        if keep_oct_records:
+            self._save_index_cache()
+
         total_octs = sum(
             dom.local_oct_count for dom in self.domains  # + dom.ngridbound.sum()
         )
         force_max_level, convention = self.ds._force_max_level
         if convention == "yt":
             force_max_level += self.ds.min_level + 1
-        self.max_level = min(
-            force_max_level, max(dom.max_level for dom in self.domains)
-        )
+        if lazy and index_cache is None:
+            # The AMR structure has not been read yet, so we use the maximum
+            # level allowed by the simulation as an upper bound
+            dom_max_level = self.ds.max_level
+        else:
+            dom_max_level = max(dom.max_level for dom in self.domains)
+        self.max_level = min(force_max_level, dom_max_level)
         self.num_grids = total_octs
 
+    @property
+    def _cache_filename(self):
+        # The cache cannot be used when only a subset of the domains is read
+        if not self.ds._cache_index or self.ds._bbox is not None:
+            return None
+        return f"{self.ds.parameter_filename}.amr_index"
+
+    def _load_index_cache(self):
+        fname = self._cache_filename
+        if fname is None:
+            return None
+        try:
+            return RAMSESIndexCache.load(fname, self.dataset)
+        except (OSError, ValueError, KeyError) as err:
+            mylog.debug("Could not load index cache: %s", err)
+            return None
+
+    def _save_index_cache(self):
+        fname = self._cache_filename
+        if not os.access(os.path.dirname(fname), os.W_OK):
+            return
+        # Sometimes os mis-reports whether a directory is writable,
+        # So pass if writing the cache fails.
+        try:
+            RAMSESIndexCache.save(fname, self.dataset, self.domains)
+        except OSError:
+            pass
+        for dom in self.domains:
+            dom._oct_records = None
+
     def _detect_output_fields(self):
         dsl = set()
 
@@ -558,6 +677,34 @@ class RAMSESIndex(OctreeIndex):
 
         self.field_list = self.particle_field_list + self.fluid_field_list
 
+    _hilbert_cells = None
+
+    def _get_hilbert_cells(self, domain_id):
+        """
+        Return the left and right edges of the cells of the Hilbert curve
+        enclosing a domain, or None if the dataset does not use Hilbert
+        ordering.
+
+        The cells are at most at the coarsest level of the simulation, so that
+        each leaf cell of the domain is contained in one of them.
+        """
+        ds = self.dataset
+        if not ds.hilbert_indices:
+            return None
+        if self._hilbert_cells is None:
+            # Enough cells to resolve the shape of the domains, while keeping
+            # the cost of matching a selector low
+            bit_length = int(np.ceil(np.log2(ds["ncpu"]) / 3)) + 3
+            bit_length = min(bit_length, ds.parameters["levelmin"], 6)
+            dx = 1 / 2**bit_length
+            dw = ds.domain_width.to("code_length").d
+            dle = ds.domain_left_edge.to("code_length").d
+            self._hilbert_cells = [
+                (dle + cells * dx * dw, dle + (cells + 1) * dx * dw)
+                for cells in get_cpu_cells(ds, bit_length)
+            ]
+        return self._hilbert_cells[domain_id - 1]
+
     def _identify_base_chunk(self, dobj):
         if getattr(dobj, "_chunk_info", None) is None:
             domains = [dom for dom in self.domains if dom.included(dobj.selector)]
@@ -686,6 +833,8 @@ class RAMSESDataset(Dataset):
         max_level=None,
         max_level_convention=None,
         default_species_fields=None,
+        cache_index=False,
+        lazy_index=False,
     ):
         # Here we want to initiate a traceback, if the reader is not built.
         if isinstance(fields, str):
@@ -702,6 +851,15 @@ class RAMSESDataset(Dataset):
         cosmological:
         If set to None, automatically detect cosmological simulation.
         If a boolean, force its value.
+
+        cache_index:
+        If True, store the oct tree and the field offsets in a sidecar file
+        (info_XXXXX.txt.amr_index) and reuse it on subsequent loads instead
+        of parsing the AMR files.
+
+        lazy_index:
+        If True, only read the AMR structure of a domain the first time it
+        intersects with a data object.
         """
 
         self._fields_in_file = fields
@@ -710,6 +868,8 @@ class RAMSESDataset(Dataset):
         self._extra_particle_fields = extra_particle_fields
         self.force_cosmological = cosmological
         self._bbox = bbox
+        self._cache_index = cache_index
+        self._lazy_index = lazy_index
 
         self._force_max_level = self._sanitize_max_level(
             max_level, max_level_convention
@@ -1,262 +1,328 @@
 import numpy as np
 
+# State diagram of the 3D Hilbert curve used by RAMSES, indexed by
+# (input digit, 0 for the next state or 1 for the output digit, current state)
+_STATE_DIAGRAM = (
+    np.array(
+        [
+            1,
+            2,
+            3,
+            2,
+            4,
+            5,
+            3,
+            5,
+            0,
+            1,
+            3,
+            2,
+            7,
+            6,
+            4,
+            5,
+            2,
+            6,
+            0,
+            7,
+            8,
+            8,
+            0,
+            7,
+            0,
+            7,
+            1,
+            6,
+            3,
+            4,
+            2,
+            5,
+            0,
+            9,
+            10,
+            9,
+            1,
+            1,
+            11,
+            11,
+            0,
+            3,
+            7,
+            4,
+            1,
+            2,
+            6,
+            5,
+            6,
+            0,
+            6,
+            11,
+            9,
+            0,
+            9,
+            8,
+            2,
+            3,
+            1,
+            0,
+            5,
+            4,
+            6,
+            7,
+            11,
+            11,
+            0,
+            7,
+            5,
+            9,
+            0,
+            7,
+            4,
+            3,
+            5,
+            2,
+            7,
+            0,
+            6,
+            1,
+            4,
+            4,
+            8,
+            8,
+            0,
+            6,
+            10,
+            6,
+            6,
+            5,
+            1,
+            2,
+            7,
+            4,
+            0,
+            3,
+            5,
+            7,
+            5,
+            3,
+            1,
+            1,
+            11,
+            11,
+            4,
+            7,
+            3,
+            0,
+            5,
+            6,
+            2,
+            1,
+            6,
+            1,
+            6,
+            10,
+            9,
+            4,
+            9,
+            10,
+            6,
+            7,
+            5,
+            4,
+            1,
+            0,
+            2,
+            3,
+            10,
+            3,
+            1,
+            1,
+            10,
+            3,
+            5,
+            9,
+            2,
+            5,
+            3,
+            4,
+            1,
+            6,
+            0,
+            7,
+            4,
+            4,
+            8,
+            8,
+            2,
+            7,
+            2,
+            3,
+            2,
+            1,
+            5,
+            6,
+            3,
+            0,
+            4,
+            7,
+            7,
+            2,
+            11,
+            2,
+            7,
+            5,
+            8,
+            5,
+            4,
+            5,
+            7,
+            6,
+            3,
+            2,
+            0,
+            1,
+            10,
+            3,
+            2,
+            6,
+            10,
+            3,
+            4,
+            4,
+            6,
+            1,
+            7,
+            0,
+            5,
+            2,
+            4,
+            3,
+        ]
+    )
+    .reshape(12, 2, 8)
+    .T
+)
+
+# Maximum number of bits per dimension such that the keys fit in an int64
+_MAX_BIT_LENGTH = 20
+
 
 def hilbert3d(X, bit_length):
     """Compute the order using Hilbert indexing.
 
     Arguments
     ---------
-    X : (N, ndim) float array
+    X : (N, ndim) integer array
       The positions
-    bit_length : integer
-      The bit_length for the indexing.
+    bit_length : integer or (N,) integer array
+      The bit_length for the indexing. Different bit lengths can be used for
+      each position.
     """
-    X = np.atleast_2d(X)
-    state_diagram = (
-        np.array(
-            [
-                1,
-                2,
-                3,
-                2,
-                4,
-                5,
-                3,
-                5,
-                0,
-                1,
-                3,
-                2,
-                7,
-                6,
-                4,
-                5,
-                2,
-                6,
-                0,
-                7,
-                8,
-                8,
-                0,
-                7,
-                0,
-                7,
-                1,
-                6,
-                3,
-                4,
-                2,
-                5,
-                0,
-                9,
-                10,
-                9,
-                1,
-                1,
-                11,
-                11,
-                0,
-                3,
-                7,
-                4,
-                1,
-                2,
-                6,
-                5,
-                6,
-                0,
-                6,
-                11,
-                9,
-                0,
-                9,
-                8,
-                2,
-                3,
-                1,
-                0,
-                5,
-                4,
-                6,
-                7,
-                11,
-                11,
-                0,
-                7,
-                5,
-                9,
-                0,
-                7,
-                4,
-                3,
-                5,
-                2,
-                7,
-                0,
-                6,
-                1,
-                4,
-                4,
-                8,
-                8,
-                0,
-                6,
-                10,
-                6,
-                6,
-                5,
-                1,
-                2,
-                7,
-                4,
-                0,
-                3,
-                5,
-                7,
-                5,
-                3,
-                1,
-                1,
-                11,
-                11,
-                4,
-                7,
-                3,
-                0,
-                5,
-                6,
-                2,
-                1,
-                6,
-                1,
-                6,
-                10,
-                9,
-                4,
-                9,
-                10,
-                6,
-                7,
-                5,
-                4,
-                1,
-                0,
-                2,
-                3,
-                10,
-                3,
-                1,
-                1,
-                10,
-                3,
-                5,
-                9,
-                2,
-                5,
-                3,
-                4,
-                1,
-                6,
-                0,
-                7,
-                4,
-                4,
-                8,
-                8,
-                2,
-                7,
-                2,
-                3,
-                2,
-                1,
-                5,
-                6,
-                3,
-                0,
-                4,
-                7,
-                7,
-                2,
-                11,
-                2,
-                7,
-                5,
-                8,
-                5,
-                4,
-                5,
-                7,
-                6,
-                3,
-                2,
-                0,
-                1,
-                10,
-                3,
-                2,
-                6,
-                10,
-                3,
-                4,
-                4,
-                6,
-                1,
-                7,
-                0,
-                5,
-                2,
-                4,
-                3,
-            ]
+    X = np.atleast_2d(X).astype(np.int64)
+    npoint = X.shape[0]
+    bit_length = np.broadcast_to(np.asarray(bit_length, dtype=np.int64), (npoint,))
+
+    order = np.zeros(npoint, dtype=np.int64)
+    cstate = np.zeros(npoint, dtype=np.int64)
+    if npoint == 0:
+        return order.astype(np.float64)
+
+    # Walk the bits from the most significant one, for all positions at once.
+    # The bits above the bit length of a position are ignored.
+    for i in range(bit_length.max() - 1, -1, -1):
+        active = i < bit_length
+        # Interleave bits
+        sdigit = (
+            4 * ((X[:, 0] >> i) & 1) + 2 * ((X[:, 1] >> i) & 1) + ((X[:, 2] >> i) & 1)
         )
-        .reshape(12, 2, 8)
-        .T
-    )
+        # Build Hilbert ordering using state diagram
+        nstate = _STATE_DIAGRAM[sdigit, 0, cstate]
+        hdigit = _STATE_DIAGRAM[sdigit, 1, cstate]
+        order = np.where(active, (order << 3) | hdigit, order)
+        cstate = np.where(active, nstate, cstate)
 
-    x_bit_mask, y_bit_mask, z_bit_mask = (
-        np.zeros(bit_length, dtype=bool) for _ in range(3)
-    )
-    i_bit_mask = np.zeros(3 * bit_length, dtype=bool)
+    return order.astype(np.float64)
 
-    npoint = X.shape[0]
-    order = np.zeros(npoint)
-
-    # Convert positions to binary
-    for ip in range(npoint):
-        for i in range(bit_length):
-            mask = 0b01 << i
-            x_bit_mask[i] = X[ip, 0] & mask
-            y_bit_mask[i] = X[ip, 1] & mask
-            z_bit_mask[i] = X[ip, 2] & mask
-
-        for i in range(bit_length):
-            # Interleave bits
-            i_bit_mask[3 * i + 2] = x_bit_mask[i]
-            i_bit_mask[3 * i + 1] = y_bit_mask[i]
-            i_bit_mask[3 * i] = z_bit_mask[i]
 
-        # Build Hilbert ordering using state diagram
-        cstate = 0
-        for i in range(bit_length - 1, -1, -1):
-            sdigit = (
-                4 * i_bit_mask[3 * i + 2]
-                + 2 * i_bit_mask[3 * i + 1]
-                + 1 * i_bit_mask[3 * i]
-            )
-            nstate = state_diagram[sdigit, 0, cstate]
-            hdigit = state_diagram[sdigit, 1, cstate]
+def _get_bound_keys(ds):
+    # Hilbert key at the boundary between each domain, such that the keys of
+    # CPU i lie in [bound_key[i], bound_key[i+1])
+    ncpu = ds.parameters["ncpu"]
+    bound_key = np.zeros(ncpu + 1)
+    for icpu in range(1, ncpu + 1):
+        bound_key[icpu - 1], bound_key[icpu] = ds.hilbert_indices[icpu]
+    return bound_key
+
+
+def get_cpu_mask(ds, left_edges, right_edges):
+    """
+    Return which CPUs intersect with each of a set of bounding boxes. This
+    is the batched version of :func:`get_cpu_list`.
+
+    Parameters
+    ----------
+    ds : Dataset
+      The dataset containing the information
+    left_edges, right_edges : (N, ndim) float arrays
+      The corners of the bounding boxes. They should be between 0 and 1.
+
+    Returns
+    -------
+    mask : (N, ncpu) boolean array
+      mask[i, j] is True if the i-th box intersects with the (0-indexed) CPU j.
+
+    Examples
+    --------
+    The bounding boxes of spheres can be passed directly:
+
+    >>> mask = get_cpu_mask(ds, centers - radii[:, None], centers + radii[:, None])
+    """
+    left_edges = np.atleast_2d(left_edges).astype(np.float64)
+    right_edges = np.atleast_2d(right_edges).astype(np.float64)
+    if left_edges.shape[1] != 3:
+        raise NotImplementedError("This function is only implemented in 3D.")
 
-            i_bit_mask[3 * i + 2] = hdigit & 0b100
-            i_bit_mask[3 * i + 1] = hdigit & 0b010
-            i_bit_mask[3 * i] = hdigit & 0b001
+    levelmax = ds.parameters["levelmax"]
+    ncpu = ds.parameters["ncpu"]
+    ndim = ds.parameters["ndim"]
+
+    # Find the coarsest level whose cells are smaller than each box, i.e.
+    # the smallest lmin >= 1 such that 0.5**lmin < dmax
+    dmax = (right_edges - left_edges).max(axis=1)
+    with np.errstate(divide="ignore"):
+        lmin = np.floor(-np.log2(dmax)) + 1
+    # Cap the level so that the keys fit in 64 bits (this also handles
+    # empty boxes)
+    lmin = np.clip(lmin, 1, _MAX_BIT_LENGTH + 1).astype(np.int64)
+    # Correct for rounding errors in log2
+    lmin = np.where((lmin > 1) & (0.5 ** (lmin - 1) < dmax), lmin - 1, lmin)
+    lmin = np.where((lmin <= _MAX_BIT_LENGTH) & (0.5**lmin >= dmax), lmin + 1, lmin)
 
-            cstate = nstate
+    bit_length = lmin - 1
+    maxdom = 2**bit_length
+
+    # The 8 cells at level lmin around the left corner of each box cover the
+    # box entirely
+    imin = (left_edges * maxdom[:, None]).astype(np.int64)
+    corners = np.array(
+        [[i & 1, (i >> 1) & 1, (i >> 2) & 1] for i in range(8)], dtype=np.int64
+    )
+    idom = (imin[:, None, :] + corners[None, :, :]).reshape(-1, 3)
+    order_min = hilbert3d(idom, np.repeat(bit_length, 8)).reshape(-1, 8)
 
-        # Compute ordering
-        for i in range(3 * bit_length):
-            order[ip] = order[ip] + i_bit_mask[i] * 2**i
+    dkey = ((2.0 ** (levelmax + 1) / maxdom) ** ndim)[:, None]
+    bounding_min = order_min * dkey
+    bounding_max = (order_min + 1) * dkey
 
-    return order
+    bound_key = _get_bound_keys(ds)
+    cpu_min = np.searchsorted(bound_key, bounding_min, side="right") - 1
+    cpu_min[(cpu_min < 0) | (cpu_min >= ncpu)] = 0
+    cpu_max = np.searchsorted(bound_key, bounding_max, side="left")
+    cpu_max[(cpu_max < 1) | (cpu_max > ncpu)] = 0
+
+    icpu = np.arange(ncpu)
+    mask = (icpu >= cpu_min[..., None]) & (icpu < cpu_max[..., None])
+    return mask.any(axis=1)
 
 
 def get_cpu_list(ds, X):
@@ -275,91 +341,53 @@ def get_cpu_list(ds, X):
     if X.shape[1] != 3:
         raise NotImplementedError("This function is only implemented in 3D.")
 
-    levelmax = ds.parameters["levelmax"]
-    ncpu = ds.parameters["ncpu"]
-    ndim = ds.parameters["ndim"]
+    mask = get_cpu_mask(ds, X.min(axis=0), X.max(axis=0))[0]
+    return np.flatnonzero(mask).tolist()
 
-    xmin, ymin, zmin = X.min(axis=0)
-    xmax, ymax, zmax = X.max(axis=0)
 
-    dmax = max(xmax - xmin, ymax - ymin, zmax - zmin)
-    ilevel = 0
-    deltax = dmax * 2
+def get_cpu_cells(ds, bit_length):
+    """
+    Return the cells of the Hilbert curve at a given level covering each CPU.
 
-    while deltax >= dmax:
-        ilevel += 1
-        deltax = 0.5**ilevel
+    Since each CPU owns a contiguous range of Hilbert keys, the cells at
+    a level coarser than the coarsest AMR level whose keys intersect this
+    range enclose all the leaf cells of the CPU.
 
-    lmin = ilevel
-    bit_length = lmin - 1
-    maxdom = 2**bit_length
+    Parameters
+    ----------
+    ds : Dataset
+      The dataset containing the information
+    bit_length : integer
+      The level of the cells, there are 2**bit_length cells in each
+      direction.
 
-    imin, imax, jmin, jmax, kmin, kmax = 0, 0, 0, 0, 0, 0
-    if bit_length > 0:
-        imin = int(xmin * maxdom)
-        imax = imin + 1
-        jmin = int(ymin * maxdom)
-        jmax = jmin + 1
-        kmin = int(zmin * maxdom)
-        kmax = kmin + 1
-
-    dkey = (2 ** (levelmax + 1) / maxdom) ** ndim
-    ndom = 1
-    if bit_length > 0:
-        ndom = 8
-
-    idom, jdom, kdom = (np.zeros(8, dtype="int64") for _ in range(3))
-
-    idom[0], idom[1] = imin, imax
-    idom[2], idom[3] = imin, imax
-    idom[4], idom[5] = imin, imax
-    idom[6], idom[7] = imin, imax
-
-    jdom[0], jdom[1] = jmin, jmin
-    jdom[2], jdom[3] = jmax, jmax
-    jdom[4], jdom[5] = jmin, jmin
-    jdom[6], jdom[7] = jmax, jmax
-
-    kdom[0], kdom[1] = kmin, kmin
-    kdom[2], kdom[3] = kmin, kmin
-    kdom[4], kdom[5] = kmax, kmax
-    kdom[6], kdom[7] = kmax, kmax
-
-    bounding_min, bounding_max = np.zeros(ndom), np.zeros(ndom)
-    for i in range(ndom):
-        if bit_length > 0:
-            order_min = hilbert3d([idom[i], jdom[i], kdom[i]], bit_length)
-        else:
-            order_min = 0
-        bounding_min[i] = (order_min) * dkey
-        bounding_max[i] = (order_min + 1) * dkey
-
-    bound_key = {}
-    for icpu in range(1, ncpu + 1):
-        bound_key[icpu - 1], bound_key[icpu] = ds.hilbert_indices[icpu]
+    Returns
+    -------
+    cells : list of (M, ndim) integer arrays
+      The integer coordinates of the cells of each (0-indexed) CPU.
+    """
+    levelmax = ds.parameters["levelmax"]
+    ncpu = ds.parameters["ncpu"]
+    ndim = ds.parameters["ndim"]
 
-    cpu_min, cpu_max = (np.zeros(ncpu + 1, dtype="int64") for _ in range(2))
-    for icpu in range(1, ncpu + 1):
-        for i in range(ndom):
-            if (
-                bound_key[icpu - 1] <= bounding_min[i]
-                and bound_key[icpu] > bounding_min[i]
-            ):
-                cpu_min[i] = icpu - 1
-            if (
-                bound_key[icpu - 1] < bounding_max[i]
-                and bound_key[icpu] >= bounding_max[i]
-            ):
-                cpu_max[i] = icpu
-
-    ncpu_read = 0
-    cpu_list = []
-    cpu_read = np.zeros(ncpu, dtype="bool")
-    for i in range(ndom):
-        for j in range(cpu_min[i], cpu_max[i]):
-            if not cpu_read[j]:
-                ncpu_read += 1
-                cpu_list.append(j)
-                cpu_read[j] = True
-
-    return sorted(cpu_list)
+    n = 2**bit_length
+    ii = np.arange(n, dtype=np.int64)
+    X = np.stack(np.meshgrid(ii, ii, ii, indexing="ij"), axis=-1).reshape(-1, 3)
+    order = hilbert3d(X, bit_length)
+
+    dkey = (2.0 ** (levelmax + 1) / n) ** ndim
+    bound_key = _get_bound_keys(ds)
+    cpu_min = np.searchsorted(bound_key, order * dkey, side="right") - 1
+    cpu_max = np.searchsorted(bound_key, (order + 1) * dkey, side="left") - 1
+    cpu_min = np.clip(cpu_min, 0, ncpu - 1)
+    cpu_max = np.clip(cpu_max, cpu_min, ncpu - 1)
+
+    # Cells at the boundary between CPUs belong to all of them
+    count = cpu_max - cpu_min + 1
+    icell = np.repeat(np.arange(X.shape[0]), count)
+    icpu = np.repeat(cpu_min, count) + (
+        np.arange(icell.size) - np.repeat(np.cumsum(count) - count, count)
+    )
+    isort = np.argsort(icpu, kind="stable")
+    splits = np.searchsorted(icpu[isort], np.arange(1, ncpu))
+    return [X[icell[ind]] for ind in np.split(isort, splits)]
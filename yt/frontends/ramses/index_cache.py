@@ -0,0 +1,229 @@
+"""
+Persistent cache of the RAMSES AMR structure.
+
+The cache is stored as a sidecar file next to the ``info_XXXXX.txt`` file. It
+is made of a sequence of ``.npy`` records: the first one contains JSON-encoded
+metadata, the following ones contain the arrays required to rebuild the oct
+containers of each domain without parsing the ``amr_XXXXX.outYYYYY`` files
+again. The arrays are memory-mapped on load, so that only the domains that
+are actually built are read from disk.
+
+"""
+import json
+import os
+
+import numpy as np
+
+from yt.funcs import mylog
+from yt.utilities.lib.fnv_hash import fnv_hash
+
+_index_cache_version = 1
+
+
+def _to_builtin(val):
+    # Convert numpy objects so that they can be serialized to JSON
+    if isinstance(val, np.ndarray):
+        return val.tolist()
+    elif isinstance(val, np.generic):
+        return val.item()
+    elif isinstance(val, bytes):
+        return val.decode()
+    return val
+
+
+def _compute_hash(ds):
+    # The hash is computed from the content and the modification time of the
+    # info file, as well as from the parameters that modify the oct tree.
+    ret = bytearray()
+    with open(ds.parameter_filename, "rb") as f:
+        ret.extend(f.read())
+    ret.extend(str(os.path.getmtime(ds.parameter_filename)).encode("utf-8"))
+    ret.extend(str(ds._force_max_level).encode("utf-8"))
+    return int(fnv_hash(ret))
+
+
+class RAMSESIndexCache:
+    """
+    Read-only view of a RAMSES index cache file.
+
+    Use :meth:`RAMSESIndexCache.load` to open an existing file and
+    :meth:`RAMSESIndexCache.save` to create one from a list of
+    :class:`~yt.frontends.ramses.data_structures.RAMSESDomainFile`.
+    """
+
+    def __init__(self, filename, meta, records):
+        self.filename = filename
+        self.meta = meta
+        self._records = records
+        self._domain_index = {
+            int(domain_id): i for i, domain_id in enumerate(records["domain_ids"])
+        }
+
+    def __contains__(self, domain_id):
+        return domain_id in self._domain_index
+
+    @property
+    def amr_header(self):
+        hvals = dict(self.meta["amr_header"])
+        hvals["numbl"] = np.array(self._records["numbl"])
+        return hvals
+
+    def ngridbound(self, domain_id):
+        i = self._domain_index[domain_id]
+        return np.array(self._records["ngridbound"][i])
+
+    def max_level(self, domain_id):
+        i = self._domain_index[domain_id]
+        return int(self._records["max_level"][i])
+
+    def oct_records(self, domain_id):
+        """Yield the (icpu, level, positions) of each group of octs of a domain,
+        in the order they were originally read."""
+        i = self._domain_index[domain_id]
+        gstart, gend = self._records["group_ptr"][i : i + 2]
+        groups = self._records["groups"][gstart:gend]
+        pos = self._records["positions"]
+        pstart = self._records["position_ptr"][i]
+        for icpu, level, count in groups:
+            yield icpu, level, pos[pstart : pstart + count]
+            pstart += count
+
+    def field_offsets(self, domain_id, ftype):
+        """Return the (offset, level_count) arrays of a field handler, or
+        None if they have not been cached."""
+        if ftype not in self.meta["field_types"]:
+            return None
+        i = self._domain_index[domain_id]
+        ptr = self._records[f"{ftype}_ptr"]
+        entries = self._records[ftype][ptr[i] : ptr[i + 1]]
+        shape = tuple(self.meta["field_types"][ftype])
+        offset = np.full(shape, -1, dtype=np.int64)
+        level_count = np.zeros(shape, dtype=np.int64)
+        icpu, ilevel = entries[:, 0], entries[:, 1]
+        offset[icpu, ilevel] = entries[:, 2]
+        level_count[icpu, ilevel] = entries[:, 3]
+        return offset, level_count
+
+    @classmethod
+    def load(cls, filename, ds):
+        """
+        Open an index cache file.
+
+        Raises an OSError if the file does not exist or does not match the
+        dataset.
+        """
+        if not os.path.isfile(filename):
+            raise OSError(f"No index cache file {filename}")
+
+        offsets = []
+        with open(filename, "rb") as f:
+            fsize = os.fstat(f.fileno()).st_size
+            while f.tell() < fsize:
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+                start = f.tell()
+                offsets.append((start, shape, dtype))
+                f.seek(start + int(np.prod(shape)) * dtype.itemsize)
+
+        # Copy-on-write so that the arrays can be passed to routines
+        # expecting writeable buffers.
+        mm = np.memmap(filename, dtype="uint8", mode="c")
+        arrays = []
+        for start, shape, dtype in offsets:
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            arrays.append(mm[start : start + nbytes].view(dtype).reshape(shape))
+
+        meta = json.loads(bytes(arrays[0]).decode("utf-8"))
+        if meta.get("version") != _index_cache_version:
+            raise OSError(f"Index cache {filename} has an incompatible version")
+        if meta.get("hash") != _compute_hash(ds):
+            raise OSError(f"Index cache {filename} does not match dataset")
+
+        records = dict(zip(meta["records"], arrays[1:]))
+        mylog.debug("Loaded index cache from %s", filename)
+        return cls(filename, meta, records)
+
+    @staticmethod
+    def save(filename, ds, domains):
+        """
+        Write an index cache file from a list of domains.
+
+        The domains must have been read with ``keep_oct_records=True``.
+        """
+        ndom = len(domains)
+        domain_ids = np.array([dom.domain_id for dom in domains], dtype=np.int64)
+        max_level = np.array([dom.max_level for dom in domains], dtype=np.int64)
+        ngridbound = np.stack([dom.ngridbound for dom in domains]).astype(np.int64)
+
+        group_ptr = np.zeros(ndom + 1, dtype=np.int64)
+        position_ptr = np.zeros(ndom + 1, dtype=np.int64)
+        groups = []
+        positions = []
+        for i, dom in enumerate(domains):
+            npos = 0
+            for icpu, level, pos in dom._oct_records:
+                groups.append((icpu, level, pos.shape[0]))
+                positions.append(pos)
+                npos += pos.shape[0]
+            group_ptr[i + 1] = len(groups)
+            position_ptr[i + 1] = position_ptr[i] + npos
+        groups = np.array(groups, dtype=np.int64).reshape(-1, 3)
+        if positions:
+            positions = np.concatenate(positions)
+        else:
+            positions = np.empty((0, 3), dtype=np.float64)
+
+        records = {
+            "domain_ids": domain_ids,
+            "max_level": max_level,
+            "ngridbound": ngridbound,
+            "group_ptr": group_ptr,
+            "groups": groups,
+            "position_ptr": position_ptr,
+            "positions": positions,
+        }
+
+        # Field offsets are mostly empty, so only store the non-trivial
+        # (icpu, ilevel, offset, level_count) entries.
+        field_types = {}
+        for ftype in {fh.ftype for fh in domains[0].field_handlers}:
+            ptr = np.zeros(ndom + 1, dtype=np.int64)
+            entries = []
+            for i, dom in enumerate(domains):
+                fh = next(fh for fh in dom.field_handlers if fh.ftype == ftype)
+                offset, level_count = fh.offset, fh.level_count
+                icpu, ilevel = np.nonzero(offset >= 0)
+                entries.append(
+                    np.stack(
+                        [icpu, ilevel, offset[icpu, ilevel], level_count[icpu, ilevel]],
+                        axis=1,
+                    ).astype(np.int64)
+                )
+                ptr[i + 1] = ptr[i] + icpu.size
+            field_types[ftype] = offset.shape
+            records[f"{ftype}_ptr"] = ptr
+            records[ftype] = np.concatenate(entries)
+
+        hvals = domains[0].amr_header
+        records["numbl"] = np.asarray(hvals["numbl"])
+        amr_header = {k: _to_builtin(v) for k, v in hvals.items() if k != "numbl"}
+
+        meta = {
+            "version": _index_cache_version,
+            "hash": _compute_hash(ds),
+            "amr_header": amr_header,
+            "field_types": field_types,
+            "records": list(records.keys()),
+        }
+        meta_bytes = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype="uint8")
+
+        with open(filename, "wb") as f:
+            np.lib.format.write_array(f, meta_bytes, allow_pickle=False)
+            for arr in records.values():
+                np.lib.format.write_array(
+                    f, np.ascontiguousarray(arr), allow_pickle=False
+                )
+        mylog.info("Saved index cache to %s", filename)
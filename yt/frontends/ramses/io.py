@@ -90,6 +90,26 @@ class IOHandlerRAMSES(BaseIOHandler):
 
         # Set of field types
         ftypes = {f[0] for f in fields}
+
+        def read_subset(task):
+            subset, ft, field_subs = task
+            fname = None
+            for fh in subset.domain.field_handlers:
+                if fh.ftype == ft:
+                    file_handler = fh
+                    fname = fh.fname
+                    break
+
+            if fname is None:
+                raise YTFieldTypeNotFound(ft)
+
+            # Now we read the entire thing
+            with FortranFile(fname) as fd:
+                # This contains the boundary information, so we skim through
+                # and pick off the right vectors
+                return subset.fill(fd, field_subs, selector, file_handler)
+
+        tasks = []
         for chunk in chunks:
             # Gather fields by type to minimize i/o operations
             for ft in ftypes:
@@ -98,32 +118,24 @@ class IOHandlerRAMSES(BaseIOHandler):
 
                 # Loop over subsets
                 for subset in chunk.objs:
-                    fname = None
-                    for fh in subset.domain.field_handlers:
-                        if fh.ftype == ft:
-                            file_handler = fh
-                            fname = fh.fname
-                            break
-
-                    if fname is None:
-                        raise YTFieldTypeNotFound(ft)
-
-                    # Now we read the entire thing
-                    with FortranFile(fname) as fd:
-                        # This contains the boundary information, so we skim through
-                        # and pick off the right vectors
-                        rv = subset.fill(fd, field_subs, selector, file_handler)
-                    for ft, f in field_subs:
-                        d = rv.pop(f)
-                        mylog.debug(
-                            "Filling %s with %s (%0.3e %0.3e) (%s zones)",
-                            f,
-                            d.size,
-                            d.min(),
-                            d.max(),
-                            d.size,
-                        )
-                        tr[(ft, f)].append(d)
+                    tasks.append((subset, ft, field_subs))
+
+        # The subsets may be read concurrently, but the results are
+        # collected in order
+        for (_, _, field_subs), rv in zip(
+            tasks, self._parallel_read(read_subset, tasks)
+        ):
+            for ft, f in field_subs:
+                d = rv.pop(f)
+                mylog.debug(
+                    "Filling %s with %s (%0.3e %0.3e) (%s zones)",
+                    f,
+                    d.size,
+                    d.min(),
+                    d.max(),
+                    d.size,
+                )
+                tr[(ft, f)].append(d)
         d = {}
         for field in fields:
             d[field] = np.concatenate(tr.pop(field))
@@ -137,15 +149,16 @@ class IOHandlerRAMSES(BaseIOHandler):
             for ptype, field_list in ptf.items()
             for ax in "xyz"
         ]
-        for chunk in chunks:
-            for subset in chunk.objs:
-                rv = self._read_particle_subset(subset, fields)
-                for ptype in sorted(ptf):
-                    yield ptype, (
-                        rv[ptype, pn % "x"],
-                        rv[ptype, pn % "y"],
-                        rv[ptype, pn % "z"],
-                    ), 0.0
+        subsets = [subset for chunk in chunks for subset in chunk.objs]
+        for rv in self._parallel_read(
+            lambda subset: self._read_particle_subset(subset, fields), subsets
+        ):
+            for ptype in sorted(ptf):
+                yield ptype, (
+                    rv[ptype, pn % "x"],
+                    rv[ptype, pn % "y"],
+                    rv[ptype, pn % "z"],
+                ), 0.0
 
     def _read_particle_fields(self, chunks, ptf, selector):
         pn = "particle_position_%s"
@@ -157,17 +170,18 @@ class IOHandlerRAMSES(BaseIOHandler):
             for ax in "xyz":
                 if pn % ax not in field_list:
                     fields.append((ptype, pn % ax))
-        for chunk in chunks:
-            for subset in chunk.objs:
-                rv = self._read_particle_subset(subset, fields)
-                for ptype, field_list in sorted(ptf.items()):
-                    x, y, z = (np.asarray(rv[ptype, pn % ax], "=f8") for ax in "xyz")
-                    mask = selector.select_points(x, y, z, 0.0)
-                    if mask is None:
-                        mask = []
-                    for field in field_list:
-                        data = np.asarray(rv.pop((ptype, field))[mask], "=f8")
-                        yield (ptype, field), data
+        subsets = [subset for chunk in chunks for subset in chunk.objs]
+        for rv in self._parallel_read(
+            lambda subset: self._read_particle_subset(subset, fields), subsets
+        ):
+            for ptype, field_list in sorted(ptf.items()):
+                x, y, z = (np.asarray(rv[ptype, pn % ax], "=f8") for ax in "xyz")
+                mask = selector.select_points(x, y, z, 0.0)
+                if mask is None:
+                    mask = []
+                for field in field_list:
+                    data = np.asarray(rv.pop((ptype, field))[mask], "=f8")
+                    yield (ptype, field), data
 
     def _read_particle_subset(self, subset, fields):
         """Read the particle files."""
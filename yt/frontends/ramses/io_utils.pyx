@@ -20,7 +20,7 @@ ctypedef np.float64_t DOUBLE_t
 @cython.nonecheck(False)
 def read_amr(FortranFile f, dict headers,
              np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level,
-             RAMSESOctreeContainer oct_handler):
+             RAMSESOctreeContainer oct_handler, list oct_records=None):
 
     cdef INT64_t ncpu, nboundary, max_level, nlevelmax, ncpu_and_bound
     cdef DOUBLE_t nx, ny, nz
@@ -79,6 +79,10 @@ def read_amr(FortranFile f, dict headers,
                                     count_boundary = 1)
                 if n > 0:
                     max_level = max(ilevel - min_level, max_level)
+                # Keep a copy of the positions so that the tree can be
+                # rebuilt later on without parsing the file again
+                if oct_records is not None:
+                    oct_records.append((icpu, ilevel - min_level, pos[:ng, :].copy()))
 
     return max_level
 
@@ -1,7 +1,15 @@
+from itertools import product
+
 import numpy as np
 
 import yt
-from yt.frontends.ramses.hilbert import get_cpu_list, hilbert3d
+from yt.frontends.ramses.hilbert import (
+    _STATE_DIAGRAM,
+    get_cpu_cells,
+    get_cpu_list,
+    get_cpu_mask,
+    hilbert3d,
+)
 from yt.testing import assert_equal, requires_file
 
 
@@ -22,6 +30,15 @@ def test_hilbert3d():
     for i, o in zip(inputs, outputs):
         assert_equal(int(hilbert3d(i, 3)), o)
 
+    # All at once
+    assert_equal(hilbert3d(inputs, 3), outputs)
+
+    # With a different bit length for each position
+    X = [[1, 1, 1], [3, 2, 7], [1, 1, 1]]
+    bit_length = [1, 3, 3]
+    expected = [hilbert3d(x, bl)[0] for x, bl in zip(X, bit_length)]
+    assert_equal(hilbert3d(X, bit_length), expected)
+
 
 output_00080 = "output_00080/info_00080.txt"
 
@@ -46,3 +63,139 @@ def test_get_cpu_list():
         ls = get_cpu_list(ds, bbox)
         assert len(ls) > 0
         assert all(np.array(o) == np.array(ls))
+
+
+def _fake_ds(ncpu, levelmax):
+    from types import SimpleNamespace
+
+    bounds = np.linspace(0, 2 ** (3 * (levelmax + 1)), ncpu + 1)
+    return SimpleNamespace(
+        parameters={"levelmax": levelmax, "ncpu": ncpu, "ndim": 3},
+        hilbert_indices={i + 1: (bounds[i], bounds[i + 1]) for i in range(ncpu)},
+    )
+
+
+def test_get_cpu_list_few_cpus():
+    # Regression test: this used to fail with fewer than 8 CPUs
+    ds = _fake_ds(4, 5)
+
+    assert_equal(get_cpu_list(ds, [[0.1, 0.1, 0.1], [0.2, 0.2, 0.2]]), [0])
+    assert_equal(get_cpu_list(ds, [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]), [0, 1, 2, 3])
+
+
+def _hilbert_key(x, bit_length):
+    # Hilbert key of a single position, computed bit by bit as in RAMSES
+    i_bit_mask = [0] * (3 * bit_length)
+    for i in range(bit_length):
+        i_bit_mask[3 * i + 2] = (x[0] >> i) & 1
+        i_bit_mask[3 * i + 1] = (x[1] >> i) & 1
+        i_bit_mask[3 * i] = (x[2] >> i) & 1
+    cstate = 0
+    for i in range(bit_length - 1, -1, -1):
+        sdigit = (
+            4 * i_bit_mask[3 * i + 2] + 2 * i_bit_mask[3 * i + 1] + i_bit_mask[3 * i]
+        )
+        nstate = _STATE_DIAGRAM[sdigit, 0, cstate]
+        hdigit = _STATE_DIAGRAM[sdigit, 1, cstate]
+        i_bit_mask[3 * i + 2] = (hdigit >> 2) & 1
+        i_bit_mask[3 * i + 1] = (hdigit >> 1) & 1
+        i_bit_mask[3 * i] = hdigit & 1
+        cstate = nstate
+    return sum(int(b) << i for i, b in enumerate(i_bit_mask))
+
+
+def _reference_cpu_list(ds, left_edge, right_edge):
+    # The original implementation of get_cpu_list, looping over the 8 cells
+    # around the box and over the CPUs one at a time
+    levelmax = ds.parameters["levelmax"]
+    ncpu = ds.parameters["ncpu"]
+    ndim = ds.parameters["ndim"]
+
+    dmax = max(right_edge[i] - left_edge[i] for i in range(3))
+    ilevel = 0
+    deltax = dmax * 2
+    while deltax >= dmax:
+        ilevel += 1
+        deltax = 0.5**ilevel
+    bit_length = ilevel - 1
+    maxdom = 2**bit_length
+    dkey = (2 ** (levelmax + 1) / maxdom) ** ndim
+    imin = [int(x * maxdom) for x in left_edge]
+
+    bound_key = [0.0] * (ncpu + 1)
+    for icpu in range(1, ncpu + 1):
+        bound_key[icpu - 1], bound_key[icpu] = ds.hilbert_indices[icpu]
+
+    cpu_list = set()
+    for corner in product((0, 1), repeat=3):
+        if bit_length > 0:
+            order_min = _hilbert_key([i + c for i, c in zip(imin, corner)], bit_length)
+        else:
+            order_min = 0
+        bounding_min = order_min * dkey
+        bounding_max = (order_min + 1) * dkey
+        cpu_min = cpu_max = 0
+        for icpu in range(1, ncpu + 1):
+            if bound_key[icpu - 1] <= bounding_min < bound_key[icpu]:
+                cpu_min = icpu - 1
+            if bound_key[icpu - 1] < bounding_max <= bound_key[icpu]:
+                cpu_max = icpu
+        cpu_list.update(range(cpu_min, cpu_max))
+    return sorted(cpu_list)
+
+
+def test_get_cpu_mask():
+    ds = _fake_ds(16, 8)
+
+    # Boxes aligned with the Hilbert cells and boxes straddling them, checked
+    # against the original implementation
+    left_edges = [
+        [0.1, 0.1, 0.1],
+        [0.25, 0.5, 0.25],
+        [0.49, 0.49, 0.49],
+        [0.7, 0.1, 0.8],
+        [0.0, 0.0, 0.0],
+    ]
+    right_edges = [
+        [0.2, 0.2, 0.2],
+        [0.5, 0.75, 0.5],
+        [0.51, 0.51, 0.51],
+        [0.7001, 0.1001, 0.8001],
+        [1.0, 1.0, 1.0],
+    ]
+    outputs = (
+        [0],
+        [4, 5, 7, 8, 10, 11],
+        [1, 3, 4, 7, 8, 11, 12, 14],
+        [13],
+        list(range(16)),
+    )
+    mask = get_cpu_mask(ds, left_edges, right_edges)
+    assert_equal(mask.shape, (5, 16))
+    for m, o in zip(mask, outputs):
+        assert_equal(np.flatnonzero(m), o)
+
+    # Random boxes of sizes spanning several levels
+    np.random.seed(0x4D3D3D3)
+    left_edges = np.random.random((200, 3)) * 0.8
+    widths = np.random.random((200, 3)) * 0.2 ** np.random.randint(1, 6, (200, 1))
+    right_edges = left_edges + widths
+    mask = get_cpu_mask(ds, left_edges, right_edges)
+    for le, re, m in zip(left_edges, right_edges, mask):
+        assert_equal(np.flatnonzero(m), _reference_cpu_list(ds, le, re))
+
+
+def test_get_cpu_cells():
+    ds = _fake_ds(16, 8)
+    bit_length = 3
+    cells = get_cpu_cells(ds, bit_length)
+    assert_equal(len(cells), 16)
+
+    # The domain boundaries are aligned with the cells, so each cell belongs
+    # to exactly one CPU
+    ncell = 2 ** (3 * bit_length)
+    assert_equal(sum(len(c) for c in cells), ncell)
+    n = ncell // 16
+    for icpu, c in enumerate(cells):
+        order = hilbert3d(c, bit_length)
+        assert_equal(np.sort(order), np.arange(icpu * n, (icpu + 1) * n))
@@ -640,3 +640,63 @@ def test_print_stats():
     ds.print_stats()
 
     # FIXME #3197: use `capsys` with pytest to make sure the print_stats function works as intended
+
+
+@requires_file(output_00080)
+def test_index_cache():
+    ds_ref = yt.load(output_00080)
+    ds = yt.load(output_00080, cache_index=True)
+    cache_fname = f"{ds.parameter_filename}.amr_index"
+    try:
+        # First load writes the cache, second load reads from it
+        ds.index
+        assert os.path.exists(cache_fname)
+        ds_cached = yt.load(output_00080, cache_index=True)
+
+        for dom, dom_ref in zip(ds_cached.index.domains, ds_ref.index.domains):
+            assert_equal(dom.max_level, dom_ref.max_level)
+            assert_equal(dom.oct_handler.nocts, dom_ref.oct_handler.nocts)
+            assert_equal(dom.level_count, dom_ref.level_count)
+
+        sp_ref = ds_ref.sphere("c", (0.1, "unitary"))
+        sp = ds_cached.sphere("c", (0.1, "unitary"))
+        for field in _fields:
+            assert_equal(sp[field], sp_ref[field])
+    finally:
+        if os.path.exists(cache_fname):
+            os.remove(cache_fname)
+
+
+@requires_file(output_00080)
+def test_lazy_index():
+    ds_ref = yt.load(output_00080)
+    ds = yt.load(output_00080, lazy_index=True)
+
+    # No AMR structure should have been read so far
+    assert all(dom._oct_handler is None for dom in ds.index.domains)
+
+    sp_ref = ds_ref.sphere([0.1, 0.1, 0.1], (0.05, "unitary"))
+    sp = ds.sphere([0.1, 0.1, 0.1], (0.05, "unitary"))
+    for field in _fields:
+        assert_equal(sp[field], sp_ref[field])
+    assert_equal(sp["io", "particle_mass"], sp_ref["io", "particle_mass"])
+
+    # Only the domains intersecting with the sphere have been read
+    nread = sum(dom._oct_handler is not None for dom in ds.index.domains)
+    assert 0 < nread < len(ds.index.domains)
+
+
+@requires_file(output_00080)
+def test_io_threads():
+    ds_ref = yt.load(output_00080)
+    ad_ref = ds_ref.all_data()
+
+    old_io_threads = ytcfg.get("yt", "io_threads")
+    ytcfg["yt", "io_threads"] = 4
+    try:
+        ds = yt.load(output_00080)
+        ad = ds.all_data()
+        for field in _fields + (("io", "particle_mass"),):
+            assert_equal(ad[field], ad_ref[field])
+    finally:
+        ytcfg["yt", "io_threads"] = old_io_threads
@@ -5,6 +5,9 @@ Generic file-handing functions for SPH data
 
 
 """
+import numpy as np
+
+from yt.config import ytcfg
 from yt.utilities.io_handler import BaseParticleIOHandler
 
 
@@ -16,4 +19,52 @@ class IOHandlerSPH(BaseParticleIOHandler):
     determine particle extents.
     """
 
-    pass
+    def _memmap_dataset(self, dset):
+        # Map a contiguous and uncompressed HDF5 dataset directly from the
+        # file, or return None if this is not possible. The mapping is
+        # copy-on-write, so that it can be passed to routines expecting
+        # writeable buffers.
+        if not ytcfg.get("yt", "hdf5_memmap"):
+            return None
+        if dset.chunks is not None or dset.external is not None:
+            return None
+        if dset.dtype.kind not in "iuf" or dset.size == 0:
+            return None
+        offset = dset.id.get_offset()
+        if offset is None:
+            return None
+        return np.memmap(
+            dset.file.filename,
+            dtype=dset.dtype,
+            mode="c",
+            offset=offset,
+            shape=dset.shape,
+        )
+
+    def _read_dataset(self, dset, si, ei, mask=None, column=None):
+        """
+        Read the rows si:ei of an HDF5 dataset, optionally restricted to a
+        single column and to the rows selected by mask.
+
+        With the ``hdf5_memmap`` configuration option, contiguous and
+        uncompressed datasets are memory-mapped, so that the mask is applied
+        without reading the whole rows in an intermediate buffer.
+        """
+        data = self._memmap_dataset(dset)
+        if data is None:
+            data = dset
+        if column is None:
+            data = data[si:ei]
+        else:
+            data = data[si:ei, column]
+        if mask is not None:
+            data = data[mask, ...]
+        return data
+
+    def _get_coordinates(self, data_file, ptype, dset=None):
+        # The positions of a particle type in a data file. When the coordinate
+        # cache is disabled, they are read from dset, their dataset in a file
+        # that is already open, if it is given.
+        if dset is not None and self._coordinate_cache.max_size <= 0:
+            return self._read_dataset(dset, data_file.start, data_file.end)
+        return super()._get_coordinates(data_file, ptype)
@@ -707,11 +707,10 @@ class StreamOctreeSubset(OctreeSubset):
         # Here we get a copy of the file, which we skip through and read the
         # bits we want.
         oct_handler = self.oct_handler
-        cell_count = selector.count_oct_cells(self.oct_handler, self.domain_id)
-        levels, cell_inds, file_inds = self.oct_handler.file_index_octs(
-            selector, self.domain_id, cell_count
-        )
-        levels[:] = 0
+        levels, cell_inds, file_inds = self._file_index_octs(selector)
+        cell_count = levels.size
+        # The cached indices are shared, so do not modify them in place
+        levels = np.zeros_like(levels)
         dest.update((field, np.empty(cell_count, dtype="float64")) for field in content)
         # Make references ...
         count = oct_handler.fill_level(
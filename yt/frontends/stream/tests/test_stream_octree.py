@@ -50,3 +50,36 @@ def test_octree():
 
     proj = ds.proj(("gas", "density"), "x")
     proj[("gas", "density")]
+
+
+def test_octree_file_index_cache():
+    octree_mask = np.array(OCT_MASK_LIST, dtype=np.uint8)
+
+    quantities = {}
+    quantities[("gas", "density")] = np.arange(22, dtype="float64").reshape(22, 1)
+    quantities[("gas", "temperature")] = np.ones((22, 1), dtype="float64")
+
+    bbox = np.array([[-10.0, 10.0], [-10.0, 10.0], [-10.0, 10.0]])
+
+    ds = yt.load_octree(
+        octree_mask=octree_mask,
+        data=quantities,
+        bbox=bbox,
+        over_refine_factor=0,
+        partial_coverage=0,
+    )
+
+    reg = ds.region([0.0, 0.0, 0.0], [-5.0, -5.0, -5.0], [5.0, 5.0, 5.0])
+    dens = reg["gas", "density"]
+    cache = ds.index._file_index_cache
+    assert len(cache) == 1
+
+    # Reading another field, or the same region again, reuses the indices
+    reg["gas", "temperature"]
+    reg2 = ds.region([0.0, 0.0, 0.0], [-5.0, -5.0, -5.0], [5.0, 5.0, 5.0])
+    dens2 = reg2["gas", "density"]
+    assert len(cache) == 1
+    np.testing.assert_equal(dens, dens2)
+
+    ds.region([0.0, 0.0, 0.0], [-5.0, -5.0, -5.0], [6.0, 5.0, 5.0])["gas", "density"]
+    assert len(cache) == 2
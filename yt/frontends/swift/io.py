@@ -22,13 +22,12 @@ class IOHandlerSwift(IOHandlerSPH):
         # yt has the concept of sub_files, i.e, we break up big files into
         # virtual sub_files to deal with the chunking system
         for sub_file in self._sorted_chunk_iterator(chunks):
-            si, ei = sub_file.start, sub_file.end
             f = h5py.File(sub_file.filename, mode="r")
             # This double-reads
             for ptype in sorted(ptf):
                 if sub_file.total_particles[ptype] == 0:
                     continue
-                pos = f[f"/{ptype}/Coordinates"][si:ei, :]
+                pos = self._get_coordinates(sub_file, ptype, f[f"/{ptype}/Coordinates"])
                 pos = pos.astype("float64", copy=False)
                 if ptype == self.ds._sph_ptypes[0]:
                     hsml = self._get_smoothing_length(sub_file)
@@ -51,7 +50,7 @@ class IOHandlerSwift(IOHandlerSPH):
                 and key != needed_ptype
             ):
                 continue
-            pos = f[key]["Coordinates"][si:ei, ...]
+            pos = self._read_dataset(f[key]["Coordinates"], si, ei)
             pos = pos.astype("float64", copy=False)
             yield key, pos
         f.close()
@@ -66,7 +65,7 @@ class IOHandlerSwift(IOHandlerSPH):
             pcount = f["/Header"].attrs["NumPart_ThisFile"][ind].astype("int")
             pcount = np.clip(pcount - si, 0, ei - si)
             # we upscale to float64
-            hsml = f[ptype]["SmoothingLength"][si:ei, ...]
+            hsml = self._read_dataset(f[ptype]["SmoothingLength"], si, ei)
             hsml = hsml.astype("float64", copy=False)
             return hsml
 
@@ -84,7 +83,7 @@ class IOHandlerSwift(IOHandlerSPH):
                 continue
             g = f[f"/{ptype}"]
             # this should load as float64
-            coords = g["Coordinates"][si:ei]
+            coords = self._get_coordinates(sub_file, ptype, g["Coordinates"])
             if ptype == "PartType0":
                 hsmls = self._get_smoothing_length(sub_file)
             else:
@@ -99,12 +98,11 @@ class IOHandlerSwift(IOHandlerSPH):
                 continue
             for field in field_list:
                 if field in ("Mass", "Masses"):
-                    data = g[self.ds._particle_mass_name][si:ei]
+                    dset = g[self.ds._particle_mass_name]
                 else:
-                    data = g[field][si:ei]
+                    dset = g[field]
 
-                if selector:
-                    data = data[mask, ...]
+                data = self._read_dataset(dset, si, ei, mask if selector else None)
 
                 data.astype("float64", copy=False)
 
@@ -209,8 +209,7 @@ class YTDataset(SavedDataset):
         self.field_info.setup_extra_union_fields()
         mylog.debug("Loading field plugins.")
         self.field_info.load_all_plugins()
-        deps, unloaded = self.field_info.check_derived_fields()
-        self.field_dependencies.update(deps)
+        self._check_derived_fields()
 
     def _setup_gas_alias(self):
         pass
@@ -782,7 +781,7 @@ class YTNonspatialDataset(YTGridDataset):
 class YTProfileDataset(YTNonspatialDataset):
     """Dataset for saved profile objects."""
 
-    fluid_types = ("data", "gas", "standard_deviation")
+    fluid_types = ("data", "gas", "standard_deviation", "accumulator")
 
     def __init__(self, filename, unit_system="cgs"):
         super().__init__(filename, unit_system=unit_system)
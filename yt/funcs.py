@@ -716,7 +716,12 @@ def get_num_threads():
 
     nt = ytcfg.get("yt", "num_threads")
     if nt < 0:
-        return os.environ.get("OMP_NUM_THREADS", 0)
+        # OMP_NUM_THREADS can be a list of numbers of threads for each level
+        # of nested parallelism
+        try:
+            return int(os.environ.get("OMP_NUM_THREADS", "0").split(",")[0])
+        except ValueError:
+            return 0
     return nt
 
 
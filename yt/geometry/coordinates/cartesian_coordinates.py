@@ -1,7 +1,7 @@
 import numpy as np
 
 from yt.data_objects.index_subobjects.unstructured_mesh import SemiStructuredMesh
-from yt.funcs import mylog
+from yt.funcs import get_num_threads, mylog
 from yt.units.yt_array import YTArray, uconcatenate, uvstack  # type: ignore
 from yt.utilities.lib.pixelization_routines import (
     interpolate_sph_grid_gather,
@@ -11,7 +11,7 @@ from yt.utilities.lib.pixelization_routines import (
     pixelize_element_mesh,
     pixelize_element_mesh_line,
     pixelize_off_axis_cartesian,
-    pixelize_sph_kernel_projection,
+    pixelize_sph_kernel_projection_multi,
     pixelize_sph_kernel_slice,
 )
 from yt.utilities.nodal_data_utils import get_nodal_data
@@ -161,12 +161,22 @@ class CartesianCoordinateHandler(CoordinateHandler):
         )
 
     def pixelize(
-        self, dimension, data_source, field, bounds, size, antialias=True, periodic=True
+        self,
+        dimension,
+        data_source,
+        field,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+        num_threads=0,
     ):
         """
         Method for pixelizing datasets in preparation for
         two-dimensional image plots. Relies on several sampling
-        routines written in cython
+        routines written in cython. The SPH fields are pixelized with
+        num_threads threads, or the num_threads configuration option if
+        it is 0.
         """
         index = data_source.ds.index
         if hasattr(index, "meshes") and not isinstance(
@@ -220,7 +230,14 @@ class CartesianCoordinateHandler(CoordinateHandler):
 
         elif self.axis_id.get(dimension, dimension) < 3:
             return self._ortho_pixelize(
-                data_source, field, bounds, size, antialias, dimension, periodic
+                data_source,
+                field,
+                bounds,
+                size,
+                antialias,
+                dimension,
+                periodic,
+                num_threads=num_threads,
             )
         else:
             return self._oblique_pixelize(data_source, field, bounds, size, antialias)
@@ -290,7 +307,7 @@ class CartesianCoordinateHandler(CoordinateHandler):
         return arc_length, plot_values
 
     def _ortho_pixelize(
-        self, data_source, field, bounds, size, antialias, dim, periodic
+        self, data_source, field, bounds, size, antialias, dim, periodic, num_threads=0
     ):
         from yt.data_objects.construction_data_containers import YTParticleProj
         from yt.data_objects.selection_objects.slices import YTSlice
@@ -330,141 +347,69 @@ class CartesianCoordinateHandler(CoordinateHandler):
                 int(periodic),
             )
         elif isinstance(data_source.ds, particle_datasets) and is_sph_field:
-            ptype = field[0]
-            if ptype == "gas":
-                ptype = data_source.ds._sph_ptypes[0]
+            ptype = self._get_sph_ptype(data_source, field)
             px_name = self.axis_name[self.x_axis[dim]]
             py_name = self.axis_name[self.y_axis[dim]]
             ounits = data_source.ds.field_info[field].output_units
             bnds = data_source.ds.arr(bounds, "code_length").tolist()
             if isinstance(data_source, YTParticleProj):
-                weight = data_source.weight_field
-                le, re = data_source.data_source.get_bbox()
-                xa = self.x_axis[dim]
-                ya = self.y_axis[dim]
-                # If we're not periodic, we need to clip to the boundary edges
-                # or we get errors about extending off the edge of the region.
-                if not self.ds.periodicity[xa]:
-                    le[xa] = max(bounds[0], self.ds.domain_left_edge[xa])
-                    re[xa] = min(bounds[1], self.ds.domain_right_edge[xa])
-                else:
-                    le[xa] = bounds[0]
-                    re[xa] = bounds[1]
-                if not self.ds.periodicity[ya]:
-                    le[ya] = max(bounds[2], self.ds.domain_left_edge[ya])
-                    re[ya] = min(bounds[3], self.ds.domain_right_edge[ya])
-                else:
-                    le[ya] = bounds[2]
-                    re[ya] = bounds[3]
-                # We actually need to clip these
-                proj_reg = data_source.ds.region(
-                    left_edge=le,
-                    right_edge=re,
-                    center=data_source.center,
-                    data_source=data_source.data_source,
+                (buff,) = self._pixelize_sph_projection(
+                    data_source, [field], bounds, size, dim, periodic, num_threads
                 )
-                proj_reg.set_field_parameter("axis", data_source.axis)
-                buff = np.zeros(size, dtype="float64")
-                if weight is None:
-                    for chunk in proj_reg.chunks([], "io"):
-                        data_source._initialize_projected_units([field], chunk)
-                        pixelize_sph_kernel_projection(
-                            buff,
-                            chunk[ptype, px_name].to("code_length"),
-                            chunk[ptype, py_name].to("code_length"),
-                            chunk[ptype, "smoothing_length"].to("code_length"),
-                            chunk[ptype, "mass"].to("code_mass"),
-                            chunk[ptype, "density"].to("code_density"),
-                            chunk[field].in_units(ounits),
-                            bnds,
-                            check_period=int(periodic),
-                            period=period,
-                        )
-                    # We use code length here, but to get the path length right
-                    # we need to multiply by the conversion factor between
-                    # code length and the unit system's length unit
-                    default_path_length_unit = data_source.ds.unit_system["length"]
-                    dl_conv = data_source.ds.quan(1.0, "code_length").to(
-                        default_path_length_unit
-                    )
-                    buff *= dl_conv.v
-                # if there is a weight field, take two projections:
-                # one of field*weight, the other of just weight, and divide them
-                else:
-                    weight_buff = np.zeros(size, dtype="float64")
-                    buff = np.zeros(size, dtype="float64")
-                    wounits = data_source.ds.field_info[weight].output_units
-                    for chunk in proj_reg.chunks([], "io"):
-                        data_source._initialize_projected_units([field], chunk)
-                        data_source._initialize_projected_units([weight], chunk)
-                        pixelize_sph_kernel_projection(
-                            buff,
-                            chunk[ptype, px_name].to("code_length"),
-                            chunk[ptype, py_name].to("code_length"),
-                            chunk[ptype, "smoothing_length"].to("code_length"),
-                            chunk[ptype, "mass"].to("code_mass"),
-                            chunk[ptype, "density"].to("code_density"),
-                            chunk[field].in_units(ounits),
-                            bnds,
-                            check_period=int(periodic),
-                            period=period,
-                            weight_field=chunk[weight].in_units(wounits),
-                        )
-                    mylog.info(
-                        "Making a fixed resolution buffer of (%s) %d by %d",
-                        weight,
-                        size[0],
-                        size[1],
-                    )
-                    for chunk in proj_reg.chunks([], "io"):
-                        data_source._initialize_projected_units([weight], chunk)
-                        pixelize_sph_kernel_projection(
-                            weight_buff,
-                            chunk[ptype, px_name].to("code_length"),
-                            chunk[ptype, py_name].to("code_length"),
-                            chunk[ptype, "smoothing_length"].to("code_length"),
-                            chunk[ptype, "mass"].to("code_mass"),
-                            chunk[ptype, "density"].to("code_density"),
-                            chunk[weight].in_units(wounits),
-                            bnds,
-                            check_period=int(periodic),
-                            period=period,
-                        )
-                    normalization_2d_utility(buff, weight_buff)
             elif isinstance(data_source, YTSlice):
                 smoothing_style = getattr(self.ds, "sph_smoothing_style", "scatter")
                 normalize = getattr(self.ds, "use_sph_normalization", True)
 
                 if smoothing_style == "scatter":
+                    num_threads = self._get_num_threads(num_threads)
                     buff = np.zeros(size, dtype="float64")
                     if normalize:
                         buff_den = np.zeros(size, dtype="float64")
 
+                    index = data_source.ds.index
+                    chunk_fields = [
+                        (ptype, px_name),
+                        (ptype, py_name),
+                        (ptype, "smoothing_length"),
+                        (ptype, "mass"),
+                        (ptype, "density"),
+                        field,
+                    ]
                     for chunk in data_source.chunks([], "io"):
+                        px, py, hsml, mass, dens, values = index._sort_particles(
+                            chunk, ptype, chunk_fields
+                        )
+                        px = px.to("code_length")
+                        py = py.to("code_length")
+                        hsml = hsml.to("code_length")
+                        mass = mass.to("code_mass")
+                        dens = dens.to("code_density")
                         pixelize_sph_kernel_slice(
                             buff,
-                            chunk[ptype, px_name].to("code_length"),
-                            chunk[ptype, py_name].to("code_length"),
-                            chunk[ptype, "smoothing_length"].to("code_length"),
-                            chunk[ptype, "mass"].to("code_mass"),
-                            chunk[ptype, "density"].to("code_density"),
-                            chunk[field].in_units(ounits),
+                            px,
+                            py,
+                            hsml,
+                            mass,
+                            dens,
+                            values.in_units(ounits),
                             bnds,
                             check_period=int(periodic),
                             period=period,
+                            num_threads=num_threads,
                         )
                         if normalize:
                             pixelize_sph_kernel_slice(
                                 buff_den,
-                                chunk[ptype, px_name].to("code_length"),
-                                chunk[ptype, py_name].to("code_length"),
-                                chunk[ptype, "smoothing_length"].to("code_length"),
-                                chunk[ptype, "mass"].to("code_mass"),
-                                chunk[ptype, "density"].to("code_density"),
-                                np.ones(chunk[ptype, "density"].shape[0]),
+                                px,
+                                py,
+                                hsml,
+                                mass,
+                                dens,
+                                np.ones(dens.shape[0]),
                                 bnds,
                                 check_period=int(periodic),
                                 period=period,
+                                num_threads=num_threads,
                             )
 
                     if normalize:
@@ -551,6 +496,178 @@ class CartesianCoordinateHandler(CoordinateHandler):
             )
         return buff
 
+    def pixelize_fields(
+        self,
+        dimension,
+        data_source,
+        fields,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+        num_threads=0,
+    ):
+        """
+        Pixelize several fields, as pixelize does for one of them. The SPH
+        fields of particle projections of the same particle type are
+        projected together, in a single pass over the particles.
+        """
+        from yt.data_objects.construction_data_containers import YTParticleProj
+        from yt.frontends.sph.data_structures import ParticleDataset
+        from yt.frontends.stream.data_structures import StreamParticlesDataset
+
+        fields = data_source._determine_fields(fields)
+        particle_datasets = (ParticleDataset, StreamParticlesDataset)
+        groups = {}
+        if (
+            self.axis_id.get(dimension, dimension) < 3
+            and isinstance(data_source, YTParticleProj)
+            and isinstance(data_source.ds, particle_datasets)
+        ):
+            for field in fields:
+                finfo = data_source.ds.field_info[field]
+                if finfo.is_sph_field and not np.any(finfo.nodal_flag):
+                    ptype = self._get_sph_ptype(data_source, field)
+                    groups.setdefault(ptype, []).append(field)
+        buffs = {}
+        for group in groups.values():
+            group_buffs = self._pixelize_sph_projection(
+                data_source, group, bounds, size, dimension, periodic, num_threads
+            )
+            # The buffers are transposed as in _ortho_pixelize
+            buffs.update((f, buff.transpose()) for f, buff in zip(group, group_buffs))
+        return [
+            buffs[field]
+            if field in buffs
+            else self.pixelize(
+                dimension,
+                data_source,
+                field,
+                bounds,
+                size,
+                antialias,
+                periodic,
+                num_threads=num_threads,
+            )
+            for field in fields
+        ]
+
+    def _get_num_threads(self, num_threads):
+        # The SPH kernels use the num_threads configuration option unless
+        # told otherwise, and OpenMP decides if this is not set either
+        if num_threads > 0:
+            return num_threads
+        return get_num_threads()
+
+    def _get_sph_ptype(self, data_source, field):
+        ptype = field[0]
+        if ptype == "gas":
+            ptype = data_source.ds._sph_ptypes[0]
+        return ptype
+
+    def _pixelize_sph_projection(
+        self, data_source, fields, bounds, size, dim, periodic, num_threads=0
+    ):
+        # Project the SPH fields of a particle projection, which have the
+        # same particle type, with a single pass over its chunks. The fields,
+        # and the weight field, are read together for each chunk, and the
+        # kernel is evaluated once for all of them.
+        ptype = self._get_sph_ptype(data_source, fields[0])
+        num_threads = self._get_num_threads(num_threads)
+        px_name = self.axis_name[self.x_axis[dim]]
+        py_name = self.axis_name[self.y_axis[dim]]
+        period = self.period[:2].copy()  # dummy here
+        period[0] = self.period[self.x_axis[dim]]
+        period[1] = self.period[self.y_axis[dim]]
+        if hasattr(period, "in_units"):
+            period = period.in_units("code_length").d
+        bnds = data_source.ds.arr(bounds, "code_length").tolist()
+        weight = data_source.weight_field
+        le, re = data_source.data_source.get_bbox()
+        xa = self.x_axis[dim]
+        ya = self.y_axis[dim]
+        # If we're not periodic, we need to clip to the boundary edges
+        # or we get errors about extending off the edge of the region.
+        if not self.ds.periodicity[xa]:
+            le[xa] = max(bounds[0], self.ds.domain_left_edge[xa])
+            re[xa] = min(bounds[1], self.ds.domain_right_edge[xa])
+        else:
+            le[xa] = bounds[0]
+            re[xa] = bounds[1]
+        if not self.ds.periodicity[ya]:
+            le[ya] = max(bounds[2], self.ds.domain_left_edge[ya])
+            re[ya] = min(bounds[3], self.ds.domain_right_edge[ya])
+        else:
+            le[ya] = bounds[2]
+            re[ya] = bounds[3]
+        # We actually need to clip these
+        proj_reg = data_source.ds.region(
+            left_edge=le,
+            right_edge=re,
+            center=data_source.center,
+            data_source=data_source.data_source,
+        )
+        proj_reg.set_field_parameter("axis", data_source.axis)
+        ounits = [data_source.ds.field_info[field].output_units for field in fields]
+        buffs = np.zeros((len(fields),) + tuple(size), dtype="float64")
+        chunk_fields = [
+            (ptype, px_name),
+            (ptype, py_name),
+            (ptype, "smoothing_length"),
+            (ptype, "mass"),
+            (ptype, "density"),
+        ] + list(fields)
+        kwargs = {}
+        if weight is not None:
+            # if there is a weight field, project field*weight and weight
+            # together, and divide them
+            chunk_fields.append(weight)
+            weight_buff = np.zeros(size, dtype="float64")
+            wounits = data_source.ds.field_info[weight].output_units
+            kwargs["weight_buff"] = weight_buff
+        index = data_source.ds.index
+        # The projected fields can be among the fields of the kernel, but
+        # are only read once
+        for chunk in proj_reg.chunks(list(dict.fromkeys(chunk_fields)), "io"):
+            data_source._initialize_projected_units(fields, chunk)
+            if weight is not None:
+                data_source._initialize_projected_units([weight], chunk)
+            px, py, hsml, mass, dens, *values = index._sort_particles(
+                chunk, ptype, chunk_fields
+            )
+            quantities = np.empty((dens.shape[0], len(fields)), dtype="float64")
+            for i, units in enumerate(ounits):
+                quantities[:, i] = values[i].in_units(units)
+            if weight is not None:
+                kwargs["weight_field"] = values[-1].in_units(wounits).d
+            pixelize_sph_kernel_projection_multi(
+                buffs,
+                px.to("code_length"),
+                py.to("code_length"),
+                hsml.to("code_length"),
+                mass.to("code_mass"),
+                dens.to("code_density"),
+                quantities,
+                bnds,
+                check_period=int(periodic),
+                period=period,
+                num_threads=num_threads,
+                **kwargs,
+            )
+        if weight is None:
+            # We use code length here, but to get the path length right
+            # we need to multiply by the conversion factor between
+            # code length and the unit system's length unit
+            default_path_length_unit = data_source.ds.unit_system["length"]
+            dl_conv = data_source.ds.quan(1.0, "code_length").to(
+                default_path_length_unit
+            )
+            buffs *= dl_conv.v
+        else:
+            for buff in buffs:
+                normalization_2d_utility(buff, weight_buff)
+        return list(buffs)
+
     def _oblique_pixelize(self, data_source, field, bounds, size, antialias):
         from yt.frontends.ytdata.data_structures import YTSpatialPlotDataset
 
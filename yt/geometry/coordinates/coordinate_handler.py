@@ -141,11 +141,38 @@ class CoordinateHandler(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def pixelize(self, dimension, data_source, field, bounds, size, antialias=True):
+    def pixelize(
+        self, dimension, data_source, field, bounds, size, antialias=True, num_threads=0
+    ):
         # This should *actually* be a pixelize call, not just returning the
         # pixelizer
         pass
 
+    def pixelize_fields(
+        self,
+        dimension,
+        data_source,
+        fields,
+        bounds,
+        size,
+        antialias=True,
+        num_threads=0,
+    ):
+        # Pixelize several fields. Coordinate handlers that can share the
+        # work between the fields override this.
+        return [
+            self.pixelize(
+                dimension,
+                data_source,
+                field,
+                bounds,
+                size,
+                antialias,
+                num_threads=num_threads,
+            )
+            for field in fields
+        ]
+
     @abc.abstractmethod
     def pixelize_line(self, field, start_point, end_point, npoints):
         pass
@@ -83,6 +83,7 @@ class CylindricalCoordinateHandler(CoordinateHandler):
         size,
         antialias=True,
         periodic=False,
+        num_threads=0,
     ):
         # Note that above, we set periodic by default to be *false*.  This is
         # because our pixelizers, at present, do not handle periodicity
@@ -214,7 +214,15 @@ class GeographicCoordinateHandler(CoordinateHandler):
         return surface_height, 1.0
 
     def pixelize(
-        self, dimension, data_source, field, bounds, size, antialias=True, periodic=True
+        self,
+        dimension,
+        data_source,
+        field,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+        num_threads=0,
     ):
         if self.axis_name[dimension] in ("latitude", "longitude"):
             return self._cyl_pixelize(
@@ -85,7 +85,15 @@ class SphericalCoordinateHandler(CoordinateHandler):
         )
 
     def pixelize(
-        self, dimension, data_source, field, bounds, size, antialias=True, periodic=True
+        self,
+        dimension,
+        data_source,
+        field,
+        bounds,
+        size,
+        antialias=True,
+        periodic=True,
+        num_threads=0,
     ):
         self.period
         name = self.axis_name[dimension]
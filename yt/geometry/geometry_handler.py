@@ -188,7 +188,8 @@ class Index(ParallelAnalysisInterface, abc.ABC):
             if fname in self.field_list or (ftype, fname) in self.field_list:
                 fields_to_read.append((ftype, fname))
             elif (
-                fname in self.ds.derived_field_list
+                (ftype, fname) in self.ds.field_info._lazy_detected
+                or fname in self.ds.derived_field_list
                 or (ftype, fname) in self.ds.derived_field_list
             ):
                 fields_to_generate.append((ftype, fname))
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 
 from yt.fields.field_detector import FieldDetector
@@ -8,10 +10,43 @@ from yt.utilities.logger import ytLogger as mylog
 class OctreeIndex(Index):
     """The Index subclass for oct AMR datasets"""
 
+    # Maximum number of (selector, domain) pairs whose file indices are kept
+    _file_index_cache_size = 128
+    _file_index_cache = None
+
     def _setup_geometry(self):
         mylog.debug("Initializing Octree Geometry Handler.")
         self._initialize_oct_handler()
 
+    def _get_file_index_octs(self, oct_handler, selector, domain_id):
+        """
+        Return the level, cell index and file index of the cells of a domain
+        selected by a selector.
+
+        The results are kept in a bounded LRU cache keyed on the selector hash
+        and the domain ID, so that reading several field types for the same
+        data object, or repeating a query, only walks the oct tree once. The
+        returned arrays are shared, and should not be modified in place.
+        """
+        if self._file_index_cache is None:
+            self._file_index_cache = OrderedDict()
+        cache = self._file_index_cache
+        key = (hash(selector), domain_id)
+        # Popping and reinserting the entry marks it as the most recently used
+        # one, and is safe if the cache is accessed from several I/O threads.
+        try:
+            rv = cache.pop(key)
+        except KeyError:
+            cell_count = selector.count_oct_cells(oct_handler, domain_id)
+            rv = oct_handler.file_index_octs(selector, domain_id, cell_count)
+        cache[key] = rv
+        while len(cache) > self._file_index_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+        return rv
+
     def get_smallest_dx(self):
         """
         Returns (in code units) the smallest cell size in the simulation.
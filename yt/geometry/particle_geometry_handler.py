@@ -1,33 +1,83 @@
 import collections
 import errno
+import multiprocessing
 import os
 import struct
 import weakref
 
 import numpy as np
 
+from yt.config import ytcfg
 from yt.data_objects.index_subobjects.particle_container import ParticleContainer
+from yt.data_objects.static_output import validate_index_order
 from yt.funcs import get_pbar, only_on_root
 from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.geometry.particle_oct_container import ParticleBitmap
+from yt.utilities.io_handler import ArrayCache
 from yt.utilities.lib.ewah_bool_wrap import BoolArrayCollection
 from yt.utilities.lib.fnv_hash import fnv_hash
+from yt.utilities.lib.geometry_utils import compute_morton
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.parallel_tools.parallel_analysis_interface import parallel_objects
 
+# State shared with the worker processes building the index. The workers are
+# forked, so they inherit it from the parent process and only their results
+# need to be pickled.
+_worker_state = None
+
+
+def _index_process_map(func, nprocs, index, *args):
+    # Apply func to the index of each data file in a pool of forked
+    # processes, yielding the results in order.
+    global _worker_state
+    _worker_state = (index, args)
+    try:
+        with multiprocessing.get_context("fork").Pool(nprocs) as pool:
+            yield from pool.imap(func, range(len(index.data_files)))
+    finally:
+        _worker_state = None
+
+
+def _coarse_index_worker(i):
+    index, (bitmaps,) = _worker_state
+    data_file = index.data_files[i]
+    max_hsml = index._coarse_index_data_file(data_file, bitmaps)
+    rv = {}
+    for key, regions in bitmaps.items():
+        # Only send back the cells touched by this file, and reset the
+        # particle counts for the next file processed by this worker
+        mask = np.flatnonzero(regions.masks[:, data_file.file_id])
+        counts_ind = np.flatnonzero(regions.particle_counts)
+        counts = regions.particle_counts[counts_ind]
+        regions.particle_counts[counts_ind] = 0
+        rv[key] = (max_hsml[key], mask, counts_ind, counts)
+    return rv
+
+
+def _refined_index_worker(i):
+    index, (bitmaps, args) = _worker_state
+    colls = index._refined_index_data_file(index.data_files[i], bitmaps, args)
+    return {key: b"" if coll is None else coll.dumps() for key, coll in colls.items()}
+
 
 class ParticleIndex(Index):
     """The Index subclass for particle datasets"""
 
+    _particle_orders = None
+
     def __init__(self, ds, dataset_type):
         self.dataset_type = dataset_type
         self.dataset = weakref.proxy(ds)
         self.float_type = np.float64
         super().__init__(ds, dataset_type)
         self._initialize_index()
+        max_size = int(ytcfg.get("yt", "sph_particle_order_cache_size") * 1024**2)
+        if max_size > 0:
+            self._particle_orders = ArrayCache(max_size)
 
     def _setup_geometry(self):
         self.regions = None
+        self.ptype_regions = None
 
     def get_smallest_dx(self):
         """
@@ -108,22 +158,15 @@ class ParticleIndex(Index):
             global_rootonly=True,
         )
 
+        if not hasattr(self.ds, "_file_hash"):
+            self.ds._file_hash = self._generate_hash()
+
         # if we have not yet set domain_left_edge and domain_right_edge then do
         # an I/O pass over the particle coordinates to determine a bounding box
         if self.ds.domain_left_edge is None:
-            min_ppos = np.empty(3, dtype="float64")
-            min_ppos[:] = np.nan
-            max_ppos = np.empty(3, dtype="float64")
-            max_ppos[:] = np.nan
-            only_on_root(
-                mylog.info,
-                "Bounding box cannot be inferred from metadata, reading "
-                "particle positions to infer bounding box",
-            )
-            for df in self.data_files:
-                for _, ppos in self.io._yield_coordinates(df):
-                    min_ppos = np.nanmin(np.vstack([min_ppos, ppos]), axis=0)
-                    max_ppos = np.nanmax(np.vstack([max_ppos, ppos]), axis=0)
+            extents = self._get_particle_extents()
+            min_ppos = np.nanmin(extents[:, 0], axis=0)
+            max_ppos = np.nanmax(extents[:, 1], axis=0)
             only_on_root(
                 mylog.info,
                 "Load this dataset with bounding_box=[%s, %s] to avoid I/O "
@@ -133,28 +176,84 @@ class ParticleIndex(Index):
             ds.domain_right_edge = ds.arr(1.05 * max_ppos, "code_length")
             ds.domain_width = ds.domain_right_edge - ds.domain_left_edge
 
-        # use a trivial morton index for datasets containing a single chunk
-        if len(self.data_files) == 1:
-            order1 = 1
-            order2 = 1
+        index_order = getattr(ds, "index_order", None)
+        if isinstance(index_order, dict):
+            # One bitmap index per particle type, so that the orders of each
+            # particle type can be set, and refined, independently
+            ptypes = sorted(
+                {
+                    ptype
+                    for data_file in self.data_files
+                    for ptype, count in data_file.total_particles.items()
+                    if count > 0
+                }
+            )
+            bitmaps = {
+                ptype: self._create_bitmap(
+                    index_order.get(ptype, validate_index_order(None))
+                )
+                for ptype in ptypes
+            }
         else:
-            order1 = ds.index_order[0]
-            order2 = ds.index_order[1]
+            bitmaps = {None: self._create_bitmap(index_order)}
 
-        if order1 == 1 and order2 == 1:
-            dont_cache = True
-        else:
-            dont_cache = False
+        # trivial morton indices are not cached
+        dont_cache = all(
+            regions.index_order1 == 1 and regions.index_order2 == 1
+            for regions in bitmaps.values()
+        )
 
         # If we have applied a bounding box then we can't cache the
         # ParticleBitmap because it is domain dependent
         if getattr(ds, "_domain_override", False):
             dont_cache = True
 
-        if not hasattr(self.ds, "_file_hash"):
-            self.ds._file_hash = self._generate_hash()
+        # Load Morton indices from file if provided
+        dont_load = dont_cache and not hasattr(ds, "index_filename")
+        to_build = {}
+        for key, regions in bitmaps.items():
+            try:
+                if dont_load:
+                    raise OSError
+                rflag = regions.load_bitmasks(self._bitmap_filename(regions, key))
+                rflag = regions.check_bitmasks()
+                self._initialize_frontend_specific()
+                if rflag == 0:
+                    raise OSError
+            except (OSError, struct.error):
+                regions.reset_bitmasks()
+                to_build[key] = regions
+
+        if to_build:
+            self._initialize_coarse_index(to_build)
+            self._initialize_refined_index(to_build)
+            for key, regions in to_build.items():
+                # We now get the filename since index_order2 may have changed
+                fname = self._bitmap_filename(regions, key)
+                wdir = os.path.dirname(fname)
+                if not dont_cache and os.access(wdir, os.W_OK):
+                    # Sometimes os mis-reports whether a directory is writable,
+                    # So pass if writing the bitmask file fails.
+                    try:
+                        regions.save_bitmasks(fname)
+                    except OSError:
+                        pass
+                rflag = regions.check_bitmasks()
+
+        if None in bitmaps:
+            self.regions = bitmaps[None]
+        else:
+            self.ptype_regions = bitmaps
 
-        self.regions = ParticleBitmap(
+    def _create_bitmap(self, index_order):
+        ds = self.ds
+        # use a trivial morton index for datasets containing a single chunk
+        if len(self.data_files) == 1:
+            order1 = 1
+            order2 = 1
+        else:
+            order1, order2 = index_order
+        return ParticleBitmap(
             ds.domain_left_edge,
             ds.domain_right_edge,
             ds.periodicity,
@@ -164,84 +263,186 @@ class ParticleIndex(Index):
             index_order2=order2,
         )
 
-        # Load Morton index from file if provided
-        def _current_fname():
-            if getattr(ds, "index_filename", None) is None:
-                fname = ds.parameter_filename + ".index{}_{}.ewah".format(
-                    self.regions.index_order1, self.regions.index_order2
-                )
+    def _bitmap_filename(self, regions, ptype=None):
+        # Per particle type indices get their own sidecar file
+        ds = self.ds
+        if getattr(ds, "index_filename", None) is None:
+            fname = ds.parameter_filename
+            if ptype is not None:
+                fname += f".{ptype}"
+            fname += ".index{}_{}.ewah".format(
+                regions.index_order1, regions.index_order2
+            )
+        else:
+            fname = ds.index_filename
+            if ptype is not None:
+                fname += f".{ptype}"
+        return fname
+
+    @property
+    def _extents_filename(self):
+        # In-memory datasets have no hash, so their extents are not cached
+        if self.ds._file_hash == -1:
+            return None
+        fname = getattr(self.ds, "index_filename", None)
+        if fname is None:
+            fname = self.ds.parameter_filename
+        return f"{fname}.extents.npz"
+
+    def _get_particle_extents(self):
+        """
+        Return the minimum and maximum particle positions of each data file,
+        as an array of shape (nfiles, 2, 3). Data files without particles
+        have NaN extents.
+
+        The extents are cached in a sidecar file, so that the particle
+        positions only need to be read to infer the bounding box the first
+        time a dataset is loaded.
+        """
+        fname = self._extents_filename
+        if fname is not None and os.path.isfile(fname):
+            try:
+                with np.load(fname) as f:
+                    file_hash = int(f["file_hash"])
+                    extents = f["extents"]
+            except (OSError, KeyError, ValueError):
+                pass
             else:
-                fname = ds.index_filename
-            return fname
+                nfiles = len(self.data_files)
+                if file_hash == self.ds._file_hash and len(extents) == nfiles:
+                    return extents
 
-        fname = _current_fname()
+        only_on_root(
+            mylog.info,
+            "Bounding box cannot be inferred from metadata, reading "
+            "particle positions to infer bounding box",
+        )
+        extents = np.full((len(self.data_files), 2, 3), np.nan, dtype="float64")
+        for i, df in enumerate(self.data_files):
+            for _, ppos in self.io._yield_coordinates(df):
+                if ppos.size == 0:
+                    continue
+                # Reduce along the particles without copying the positions
+                np.fmin(extents[i, 0], np.fmin.reduce(ppos, axis=0), out=extents[i, 0])
+                np.fmax(extents[i, 1], np.fmax.reduce(ppos, axis=0), out=extents[i, 1])
 
-        dont_load = dont_cache and not hasattr(ds, "index_filename")
-        try:
-            if dont_load:
-                raise OSError
-            rflag = self.regions.load_bitmasks(fname)
-            rflag = self.regions.check_bitmasks()
-            self._initialize_frontend_specific()
-            if rflag == 0:
-                raise OSError
-        except (OSError, struct.error):
-            self.regions.reset_bitmasks()
-            self._initialize_coarse_index()
-            self._initialize_refined_index()
-            # We now update fname since index_order2 may have changed
-            fname = _current_fname()
-            wdir = os.path.dirname(fname)
-            if not dont_cache and os.access(wdir, os.W_OK):
-                # Sometimes os mis-reports whether a directory is writable,
-                # So pass if writing the bitmask file fails.
-                try:
-                    self.regions.save_bitmasks(fname)
-                except OSError:
-                    pass
-            rflag = self.regions.check_bitmasks()
-
-    def _initialize_coarse_index(self):
-        max_hsml = 0.0
+        if fname is not None and os.access(os.path.dirname(fname), os.W_OK):
+            # Sometimes os mis-reports whether a directory is writable,
+            # So pass if writing the extents file fails.
+            try:
+                np.savez(fname, file_hash=self.ds._file_hash, extents=extents)
+            except OSError:
+                pass
+        return extents
+
+    def _get_index_nprocs(self):
+        # Number of processes used to build the index. The MPI parallel path
+        # takes precedence, and the workers can only be forked.
+        nprocs = min(ytcfg.get("yt", "index_nprocs"), len(self.data_files))
+        if nprocs <= 1 or self.comm.size > 1:
+            return 1
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return 1
+        return nprocs
+
+    @staticmethod
+    def _bitmap_key(ptype, bitmaps):
+        # The key of the bitmap indexing a particle type, which is None when
+        # all the particle types share the same index
+        return None if None in bitmaps else ptype
+
+    def _coarse_index_data_file(self, data_file, bitmaps):
+        ds = self.ds
+        max_hsml = dict.fromkeys(bitmaps, 0.0)
+        for ptype, pos in self.io._yield_coordinates(data_file):
+            key = self._bitmap_key(ptype, bitmaps)
+            if key not in bitmaps:
+                continue
+            if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
+                hsml = self.io._get_smoothing_length(data_file, pos.dtype, pos.shape)
+                if hsml is not None and hsml.size > 0.0:
+                    max_hsml[key] = max(max_hsml[key], hsml.max())
+            else:
+                hsml = None
+            bitmaps[key]._coarse_index_data_file(pos, hsml, data_file.file_id)
+        return max_hsml
+
+    def _initialize_coarse_index(self, bitmaps):
+        ds = self.ds
+        max_hsml = dict.fromkeys(bitmaps, 0.0)
         pb = get_pbar("Initializing coarse index ", len(self.data_files))
-        for i, data_file in parallel_objects(enumerate(self.data_files)):
-            pb.update(i + 1)
-            for ptype, pos in self.io._yield_coordinates(data_file):
-                ds = self.ds
-                if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                    if hsml is not None and hsml.size > 0.0:
-                        max_hsml = max(max_hsml, hsml.max())
-                else:
-                    hsml = None
-                self.regions._coarse_index_data_file(pos, hsml, data_file.file_id)
+        nprocs = self._get_index_nprocs()
+        if nprocs > 1:
+            # The particle counts are additive and the masks are per file, so
+            # the results of the workers can be merged in any order.
+            results = _index_process_map(_coarse_index_worker, nprocs, self, bitmaps)
+            for i, rv in enumerate(results):
+                pb.update(i + 1)
+                file_id = self.data_files[i].file_id
+                for key, (file_max_hsml, mask, counts_ind, counts) in rv.items():
+                    max_hsml[key] = max(max_hsml[key], file_max_hsml)
+                    bitmaps[key].masks[mask, file_id] = 1
+                    bitmaps[key].particle_counts[counts_ind] += counts
+        else:
+            for i, data_file in parallel_objects(enumerate(self.data_files)):
+                pb.update(i + 1)
+                file_max_hsml = self._coarse_index_data_file(data_file, bitmaps)
+                for key, val in file_max_hsml.items():
+                    max_hsml[key] = max(max_hsml[key], val)
         pb.finish()
-        self.regions.masks = self.comm.mpi_allreduce(self.regions.masks, op="sum")
-        self.regions.particle_counts = self.comm.mpi_allreduce(
-            self.regions.particle_counts, op="sum"
-        )
-        for data_file in self.data_files:
-            self.regions._set_coarse_index_data_file(data_file.file_id)
-        self.regions.find_collisions_coarse()
-        if max_hsml > 0.0 and len(self.data_files) > 1:
-            # By passing this in, we only allow index_order2 to be increased by
-            # two at most, never increased.  One place this becomes particularly
-            # useful is in the case of an extremely small section of gas
-            # particles embedded in a much much larger domain.  The max
-            # smoothing length will be quite small, so based on the larger
-            # domain, it will correspond to a very very high index order, which
-            # is a large amount of memory!  Having multiple indexes, one for
-            # each particle type, would fix this.
-            new_order2 = self.regions.update_mi2(max_hsml, ds.index_order[1] + 2)
-            mylog.info(
-                "Updating index_order2 from %s to %s", ds.index_order[1], new_order2
+        for key, regions in bitmaps.items():
+            regions.masks = self.comm.mpi_allreduce(regions.masks, op="sum")
+            regions.particle_counts = self.comm.mpi_allreduce(
+                regions.particle_counts, op="sum"
+            )
+            for data_file in self.data_files:
+                regions._set_coarse_index_data_file(data_file.file_id)
+            regions.find_collisions_coarse()
+            if max_hsml[key] > 0.0 and len(self.data_files) > 1:
+                # By passing this in, we only allow index_order2 to be
+                # increased by two at most, never increased.  One place this
+                # becomes particularly useful is in the case of an extremely
+                # small section of gas particles embedded in a much much larger
+                # domain.  The max smoothing length will be quite small, so
+                # based on the larger domain, it will correspond to a very very
+                # high index order, which is a large amount of memory!  Using
+                # one index per particle type (by passing a dict as
+                # index_order) confines this to the index of the gas particles.
+                order1, order2 = regions.index_order1, regions.index_order2
+                new_order2 = regions.update_mi2(max_hsml[key], order2 + 2)
+                mylog.info("Updating index_order2 from %s to %s", order2, new_order2)
+                if key is None:
+                    ds.index_order = (order1, new_order2)
+                else:
+                    ds.index_order[key] = (order1, new_order2)
+
+    def _refined_index_data_file(self, data_file, bitmaps, args):
+        colls = dict.fromkeys(bitmaps)
+        nsub_mi = dict.fromkeys(bitmaps, 0)
+        for ptype, pos in self.io._yield_coordinates(data_file):
+            key = self._bitmap_key(ptype, bitmaps)
+            if pos.size == 0 or key not in bitmaps:
+                continue
+            if hasattr(self.ds, "_sph_ptypes") and ptype == self.ds._sph_ptypes[0]:
+                hsml = self.io._get_smoothing_length(data_file, pos.dtype, pos.shape)
+            else:
+                hsml = None
+            mask, sub_mi1, sub_mi2, count_threshold, mask_threshold = args[key]
+            nsub_mi[key], colls[key] = bitmaps[key]._refined_index_data_file(
+                colls[key],
+                pos,
+                hsml,
+                mask,
+                sub_mi1,
+                sub_mi2,
+                data_file.file_id,
+                nsub_mi[key],
+                count_threshold=count_threshold,
+                mask_threshold=mask_threshold,
             )
-            self.ds.index_order = (self.ds.index_order[0], new_order2)
+        return colls
 
-    def _initialize_refined_index(self):
-        mask = self.regions.masks.sum(axis=1).astype("uint8")
+    def _initialize_refined_index(self, bitmaps):
         max_npart = max(sum(d.total_particles.values()) for d in self.data_files) * 28
         sub_mi1 = np.zeros(max_npart, "uint64")
         sub_mi2 = np.zeros(max_npart, "uint64")
@@ -253,57 +454,53 @@ class ParticleIndex(Index):
             mask_threshold,
             count_threshold,
         )
-        total_refined = 0
-        total_coarse_refined = (
-            (mask >= 2) & (self.regions.particle_counts > count_threshold)
-        ).sum()
-        mylog.debug(
-            "This should produce roughly %s zones, for %s of the domain",
-            total_coarse_refined,
-            100 * total_coarse_refined / mask.size,
-        )
+        args = {}
+        for key, regions in bitmaps.items():
+            mask = regions.masks.sum(axis=1).astype("uint8")
+            total_coarse_refined = (
+                (mask >= 2) & (regions.particle_counts > count_threshold)
+            ).sum()
+            mylog.debug(
+                "This should produce roughly %s zones, for %s of the domain",
+                total_coarse_refined,
+                100 * total_coarse_refined / mask.size,
+            )
+            args[key] = (mask, sub_mi1, sub_mi2, count_threshold, mask_threshold)
         storage = {}
-        for sto, (i, data_file) in parallel_objects(
-            enumerate(self.data_files), storage=storage
-        ):
-            coll = None
-            pb.update(i + 1)
-            nsub_mi = 0
-            for ptype, pos in self.io._yield_coordinates(data_file):
-                if pos.size == 0:
-                    continue
-                if hasattr(self.ds, "_sph_ptypes") and ptype == self.ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                else:
-                    hsml = None
-                nsub_mi, coll = self.regions._refined_index_data_file(
-                    coll,
-                    pos,
-                    hsml,
-                    mask,
-                    sub_mi1,
-                    sub_mi2,
+        nprocs = self._get_index_nprocs()
+        if nprocs > 1:
+            results = _index_process_map(
+                _refined_index_worker, nprocs, self, bitmaps, args
+            )
+            for i, coll_strs in enumerate(results):
+                pb.update(i + 1)
+                storage[i] = (self.data_files[i].file_id, coll_strs)
+            # The refined indices have been used by the workers only
+            for regions in bitmaps.values():
+                regions._set_mi2_used()
+        else:
+            for sto, (i, data_file) in parallel_objects(
+                enumerate(self.data_files), storage=storage
+            ):
+                pb.update(i + 1)
+                colls = self._refined_index_data_file(data_file, bitmaps, args)
+                sto.result_id = i
+                sto.result = (
                     data_file.file_id,
-                    nsub_mi,
-                    count_threshold=count_threshold,
-                    mask_threshold=mask_threshold,
+                    {
+                        key: b"" if coll is None else coll.dumps()
+                        for key, coll in colls.items()
+                    },
                 )
-                total_refined += nsub_mi
-            sto.result_id = i
-            if coll is None:
-                coll_str = b""
-            else:
-                coll_str = coll.dumps()
-            sto.result = (data_file.file_id, coll_str)
         pb.finish()
         for i in sorted(storage):
-            file_id, coll_str = storage[i]
-            coll = BoolArrayCollection()
-            coll.loads(coll_str)
-            self.regions.bitmasks.append(file_id, coll)
-        self.regions.find_collisions_refined()
+            file_id, coll_strs = storage[i]
+            for key, coll_str in coll_strs.items():
+                coll = BoolArrayCollection()
+                coll.loads(coll_str)
+                bitmaps[key].bitmasks.append(file_id, coll)
+        for regions in bitmaps.values():
+            regions.find_collisions_refined()
 
     def _detect_output_fields(self):
         # TODO: Add additional fields
@@ -337,7 +534,14 @@ class ParticleIndex(Index):
                 dobj._chunk_info = [dobj]
             else:
                 # TODO: only return files
-                if getattr(dobj.selector, "is_all_data", False):
+                if self.ptype_regions is not None:
+                    # The fields are not known yet, so we chunk over the files
+                    # selected by any particle type, and narrow them down to
+                    # those of the requested particle types when reading.
+                    dobj._ptype_file_ids = self._identify_ptype_files(dobj.selector)
+                    dfi = sorted(set().union(*dobj._ptype_file_ids.values()))
+                    nfiles = len(dfi)
+                elif getattr(dobj.selector, "is_all_data", False):
                     nfiles = self.regions.nfiles
                     dfi = np.arange(nfiles)
                 else:
@@ -375,6 +579,101 @@ class ParticleIndex(Index):
                 # like.
         (dobj._current_chunk,) = self._chunk_all(dobj)
 
+    def _identify_ptype_files(self, selector):
+        # Map each particle type to the set of data files selected by its
+        # bitmap index and containing particles of this type
+        file_ids = {}
+        for ptype, regions in self.ptype_regions.items():
+            if getattr(selector, "is_all_data", False):
+                dfi = range(regions.nfiles)
+            else:
+                dfi, _, _ = regions.identify_file_masks(selector)
+            file_ids[ptype] = {
+                i for i in dfi if self.data_files[i].total_particles.get(ptype, 0)
+            }
+        return file_ids
+
+    def _get_particle_order(self, chunk, ptype):
+        """
+        Return the order sorting the particles of type ptype in an io chunk by
+        their Morton index, or None if the SPH particles are not sorted.
+
+        The orders are cached for each data file and selector, so that the
+        images of the same data reuse them.
+        """
+        if self._particle_orders is None:
+            return None
+        data_files = tuple(
+            data_file.file_id
+            for obj in chunk._current_chunk.objs
+            for data_file in obj.data_files
+        )
+        key = (data_files, ptype, hash(chunk.selector))
+        order = self._particle_orders.get(key)
+        if order is None:
+            pos = [
+                chunk[ptype, f"particle_position_{ax}"].to("code_length").d
+                for ax in "xyz"
+            ]
+            # The particles outside of the domain are moved to the end
+            morton = compute_morton(
+                *pos,
+                self.ds.domain_left_edge.to("code_length").d,
+                self.ds.domain_right_edge.to("code_length").d,
+                filter_bbox=True,
+            )
+            order = np.argsort(morton, kind="stable")
+            self._particle_orders.put(key, order, order.nbytes)
+        return order
+
+    def _sort_particles(self, chunk, ptype, fields):
+        """
+        Return the data of fields for the particles of type ptype in an io
+        chunk, sorted by Morton index when the
+        sph_particle_order_cache_size configuration option is set. The SPH
+        kernels then deposit neighbouring particles one after another, which
+        makes their writes to the image buffers more local.
+        """
+        data = [chunk[field] for field in fields]
+        order = self._get_particle_order(chunk, ptype)
+        if order is not None:
+            data = [d[order] for d in data]
+        return data
+
+    def _read_particle_fields(self, fields, dobj, chunk=None):
+        if len(fields) == 0:
+            return {}, []
+        fields_to_read, fields_to_generate = self._split_fields(fields)
+        if len(fields_to_read) == 0:
+            return {}, fields_to_generate
+        selector = dobj.selector
+        if chunk is None:
+            self._identify_base_chunk(dobj)
+        chunks = self._chunk_io(dobj, cache=False)
+        file_ids = getattr(dobj, "_ptype_file_ids", None)
+        if file_ids is not None:
+            unions = self.ds.particle_unions
+            ptypes = set()
+            for ftype, _ in fields_to_read:
+                ptypes.update(unions[ftype] if ftype in unions else (ftype,))
+            # Only read the files selected by the index of the requested
+            # particle types
+            if ptypes.issubset(file_ids):
+                selected = set().union(*(file_ids[ptype] for ptype in ptypes))
+                chunks = [
+                    chunk
+                    for chunk in chunks
+                    if any(
+                        data_file.file_id in selected
+                        for obj in chunk.objs
+                        for data_file in obj.data_files
+                    )
+                ]
+        fields_to_return = self.io._read_particle_selection(
+            chunks, selector, fields_to_read
+        )
+        return fields_to_return, fields_to_generate
+
     def _chunk_all(self, dobj):
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         yield YTDataChunk(dobj, "all", oobjs, None)
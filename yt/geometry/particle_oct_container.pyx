@@ -534,6 +534,14 @@ cdef class ParticleBitmap:
         for i in range(3):
             self.dds_mi2[i] = self.dds_mi1[i] / (1<<index_order2)
 
+    def _set_mi2_used(self):
+        """
+        Mark mi2 as used, as _refined_index_data_file does, when the refined
+        indices have been computed by other processes, so that update_mi2
+        does not change it anymore.
+        """
+        self._used_mi2 = 1
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.cdivision(True)
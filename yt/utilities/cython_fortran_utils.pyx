@@ -9,8 +9,8 @@ from libc.stdio cimport *
 import struct
 
 
-cdef INT32_SIZE = sizeof(np.int32_t)
-cdef DOUBLE_SIZE = sizeof(np.float64_t)
+cdef size_t INT32_SIZE = sizeof(np.int32_t)
+cdef size_t DOUBLE_SIZE = sizeof(np.float64_t)
 
 cdef class FortranFile:
     """This class provides facilities to interact with files written
@@ -58,9 +58,11 @@ cdef class FortranFile:
             raise ValueError("Read of closed file.")
 
         for i in range(n):
-            fread(&s1, INT32_SIZE, 1, self.cfile)
-            fseek(self.cfile, s1, SEEK_CUR)
-            fread(&s2, INT32_SIZE, 1, self.cfile)
+            # Release the GIL so that several files can be read concurrently
+            with nogil:
+                fread(&s1, INT32_SIZE, 1, self.cfile)
+                fseek(self.cfile, s1, SEEK_CUR)
+                fread(&s2, INT32_SIZE, 1, self.cfile)
 
             if s1 != s2:
                 raise IOError('Sizes do not agree in the header and footer for '
@@ -120,13 +122,15 @@ cdef class FortranFile:
         """
         cdef INT32_t s1, s2, size
         cdef np.ndarray data
+        cdef void *buf
 
         if self._closed:
             raise ValueError("I/O operation on closed file.")
 
         size = self.get_size(dtype)
 
-        fread(&s1, INT32_SIZE, 1, self.cfile)
+        with nogil:
+            fread(&s1, INT32_SIZE, 1, self.cfile)
 
         # Check record is compatible with data type
         if s1 % size != 0:
@@ -134,8 +138,10 @@ cdef class FortranFile:
                              'size (%s) of multi-item record' % (s1, size))
 
         data = np.empty(s1 // size, dtype=dtype)
-        fread(<void *>data.data, size, s1 // size, self.cfile)
-        fread(&s2, INT32_SIZE, 1, self.cfile)
+        buf = <void *>data.data
+        with nogil:
+            fread(buf, size, s1 // size, self.cfile)
+            fread(&s2, INT32_SIZE, 1, self.cfile)
 
         if s1 != s2:
             raise IOError('Sizes do not agree in the header and footer for '
@@ -292,7 +298,8 @@ cdef class FortranFile:
         if whence < 0 or whence > 2:
             raise ValueError("whence argument can be 0, 1, or 2. Got %s" % whence)
 
-        fseek(self.cfile, pos, whence)
+        with nogil:
+            fseek(self.cfile, pos, whence)
         return self.tell()
 
     cpdef void close(self):
@@ -77,13 +77,21 @@ class YTFieldNotFound(YTException):
     def __init__(self, field, ds):
         self.field = field
         self.ds = ds
-        self.suggestions = []
-        try:
-            self._find_suggestions()
-        except AttributeError:
-            # This may happen if passing a field that is e.g. an Ellipsis
-            # e.g. when using ds.r[...]
-            pass
+        self._suggestions = None
+
+    @property
+    def suggestions(self):
+        # The suggestions are only looked up when needed, since this requires
+        # the full list of derived fields of the dataset
+        if self._suggestions is None:
+            self._suggestions = []
+            try:
+                self._find_suggestions()
+            except AttributeError:
+                # This may happen if passing a field that is e.g. an Ellipsis
+                # e.g. when using ds.r[...]
+                pass
+        return self._suggestions
 
     def _find_suggestions(self):
         from yt.funcs import levenshtein_distance
@@ -127,7 +135,7 @@ class YTFieldNotFound(YTException):
                     suggestions[ft, fn] = distance
 
         # Return suggestions sorted by increasing distance (first are most likely)
-        self.suggestions = [
+        self._suggestions = [
             (ft, fn)
             for (ft, fn), distance in sorted(suggestions.items(), key=lambda v: v[1])
         ]
@@ -788,6 +796,16 @@ class YTIllDefinedProfile(YTException):
         return msg + weight_msg
 
 
+class YTIncompatibleProfiles(YTException):
+    def __init__(self, profile, other, reason):
+        self.profile = profile
+        self.other = other
+        self.reason = reason
+
+    def __str__(self):
+        return f"The profiles cannot be merged: {self.reason}."
+
+
 class YTProfileDataShape(YTException):
     def __init__(self, field1, shape1, field2, shape2):
         self.field1 = field1
@@ -1,8 +1,10 @@
 import os
 import sys
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import _make_key, lru_cache
+from functools import _make_key, lru_cache, wraps
 from typing import DefaultDict, List, Tuple
 
 if sys.version_info >= (3, 9):
@@ -13,6 +15,7 @@ else:
 import numpy as np
 
 from yt._typing import ParticleCoordinateTuple
+from yt.config import ytcfg
 from yt.geometry.selection_routines import GridSelector
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -57,6 +60,30 @@ class BaseIOHandler:
             # note, this type change can cause some mypy errors.
             self._vector_fields = {field: 3 for field in self._vector_fields}
 
+    def _parallel_read(self, func, items):
+        """
+        Apply func to each item and yield the results in order.
+
+        If the ``io_threads`` configuration option is larger than 1, the
+        items are processed concurrently by a pool of threads. This only
+        helps if func spends most of its time in code that releases the GIL
+        (typically, file I/O). At most ``io_threads + 1`` results are kept in
+        memory at any time.
+        """
+        nthreads = ytcfg.get("yt", "io_threads")
+        if nthreads <= 1:
+            yield from map(func, items)
+            return
+
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            futures = deque()
+            for item in items:
+                futures.append(pool.submit(func, item))
+                if len(futures) > nthreads:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
     # We need a function for reading a list of sets
     # and a function for *popping* from a queue all the appropriate sets
     @contextmanager
@@ -310,10 +337,164 @@ class BaseIOHandler:
             yield from data_file_data.items()
 
 
+class ArrayCache:
+    """
+    A least-recently-used cache of arrays, bounded by the total number of
+    bytes of the arrays it holds.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum number of bytes held by the cache. Values that are larger
+        than this are not cached.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def get(self, key):
+        """Return the value stored for key, or None."""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def pop(self, key):
+        """Remove the value stored for key from the cache and return it, or
+        None."""
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value, nbytes = self._data.pop(key)
+            self.size -= nbytes
+            return value
+
+    def put(self, key, value, nbytes):
+        """Store value for key, evicting the least recently used values if
+        the cache becomes too large."""
+        if nbytes > self.max_size:
+            return
+        with self._lock:
+            if key in self._data:
+                self.size -= self._data.pop(key)[1]
+            self._data[key] = (value, nbytes)
+            self.size += nbytes
+            while self.size > self.max_size:
+                _, (_, old_nbytes) = self._data.popitem(last=False)
+                self.size -= old_nbytes
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+
+def _data_file_key(data_file):
+    return (data_file.filename, data_file.start, data_file.end)
+
+
+def _cache_coordinates(func):
+    # Route the reads of _yield_coordinates through the coordinate cache. The
+    # positions of all the particle types of a data file are cached together.
+    @wraps(func)
+    def _yield_coordinates(self, data_file, needed_ptype=None):
+        cache = self._coordinate_cache
+        if cache.max_size <= 0:
+            if needed_ptype is None:
+                yield from func(self, data_file)
+            else:
+                yield from func(self, data_file, needed_ptype=needed_ptype)
+            return
+        key = _data_file_key(data_file)
+        coords = cache.get(key)
+        if coords is None:
+            coords = list(func(self, data_file))
+            cache.put(key, coords, sum(pos.nbytes for _, pos in coords))
+        for ptype, pos in coords:
+            if needed_ptype is None or ptype == needed_ptype:
+                yield ptype, pos
+
+    return _yield_coordinates
+
+
+def _cache_smoothing_length(func):
+    # Route the reads of _get_smoothing_length through the coordinate cache.
+    # The returned dtype may depend on the position dtype, which is part of
+    # the key.
+    @wraps(func)
+    def _get_smoothing_length(self, data_file, *args, **kwargs):
+        cache = self._coordinate_cache
+        if cache.max_size <= 0:
+            return func(self, data_file, *args, **kwargs)
+        position_dtype = args[0] if args else kwargs.get("position_dtype")
+        key = _data_file_key(data_file) + ("smoothing_length", position_dtype)
+        hsml = cache.get(key)
+        if hsml is None:
+            hsml = func(self, data_file, *args, **kwargs)
+            if hsml is not None:
+                cache.put(key, hsml, hsml.nbytes)
+        return hsml
+
+    return _get_smoothing_length
+
+
 # As a note: we don't *actually* want this to be how it is forever.  There's no
 # reason we need to have the fluid and particle IO handlers separated.  But,
 # for keeping track of which frontend is which, this is a useful abstraction.
 class BaseParticleIOHandler(BaseIOHandler):
+    def __init_subclass__(cls, *args, **kwargs):
+        super().__init_subclass__(*args, **kwargs)
+        if "_yield_coordinates" in cls.__dict__:
+            cls._yield_coordinates = _cache_coordinates(cls._yield_coordinates)
+        if "_get_smoothing_length" in cls.__dict__:
+            cls._get_smoothing_length = _cache_smoothing_length(
+                cls._get_smoothing_length
+            )
+
+    _coordinate_cache_instance = None
+
+    @property
+    def _coordinate_cache(self):
+        """
+        The cache of the particle positions and smoothing lengths of the data
+        files, shared by the index construction and the data selection. Its
+        size, in megabytes, is set by the ``coordinate_cache_size``
+        configuration option, and it is disabled by default.
+
+        The cached arrays are returned as-is, so they must not be modified.
+        """
+        if self._coordinate_cache_instance is None:
+            max_size = ytcfg.get("yt", "coordinate_cache_size") * 1024**2
+            self._coordinate_cache_instance = ArrayCache(max_size)
+        return self._coordinate_cache_instance
+
+    def _get_coordinates(self, data_file, ptype):
+        # The positions of a particle type in a data file, read through the
+        # coordinate cache
+        coords = [
+            pos
+            for _ptype, pos in self._yield_coordinates(data_file, needed_ptype=ptype)
+            if _ptype == ptype
+        ]
+        return coords[0] if coords else None
+
     def _sorted_chunk_iterator(self, chunks):
         chunks = list(chunks)
         data_files = set()
@@ -10,6 +10,8 @@ Simple utilities that don't fit anywhere else
 """
 
 
+import os
+
 import numpy as np
 
 from yt.funcs import get_pbar
@@ -32,7 +34,7 @@ cdef extern from "platform_dep.h":
     # NOTE that size_t might not be int
     void *alloca(int)
 
-from cython.parallel import prange
+from cython.parallel import parallel, prange, threadid
 
 from cpython.exc cimport PyErr_CheckSignals
 
@@ -47,29 +49,35 @@ def new_bin_profile1d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.float64_t, ndim=2] bresult,
                   np.ndarray[np.float64_t, ndim=2] mresult,
                   np.ndarray[np.float64_t, ndim=2] qresult,
-                  np.ndarray[np.uint8_t, ndim=1, cast=True] used):
+                  np.ndarray[np.uint8_t, ndim=1, cast=True] used,
+                  int num_threads = 1):
     cdef int n, fi, bin
     cdef np.float64_t wval, bval, oldwr, bval_mresult
     cdef int nb = bins_x.shape[0]
     cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin = bins_x[n]
-        wval = wsource[n]
-        # Skip field value entries where the weight field is zero
-        if wval == 0:
-            continue
-        oldwr = wresult[bin]
-        wresult[bin] += wval
-        for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin,fi]
-            # qresult has to have the previous wresult
-            qresult[bin,fi] += oldwr * wval * bval_mresult * bval_mresult / \
-                (oldwr + wval)
-            bresult[bin,fi] += wval*bval
-            # mresult needs the new wresult
-            mresult[bin,fi] += wval * bval_mresult / wresult[bin]
-        used[bin] = 1
+    if num_threads != 1:
+        _bin_profile_threaded(bins_x, wsource, bsource, wresult, bresult,
+                              mresult, qresult, used, num_threads)
+        return
+    with nogil:
+        for n in range(nb):
+            bin = bins_x[n]
+            wval = wsource[n]
+            # Skip field value entries where the weight field is zero
+            if wval == 0:
+                continue
+            oldwr = wresult[bin]
+            wresult[bin] += wval
+            for fi in range(nf):
+                bval = bsource[n,fi]
+                bval_mresult = bval - mresult[bin,fi]
+                # qresult has to have the previous wresult
+                qresult[bin,fi] += oldwr * wval * bval_mresult * bval_mresult / \
+                    (oldwr + wval)
+                bresult[bin,fi] += wval*bval
+                # mresult needs the new wresult
+                mresult[bin,fi] += wval * bval_mresult / wresult[bin]
+            used[bin] = 1
     return
 
 @cython.boundscheck(False)
@@ -83,30 +91,37 @@ def new_bin_profile2d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.float64_t, ndim=3] bresult,
                   np.ndarray[np.float64_t, ndim=3] mresult,
                   np.ndarray[np.float64_t, ndim=3] qresult,
-                  np.ndarray[np.uint8_t, ndim=2, cast=True] used):
+                  np.ndarray[np.uint8_t, ndim=2, cast=True] used,
+                  int num_threads = 1):
     cdef int n, fi, bin_x, bin_y
     cdef np.float64_t wval, bval, oldwr, bval_mresult
     cdef int nb = bins_x.shape[0]
     cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin_x = bins_x[n]
-        bin_y = bins_y[n]
-        wval = wsource[n]
-        # Skip field value entries where the weight field is zero
-        if wval == 0:
-            continue
-        oldwr = wresult[bin_x, bin_y]
-        wresult[bin_x,bin_y] += wval
-        for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin_x,bin_y,fi]
-            # qresult has to have the previous wresult
-            qresult[bin_x,bin_y,fi] += oldwr * wval * bval_mresult * bval_mresult / \
-                (oldwr + wval)
-            bresult[bin_x,bin_y,fi] += wval*bval
-            # mresult needs the new wresult
-            mresult[bin_x,bin_y,fi] += wval * bval_mresult / wresult[bin_x,bin_y]
-        used[bin_x,bin_y] = 1
+    if num_threads != 1:
+        _bin_profile_threaded(bins_x * wresult.shape[1] + bins_y, wsource,
+                              bsource, wresult, bresult, mresult, qresult,
+                              used, num_threads)
+        return
+    with nogil:
+        for n in range(nb):
+            bin_x = bins_x[n]
+            bin_y = bins_y[n]
+            wval = wsource[n]
+            # Skip field value entries where the weight field is zero
+            if wval == 0:
+                continue
+            oldwr = wresult[bin_x, bin_y]
+            wresult[bin_x,bin_y] += wval
+            for fi in range(nf):
+                bval = bsource[n,fi]
+                bval_mresult = bval - mresult[bin_x,bin_y,fi]
+                # qresult has to have the previous wresult
+                qresult[bin_x,bin_y,fi] += oldwr * wval * bval_mresult * bval_mresult / \
+                    (oldwr + wval)
+                bresult[bin_x,bin_y,fi] += wval*bval
+                # mresult needs the new wresult
+                mresult[bin_x,bin_y,fi] += wval * bval_mresult / wresult[bin_x,bin_y]
+            used[bin_x,bin_y] = 1
     return
 
 @cython.boundscheck(False)
@@ -121,33 +136,127 @@ def new_bin_profile3d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.float64_t, ndim=4] bresult,
                   np.ndarray[np.float64_t, ndim=4] mresult,
                   np.ndarray[np.float64_t, ndim=4] qresult,
-                  np.ndarray[np.uint8_t, ndim=3, cast=True] used):
+                  np.ndarray[np.uint8_t, ndim=3, cast=True] used,
+                  int num_threads = 1):
     cdef int n, fi, bin_x, bin_y, bin_z
     cdef np.float64_t wval, bval, oldwr, bval_mresult
     cdef int nb = bins_x.shape[0]
     cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin_x = bins_x[n]
-        bin_y = bins_y[n]
-        bin_z = bins_z[n]
-        wval = wsource[n]
-        # Skip field value entries where the weight field is zero
-        if wval == 0:
-            continue
-        oldwr = wresult[bin_x, bin_y, bin_z]
-        wresult[bin_x,bin_y,bin_z] += wval
-        for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin_x,bin_y,bin_z,fi]
-            # qresult has to have the previous wresult
-            qresult[bin_x,bin_y,bin_z,fi] += \
-                oldwr * wval * bval_mresult * bval_mresult / \
-                (oldwr + wval)
-            bresult[bin_x,bin_y,bin_z,fi] += wval*bval
-            # mresult needs the new wresult
-            mresult[bin_x,bin_y,bin_z,fi] += wval * bval_mresult / \
-                 wresult[bin_x,bin_y,bin_z]
-        used[bin_x,bin_y,bin_z] = 1
+    if num_threads != 1:
+        _bin_profile_threaded(
+            (bins_x * wresult.shape[1] + bins_y) * wresult.shape[2] + bins_z,
+            wsource, bsource, wresult, bresult, mresult, qresult, used,
+            num_threads)
+        return
+    with nogil:
+        for n in range(nb):
+            bin_x = bins_x[n]
+            bin_y = bins_y[n]
+            bin_z = bins_z[n]
+            wval = wsource[n]
+            # Skip field value entries where the weight field is zero
+            if wval == 0:
+                continue
+            oldwr = wresult[bin_x, bin_y, bin_z]
+            wresult[bin_x,bin_y,bin_z] += wval
+            for fi in range(nf):
+                bval = bsource[n,fi]
+                bval_mresult = bval - mresult[bin_x,bin_y,bin_z,fi]
+                # qresult has to have the previous wresult
+                qresult[bin_x,bin_y,bin_z,fi] += \
+                    oldwr * wval * bval_mresult * bval_mresult / \
+                    (oldwr + wval)
+                bresult[bin_x,bin_y,bin_z,fi] += wval*bval
+                # mresult needs the new wresult
+                mresult[bin_x,bin_y,bin_z,fi] += wval * bval_mresult / \
+                     wresult[bin_x,bin_y,bin_z]
+            used[bin_x,bin_y,bin_z] = 1
+    return
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def _bin_profile_threaded(np.ndarray[np.intp_t, ndim=1] bins,
+                          np.ndarray[np.float64_t, ndim=1] wsource,
+                          np.ndarray[np.float64_t, ndim=2] bsource,
+                          np.ndarray wresult_nd,
+                          np.ndarray bresult_nd,
+                          np.ndarray mresult_nd,
+                          np.ndarray qresult_nd,
+                          np.ndarray used_nd,
+                          int num_threads):
+    # Bin the values like new_bin_profile1d, but with several threads. Each
+    # thread bins a contiguous part of the values in its own accumulators,
+    # which are then merged into the results. The results of the 2D and 3D
+    # profiles are binned through their flattened views, with the flattened
+    # bin indices.
+    cdef int nf = bsource.shape[1]
+    cdef int nbins = wresult_nd.size
+    for arr in (wresult_nd, bresult_nd, mresult_nd, qresult_nd, used_nd):
+        if not arr.flags.c_contiguous:
+            raise ValueError("The profile results have to be contiguous.")
+    cdef np.float64_t[:] wresult = wresult_nd.reshape(nbins)
+    cdef np.float64_t[:, :] bresult = bresult_nd.reshape(nbins, nf)
+    cdef np.float64_t[:, :] mresult = mresult_nd.reshape(nbins, nf)
+    cdef np.float64_t[:, :] qresult = qresult_nd.reshape(nbins, nf)
+    cdef np.uint8_t[:] used = used_nd.reshape(nbins).view("uint8")
+    if num_threads <= 0:
+        num_threads = os.cpu_count() or 1
+    cdef np.float64_t[:, :] lw = np.zeros((num_threads, nbins), dtype="float64")
+    cdef np.float64_t[:, :, :] lb = np.zeros((num_threads, nbins, nf),
+                                             dtype="float64")
+    cdef np.float64_t[:, :, :] lm = np.zeros((num_threads, nbins, nf),
+                                             dtype="float64")
+    cdef np.float64_t[:, :, :] lq = np.zeros((num_threads, nbins, nf),
+                                             dtype="float64")
+    cdef np.uint8_t[:, :] lused = np.zeros((num_threads, nbins), dtype="uint8")
+    cdef np.intp_t[:] bins_v = bins
+    cdef np.float64_t[:] wsource_v = wsource
+    cdef np.float64_t[:, :] bsource_v = bsource
+    cdef Py_ssize_t n, nb = bins.shape[0]
+    cdef int t, fi, bin
+    cdef np.float64_t wval, bval, oldwr, bval_mresult, wtot, delta
+    with nogil, parallel(num_threads=num_threads):
+        t = threadid()
+        for n in prange(nb, schedule="static"):
+            bin = bins_v[n]
+            wval = wsource_v[n]
+            # Skip field value entries where the weight field is zero
+            if wval == 0:
+                continue
+            oldwr = lw[t, bin]
+            lw[t, bin] += wval
+            for fi in range(nf):
+                bval = bsource_v[n, fi]
+                bval_mresult = bval - lm[t, bin, fi]
+                # lq has to have the previous lw
+                lq[t, bin, fi] += oldwr * wval * bval_mresult * bval_mresult / \
+                    (oldwr + wval)
+                lb[t, bin, fi] += wval * bval
+                # lm needs the new lw
+                lm[t, bin, fi] += wval * bval_mresult / lw[t, bin]
+            lused[t, bin] = 1
+    # Merge the accumulators of the threads, in order. For two sets of values
+    # with total weights w1 and w2, means m1 and m2, and weighted sums of the
+    # squared deviations q1 and q2, the combined values are
+    # m12 = m1 + (m2 - m1) * w2 / (w1 + w2)
+    # q12 = q1 + q2 + (m2 - m1)**2 * w1 * w2 / (w1 + w2)
+    with nogil:
+        for t in range(num_threads):
+            for bin in range(nbins):
+                if lused[t, bin] == 0:
+                    continue
+                oldwr = wresult[bin]
+                wval = lw[t, bin]
+                wtot = oldwr + wval
+                wresult[bin] = wtot
+                for fi in range(nf):
+                    delta = lm[t, bin, fi] - mresult[bin, fi]
+                    qresult[bin, fi] += lq[t, bin, fi] + \
+                        delta * delta * oldwr * wval / wtot
+                    bresult[bin, fi] += lb[t, bin, fi]
+                    mresult[bin, fi] += delta * wval / wtot
+                used[bin] = 1
     return
 
 @cython.boundscheck(False)
@@ -987,6 +987,23 @@ cdef class SPHKernelInterpolationTable:
             ret[i] = self.interpolate(q2_vals[i])
         return np.array(ret)
 
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #include <omp.h>
+    #else
+    static int omp_get_max_threads(void) { return 1; }
+    #endif
+    """
+    int omp_get_max_threads() nogil
+
+def _get_num_threads(int num_threads):
+    # The number of threads the SPH kernels use. When it is not given, OpenMP
+    # decides as usual, from OMP_NUM_THREADS and the CPUs available to yt
+    if num_threads > 0:
+        return num_threads
+    return omp_get_max_threads()
+
 @cython.initializedcheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -1003,7 +1020,8 @@ def pixelize_sph_kernel_projection(
         kernel_name="cubic",
         weight_field=None,
         int check_period=1,
-        period=None):
+        period=None,
+        int num_threads=0):
 
     cdef np.intp_t xsize, ysize
     cdef np.float64_t x_min, x_max, y_min, y_max, prefactor_j
@@ -1044,7 +1062,8 @@ def pixelize_sph_kernel_projection(
         kernel_tables[kernel_name] = SPHKernelInterpolationTable(kernel_name)
     cdef SPHKernelInterpolationTable itab = kernel_tables[kernel_name]
 
-    with nogil, parallel():
+    num_threads = _get_num_threads(num_threads)
+    with nogil, parallel(num_threads=num_threads):
         # loop through every particle
         # NOTE: this loop can be quite time consuming. However it is easily
         # parallelizable in multiple ways, such as:
@@ -1154,6 +1173,201 @@ def pixelize_sph_kernel_projection(
         free(xiter)
         free(yiter)
 
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def pixelize_sph_kernel_projection_multi(
+        np.float64_t[:, :, :] buffs,
+        np.float64_t[:] posx,
+        np.float64_t[:] posy,
+        np.float64_t[:] hsml,
+        np.float64_t[:] pmass,
+        np.float64_t[:] pdens,
+        np.float64_t[:, :] quantities_to_smooth,
+        bounds,
+        kernel_name="cubic",
+        weight_field=None,
+        weight_buff=None,
+        int check_period=1,
+        period=None,
+        int num_threads=0):
+    """
+    Project several quantities with the SPH kernel in a single pass over the
+    particles, as pixelize_sph_kernel_projection does for one quantity.
+
+    The quantity quantities_to_smooth[:, k] is deposited into buffs[k]. If
+    weight_field is given, the quantities are multiplied by it, and it is
+    also deposited into weight_buff when this is given, so that the weighted
+    projections can be normalized. The kernel is evaluated once for each
+    pixel a particle contributes to, and used for all the buffers.
+    """
+
+    cdef np.intp_t xsize, ysize, npix
+    cdef np.float64_t x_min, x_max, y_min, y_max, prefactor_j, kern
+    cdef np.int64_t xi, yi, x0, x1, y0, y1, xxi, yyi
+    cdef np.float64_t q_ij2, posx_diff, posy_diff, ih_j2
+    cdef np.float64_t x, y, dx, dy, idx, idy, h_j2, px, py
+    cdef np.float64_t period_x = 0, period_y = 0
+    cdef int i, j, k, kk, ii, jj, nfields, nbuffs
+    cdef int use_weight = 0
+    cdef np.float64_t[:] _weight_field
+    cdef np.float64_t[:, :] _weight_buff
+    cdef int * xiter
+    cdef int * yiter
+    cdef np.float64_t * xiterv
+    cdef np.float64_t * yiterv
+    cdef np.float64_t * local_buff
+    cdef np.float64_t * prefactors
+
+    nfields = quantities_to_smooth.shape[1]
+    if buffs.shape[0] != nfields:
+        raise ValueError(
+            "Expected %s buffers, got %s" % (nfields, buffs.shape[0]))
+    nbuffs = nfields
+    if weight_field is not None:
+        _weight_field = weight_field
+        use_weight = 1
+        if weight_buff is not None:
+            _weight_buff = weight_buff
+            # The weight is deposited as one more quantity
+            nbuffs = nfields + 1
+
+    if period is not None:
+        period_x = period[0]
+        period_y = period[1]
+
+    xsize, ysize = buffs.shape[1], buffs.shape[2]
+    npix = xsize * ysize
+    x_min = bounds[0]
+    x_max = bounds[1]
+    y_min = bounds[2]
+    y_max = bounds[3]
+
+    dx = (x_max - x_min) / xsize
+    dy = (y_max - y_min) / ysize
+
+    idx = 1.0/dx
+    idy = 1.0/dy
+
+    if kernel_name not in kernel_tables:
+        kernel_tables[kernel_name] = SPHKernelInterpolationTable(kernel_name)
+    cdef SPHKernelInterpolationTable itab = kernel_tables[kernel_name]
+
+    num_threads = _get_num_threads(num_threads)
+    with nogil, parallel(num_threads=num_threads):
+        # The particles are processed by several threads, each of which
+        # deposits them into its own buffers, as in
+        # pixelize_sph_kernel_projection
+        local_buff = <np.float64_t *> malloc(sizeof(np.float64_t) * npix * nbuffs)
+        prefactors = <np.float64_t *> malloc(sizeof(np.float64_t) * nbuffs)
+        xiterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
+        yiterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
+        xiter = <int *> malloc(sizeof(int) * 2)
+        yiter = <int *> malloc(sizeof(int) * 2)
+        xiter[0] = yiter[0] = 0
+        xiterv[0] = yiterv[0] = 0.0
+        for i in range(npix * nbuffs):
+            local_buff[i] = 0.0
+
+        for j in prange(0, posx.shape[0], schedule="dynamic"):
+            if j % 100000 == 0:
+                with gil:
+                    PyErr_CheckSignals()
+
+            xiter[1] = yiter[1] = 999
+
+            if check_period == 1:
+                if posx[j] - hsml[j] < x_min:
+                    xiter[1] = +1
+                    xiterv[1] = period_x
+                elif posx[j] + hsml[j] > x_max:
+                    xiter[1] = -1
+                    xiterv[1] = -period_x
+                if posy[j] - hsml[j] < y_min:
+                    yiter[1] = +1
+                    yiterv[1] = period_y
+                elif posy[j] + hsml[j] > y_max:
+                    yiter[1] = -1
+                    yiterv[1] = -period_y
+
+            # we set the smoothing length squared with lower limit of the pixel
+            h_j2 = fmax(hsml[j]*hsml[j], dx*dy)
+            ih_j2 = 1.0/h_j2
+
+            prefactor_j = pmass[j] / pdens[j] / hsml[j]**2
+            if use_weight == 1:
+                prefactor_j = prefactor_j * _weight_field[j]
+            for k in range(nfields):
+                prefactors[k] = prefactor_j * quantities_to_smooth[j, k]
+            if nbuffs > nfields:
+                prefactors[nfields] = prefactor_j
+
+            for ii in range(2):
+                if xiter[ii] == 999: continue
+                px = posx[j] + xiterv[ii]
+                if (px + hsml[j] < x_min) or (px - hsml[j] > x_max): continue
+                for jj in range(2):
+                    if yiter[jj] == 999: continue
+                    py = posy[j] + yiterv[jj]
+                    if (py + hsml[j] < y_min) or (py - hsml[j] > y_max): continue
+
+                    # here we find the pixels which this particle contributes to
+                    x0 = <np.int64_t> ((px - hsml[j] - x_min)*idx)
+                    x1 = <np.int64_t> ((px + hsml[j] - x_min)*idx)
+                    x0 = iclip(x0-1, 0, xsize)
+                    x1 = iclip(x1+1, 0, xsize)
+
+                    y0 = <np.int64_t> ((py - hsml[j] - y_min)*idy)
+                    y1 = <np.int64_t> ((py + hsml[j] - y_min)*idy)
+                    y0 = iclip(y0-1, 0, ysize)
+                    y1 = iclip(y1+1, 0, ysize)
+
+                    # found pixels we deposit on, loop through those pixels
+                    for xi in range(x0, x1):
+                        # we use the centre of the pixel to calculate contribution
+                        x = (xi + 0.5) * dx + x_min
+
+                        posx_diff = px - x
+                        posx_diff = posx_diff * posx_diff
+
+                        if posx_diff > h_j2: continue
+
+                        for yi in range(y0, y1):
+                            y = (yi + 0.5) * dy + y_min
+
+                            posy_diff = py - y
+                            posy_diff = posy_diff * posy_diff
+                            if posy_diff > h_j2: continue
+
+                            q_ij2 = (posx_diff + posy_diff) * ih_j2
+                            if q_ij2 >= 1:
+                                continue
+
+                            # the kernel projection is shared by all the
+                            # quantities
+                            kern = itab.interpolate(q_ij2)
+                            for k in range(nbuffs):
+                                local_buff[k*npix + xi + yi*xsize] += (
+                                    prefactors[k] * kern)
+
+        with gil:
+            for kk in range(nfields):
+                for xxi in range(xsize):
+                    for yyi in range(ysize):
+                        buffs[kk, xxi, yyi] += local_buff[kk*npix + xxi + yyi*xsize]
+            if nbuffs > nfields:
+                for xxi in range(xsize):
+                    for yyi in range(ysize):
+                        _weight_buff[xxi, yyi] += (
+                            local_buff[nfields*npix + xxi + yyi*xsize])
+        free(local_buff)
+        free(prefactors)
+        free(xiterv)
+        free(yiterv)
+        free(xiter)
+        free(yiter)
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def interpolate_sph_positions_gather(np.float64_t[:] buff,
@@ -1330,7 +1544,8 @@ def pixelize_sph_kernel_slice(
         np.float64_t[:] quantity_to_smooth,
         bounds, kernel_name="cubic",
         int check_period=1,
-        period=None):
+        period=None,
+        int num_threads=0):
 
     # similar method to pixelize_sph_kernel_projection
     cdef np.intp_t xsize, ysize
@@ -1364,7 +1579,8 @@ def pixelize_sph_kernel_slice(
 
     kernel_func = get_kernel_func(kernel_name)
 
-    with nogil, parallel():
+    num_threads = _get_num_threads(num_threads)
+    with nogil, parallel(num_threads=num_threads):
         # NOTE see note in pixelize_sph_kernel_projection
         local_buff = <np.float64_t *> malloc(sizeof(np.float64_t) * xsize * ysize)
         xiterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
@@ -1469,7 +1685,8 @@ def pixelize_sph_kernel_arbitrary_grid(np.float64_t[:, :, :] buff,
         np.float64_t[:] pdens,
         np.float64_t[:] quantity_to_smooth,
         bounds, pbar=None, kernel_name="cubic",
-        int check_period=1, period=None):
+        int check_period=1, period=None,
+        int num_threads=0):
 
     cdef np.intp_t xsize, ysize, zsize
     cdef np.float64_t x_min, x_max, y_min, y_max, z_min, z_max, prefactor_j
@@ -1479,15 +1696,14 @@ def pixelize_sph_kernel_arbitrary_grid(np.float64_t[:, :, :] buff,
     cdef int index, i, j, k, ii, jj, kk
     cdef np.float64_t period_x = 0, period_y = 0, period_z = 0
 
-    cdef int xiter[2]
-    cdef int yiter[2]
-    cdef int ziter[2]
-    cdef np.float64_t xiterv[2]
-    cdef np.float64_t yiterv[2]
-    cdef np.float64_t ziterv[2]
-
-    xiter[0] = yiter[0] = ziter[0] = 0
-    xiterv[0] = yiterv[0] = ziterv[0] = 0.0
+    cdef np.int64_t xs, nslabs, slab_size, sx0, sx1
+    cdef np.float64_t sx_min, sx_max
+    cdef int * xiter
+    cdef int * yiter
+    cdef int * ziter
+    cdef np.float64_t * xiterv
+    cdef np.float64_t * yiterv
+    cdef np.float64_t * ziterv
 
     if period is not None:
         period_x = period[0]
@@ -1511,105 +1727,157 @@ def pixelize_sph_kernel_arbitrary_grid(np.float64_t[:, :, :] buff,
 
     kernel_func = get_kernel_func(kernel_name)
 
-    with nogil:
-        # TODO make this parallel without using too much memory
-        for j in range(0, posx.shape[0]):
-            if j % 50000 == 0:
-                with gil:
-                    if(pbar is not None):
-                        pbar.update(50000)
-                    PyErr_CheckSignals()
-
-            xiter[1] = yiter[1] = ziter[1] = 999
-            xiterv[1] = yiterv[1] = ziterv[1] = 0.0
-
-            if check_period == 1:
-                if posx[j] - hsml[j] < x_min:
-                    xiter[1] = +1
-                    xiterv[1] = period_x
-                elif posx[j] + hsml[j] > x_max:
-                    xiter[1] = -1
-                    xiterv[1] = -period_x
-                if posy[j] - hsml[j] < y_min:
-                    yiter[1] = +1
-                    yiterv[1] = period_y
-                elif posy[j] + hsml[j] > y_max:
-                    yiter[1] = -1
-                    yiterv[1] = -period_y
-                if posz[j] - hsml[j] < z_min:
-                    ziter[1] = +1
-                    ziterv[1] = period_z
-                elif posz[j] + hsml[j] > z_max:
-                    ziter[1] = -1
-                    ziterv[1] = -period_z
-
-            h_j3 = fmax(hsml[j]*hsml[j]*hsml[j], dx*dy*dz)
-            h_j = math.cbrt(h_j3)
-            h_j2 = h_j*h_j
-            ih_j = 1/h_j
-
-            prefactor_j = pmass[j] / pdens[j] / hsml[j]**3 * quantity_to_smooth[j]
+    # Giving each thread its own copy of the grid would take too much memory,
+    # so the grid is instead split into slabs along x, each of which is filled
+    # by a single thread from all the particles overlapping it. The voxels
+    # therefore get the contributions of the particles in the same order
+    # whatever the number of threads, and the slabs are small enough to keep
+    # the threads busy.
+    num_threads = _get_num_threads(num_threads)
+    nslabs = min(xsize, 4 * num_threads) if num_threads > 1 else 1
+    slab_size = (xsize + nslabs - 1) // nslabs
+    nslabs = (xsize + slab_size - 1) // slab_size
+
+    with nogil, parallel(num_threads=num_threads):
+        xiterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
+        yiterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
+        ziterv = <np.float64_t *> malloc(sizeof(np.float64_t) * 2)
+        xiter = <int *> malloc(sizeof(int) * 2)
+        yiter = <int *> malloc(sizeof(int) * 2)
+        ziter = <int *> malloc(sizeof(int) * 2)
+        xiter[0] = yiter[0] = ziter[0] = 0
+        xiterv[0] = yiterv[0] = ziterv[0] = 0.0
+
+        for xs in prange(nslabs, schedule="dynamic"):
+            sx0 = xs * slab_size
+            sx1 = min(sx0 + slab_size, xsize)
+            # The extent of the slab, with a margin of a voxel on each side
+            sx_min = x_min + (sx0 - 1) * dx
+            sx_max = x_min + (sx1 + 1) * dx
+            for j in range(0, posx.shape[0]):
+                # The progress is followed on the first slab
+                if xs == 0 and j % 50000 == 0:
+                    with gil:
+                        if(pbar is not None):
+                            pbar.update(50000)
+                        PyErr_CheckSignals()
+
+                # Skip the particles that do not overlap the slab, or whose
+                # periodic images do not, before doing anything else
+                if nslabs > 1 and (
+                        posx[j] + hsml[j] < sx_min or posx[j] - hsml[j] > sx_max):
+                    if check_period != 1:
+                        continue
+                    if ((posx[j] + period_x + hsml[j] < sx_min or
+                         posx[j] + period_x - hsml[j] > sx_max) and
+                        (posx[j] - period_x + hsml[j] < sx_min or
+                         posx[j] - period_x - hsml[j] > sx_max)):
+                        continue
 
-            for ii in range(2):
-                if xiter[ii] == 999: continue
-                px = posx[j] + xiterv[ii]
-                if (px + hsml[j] < x_min) or (px - hsml[j] > x_max): continue
-                for jj in range(2):
-                    if yiter[jj] == 999: continue
-                    py = posy[j] + yiterv[jj]
-                    if (py + hsml[j] < y_min) or (py - hsml[j] > y_max): continue
-                    for kk in range(2):
-                        if ziter[kk] == 999: continue
-                        pz = posz[j] + ziterv[kk]
-                        if (pz + hsml[j] < z_min) or (pz - hsml[j] > z_max): continue
-
-                        x0 = <np.int64_t> ( (px - hsml[j] - x_min) * idx)
-                        x1 = <np.int64_t> ( (px + hsml[j] - x_min) * idx)
-                        x0 = iclip(x0-1, 0, xsize)
-                        x1 = iclip(x1+1, 0, xsize)
-
-                        y0 = <np.int64_t> ( (py - hsml[j] - y_min) * idy)
-                        y1 = <np.int64_t> ( (py + hsml[j] - y_min) * idy)
-                        y0 = iclip(y0-1, 0, ysize)
-                        y1 = iclip(y1+1, 0, ysize)
-
-                        z0 = <np.int64_t> ( (pz - hsml[j] - z_min) * idz)
-                        z1 = <np.int64_t> ( (pz + hsml[j] - z_min) * idz)
-                        z0 = iclip(z0-1, 0, zsize)
-                        z1 = iclip(z1+1, 0, zsize)
-
-                        # Now we know which voxels to deposit onto for this particle,
-                        # so loop over them and add this particle's contribution
-                        for xi in range(x0, x1):
-                            x = (xi + 0.5) * dx + x_min
-
-                            posx_diff = px - x
-                            posx_diff = posx_diff * posx_diff
-                            if posx_diff > h_j2:
+                xiter[1] = yiter[1] = ziter[1] = 999
+                xiterv[1] = yiterv[1] = ziterv[1] = 0.0
+
+                if check_period == 1:
+                    if posx[j] - hsml[j] < x_min:
+                        xiter[1] = +1
+                        xiterv[1] = period_x
+                    elif posx[j] + hsml[j] > x_max:
+                        xiter[1] = -1
+                        xiterv[1] = -period_x
+                    if posy[j] - hsml[j] < y_min:
+                        yiter[1] = +1
+                        yiterv[1] = period_y
+                    elif posy[j] + hsml[j] > y_max:
+                        yiter[1] = -1
+                        yiterv[1] = -period_y
+                    if posz[j] - hsml[j] < z_min:
+                        ziter[1] = +1
+                        ziterv[1] = period_z
+                    elif posz[j] + hsml[j] > z_max:
+                        ziter[1] = -1
+                        ziterv[1] = -period_z
+
+                h_j3 = fmax(hsml[j]*hsml[j]*hsml[j], dx*dy*dz)
+                h_j = math.cbrt(h_j3)
+                h_j2 = h_j*h_j
+                ih_j = 1/h_j
+
+                prefactor_j = pmass[j] / pdens[j] / hsml[j]**3 * quantity_to_smooth[j]
+
+                for ii in range(2):
+                    if xiter[ii] == 999: continue
+                    px = posx[j] + xiterv[ii]
+                    if (px + hsml[j] < x_min) or (px - hsml[j] > x_max): continue
+
+                    # Only the voxels of this slab are filled here
+                    x0 = <np.int64_t> ( (px - hsml[j] - x_min) * idx)
+                    x1 = <np.int64_t> ( (px + hsml[j] - x_min) * idx)
+                    x0 = iclip(x0-1, sx0, sx1)
+                    x1 = iclip(x1+1, sx0, sx1)
+                    if x0 >= x1: continue
+
+                    for jj in range(2):
+                        if yiter[jj] == 999: continue
+                        py = posy[j] + yiterv[jj]
+                        if (py + hsml[j] < y_min) or (py - hsml[j] > y_max): continue
+                        for kk in range(2):
+                            if ziter[kk] == 999: continue
+                            pz = posz[j] + ziterv[kk]
+                            if (pz + hsml[j] < z_min) or (pz - hsml[j] > z_max):
                                 continue
 
-                            for yi in range(y0, y1):
-                                y = (yi + 0.5) * dy + y_min
-
-                                posy_diff = py - y
-                                posy_diff = posy_diff * posy_diff
-                                if posy_diff > h_j2:
+                            y0 = <np.int64_t> ( (py - hsml[j] - y_min) * idy)
+                            y1 = <np.int64_t> ( (py + hsml[j] - y_min) * idy)
+                            y0 = iclip(y0-1, 0, ysize)
+                            y1 = iclip(y1+1, 0, ysize)
+
+                            z0 = <np.int64_t> ( (pz - hsml[j] - z_min) * idz)
+                            z1 = <np.int64_t> ( (pz + hsml[j] - z_min) * idz)
+                            z0 = iclip(z0-1, 0, zsize)
+                            z1 = iclip(z1+1, 0, zsize)
+
+                            # Now we know which voxels to deposit onto for this
+                            # particle, so loop over them and add this
+                            # particle's contribution
+                            for xi in range(x0, x1):
+                                x = (xi + 0.5) * dx + x_min
+
+                                posx_diff = px - x
+                                posx_diff = posx_diff * posx_diff
+                                if posx_diff > h_j2:
                                     continue
 
-                                for zi in range(z0, z1):
-                                    z = (zi + 0.5) * dz + z_min
+                                for yi in range(y0, y1):
+                                    y = (yi + 0.5) * dy + y_min
 
-                                    posz_diff = pz - z
-                                    posz_diff = posz_diff * posz_diff
-                                    if posz_diff > h_j2:
+                                    posy_diff = py - y
+                                    posy_diff = posy_diff * posy_diff
+                                    if posy_diff > h_j2:
                                         continue
 
-                                    # see equation 4 of the SPLASH paper
-                                    q_ij = math.sqrt(posx_diff + posy_diff + posz_diff) * ih_j
-                                    if q_ij >= 1:
-                                        continue
+                                    for zi in range(z0, z1):
+                                        z = (zi + 0.5) * dz + z_min
 
-                                    buff[xi, yi, zi] += prefactor_j * kernel_func(q_ij)
+                                        posz_diff = pz - z
+                                        posz_diff = posz_diff * posz_diff
+                                        if posz_diff > h_j2:
+                                            continue
+
+                                        # see equation 4 of the SPLASH paper
+                                        q_ij = math.sqrt(posx_diff + posy_diff +
+                                                         posz_diff) * ih_j
+                                        if q_ij >= 1:
+                                            continue
+
+                                        buff[xi, yi, zi] += (
+                                            prefactor_j * kernel_func(q_ij))
+
+        free(xiterv)
+        free(yiterv)
+        free(ziterv)
+        free(xiter)
+        free(yiter)
+        free(ziter)
 
 
 def pixelize_element_mesh_line(np.ndarray[np.float64_t, ndim=2] coords,
@@ -1732,7 +2000,8 @@ def off_axis_projection_SPH(np.float64_t[:] px,
                             np.float64_t[:, :] projection_array,
                             normal_vector,
                             north_vector,
-                            weight_field=None):
+                            weight_field=None,
+                            int num_threads=0):
     # Do nothing in event of a 0 normal vector
     if np.allclose(normal_vector, np.array([0., 0., 0.]), rtol=1e-09):
         return
@@ -1742,6 +2011,7 @@ def off_axis_projection_SPH(np.float64_t[:] px,
     # another rotation to make the north-vector be the y-axis (i.e., north).
     # Fortunately, total_rotation_matrix = rotation_matrix_1 x rotation_matrix_2
     cdef int num_particles = np.size(px)
+    cdef int i
     cdef np.float64_t[:] z_axis = np.array([0., 0., 1.], dtype='float_')
     cdef np.float64_t[:] y_axis = np.array([0., 1., 0.], dtype='float_')
     cdef np.float64_t[:, :] normal_rotation_matrix
@@ -1756,8 +2026,6 @@ def off_axis_projection_SPH(np.float64_t[:] px,
 
     cdef np.float64_t[:] px_rotated = np.empty(num_particles, dtype='float_')
     cdef np.float64_t[:] py_rotated = np.empty(num_particles, dtype='float_')
-    cdef np.float64_t[:] coordinate_matrix = np.empty(3, dtype='float_')
-    cdef np.float64_t[:] rotated_coordinates
     cdef np.float64_t[:] rotated_center
     rotated_center = rotation_matmul(
         rotation_matrix, np.array([center[0], center[1], center[2]]))
@@ -1768,14 +2036,16 @@ def off_axis_projection_SPH(np.float64_t[:] px,
     cdef np.float64_t rot_bounds_y0 = rotated_center[1] - width[1] / 2
     cdef np.float64_t rot_bounds_y1 = rotated_center[1] + width[1] / 2
 
-    for i in range(num_particles):
-        coordinate_matrix[0] = px[i]
-        coordinate_matrix[1] = py[i]
-        coordinate_matrix[2] = pz[i]
-        rotated_coordinates = rotation_matmul(
-            rotation_matrix, coordinate_matrix)
-        px_rotated[i] = rotated_coordinates[0]
-        py_rotated[i] = rotated_coordinates[1]
+    # The particles are rotated by several threads, as they are projected
+    num_threads = _get_num_threads(num_threads)
+    for i in prange(num_particles, nogil=True, schedule="static",
+                    num_threads=num_threads):
+        px_rotated[i] = (rotation_matrix[0, 0] * px[i] +
+                         rotation_matrix[0, 1] * py[i] +
+                         rotation_matrix[0, 2] * pz[i])
+        py_rotated[i] = (rotation_matrix[1, 0] * px[i] +
+                         rotation_matrix[1, 1] * py[i] +
+                         rotation_matrix[1, 2] * pz[i])
 
     pixelize_sph_kernel_projection(projection_array,
                                    px_rotated,
@@ -1787,7 +2057,8 @@ def off_axis_projection_SPH(np.float64_t[:] px,
                                    [rot_bounds_x0, rot_bounds_x1,
                                     rot_bounds_y0, rot_bounds_y1],
                                    weight_field=weight_field,
-                                   check_period=0)
+                                   check_period=0,
+                                   num_threads=num_threads)
 
 
 @cython.boundscheck(False)
@@ -555,6 +555,145 @@ def parallel_objects(objects, njobs=0, storage=None, barrier=True, dynamic=False
         my_communicator.barrier()
 
 
+def process_parallel_objects(objects, njobs=0, storage=None):
+    r"""This function dispatches components of an iterable to local processes,
+    without MPI.
+
+    Like :func:`parallel_objects`, this is iterated over by every process: the
+    processes are forked when the iteration starts, and each of them runs the
+    body of the loop for the objects it is dispatched. The objects are
+    dispatched to the processes as they become free, and the processes exit
+    when the objects run out, so that only the calling process goes on after
+    the loop. The results stored during the iteration are sent back to it, so
+    they need to be picklable.
+
+    The loop should not be exited early with ``break``, and nothing but the
+    stored results is sent back: the variables modified in the body of the
+    loop keep their values in the calling process. If the body of the loop
+    raises an exception in a process, the process exits, the results stored
+    by the processes are still sent back, and a RuntimeError naming the object
+    that was being processed is raised by the calling process after the loop.
+
+    Parameters
+    ----------
+    objects : Iterable
+        The list of objects to dispatch to different processes.
+    njobs : int
+        How many processes to fork.  By default, one process will be forked
+        for each available CPU.
+    storage : dict
+        This is a dictionary, which will be filled with results during the
+        course of the iteration.  The keys will be the object indices and the
+        values will be whatever is assigned to the *result* attribute on the
+        storage during iteration.
+
+    Examples
+    --------
+    >>> storage = {}
+    >>> for sto, c in process_parallel_objects(centers, njobs=4, storage=storage):
+    ...     sp = ds.sphere(c, (100, "kpc"))
+    ...     sto.result = sp.quantities["AngularMomentumVector"]()
+    ...
+    >>> for sphere_id, L in sorted(storage.items()):
+    ...     print(centers[sphere_id], L)
+    ...
+
+    """
+    import multiprocessing
+
+    objects = list(objects)
+    if njobs <= 0:
+        njobs = os.cpu_count()
+    njobs = min(njobs, len(objects))
+    if njobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for result_id, obj in enumerate(objects):
+            if storage is not None:
+                rstore = ResultsStorage()
+                rstore.result_id = result_id
+                yield rstore, obj
+                storage[rstore.result_id] = rstore.result
+            else:
+                yield obj
+        return
+
+    context = multiprocessing.get_context("fork")
+    next_id = context.Value("l", 0)
+    children = []
+    for _ in range(njobs):
+        recv_conn, send_conn = context.Pipe(duplex=False)
+        pid = os.fork()
+        if pid == 0:
+            recv_conn.close()
+            to_share = {}
+            result_id = None
+            completed = False
+            try:
+                while True:
+                    with next_id.get_lock():
+                        result_id = next_id.value
+                        next_id.value += 1
+                    if result_id >= len(objects):
+                        break
+                    if storage is not None:
+                        rstore = ResultsStorage()
+                        rstore.result_id = result_id
+                        yield rstore, objects[result_id]
+                        to_share[rstore.result_id] = rstore.result
+                    else:
+                        yield objects[result_id]
+                completed = True
+            finally:
+                # The forked process never goes past the loop. If the body of
+                # the loop raises an exception or is exited with a break, the
+                # generator is closed while the stack of the caller unwinds,
+                # so the process exits before any code after the loop runs.
+                if completed:
+                    _exit_forked_process(send_conn, True, to_share)
+                error = (
+                    "The body of the loop raised an exception or was exited "
+                    f"early while processing the object {result_id}."
+                )
+                _exit_forked_process(send_conn, False, to_share, error)
+        send_conn.close()
+        children.append((pid, recv_conn))
+
+    results = {}
+    failed = []
+    errors = []
+    for pid, recv_conn in children:
+        try:
+            completed, to_share, error = recv_conn.recv()
+        except EOFError:
+            completed, to_share, error = False, {}, None
+        recv_conn.close()
+        os.waitpid(pid, 0)
+        if not completed:
+            failed.append(pid)
+            if error is not None:
+                mylog.error("The process %s stopped with:\n%s", pid, error)
+                errors.append(error)
+        results.update(to_share)
+    # The results of the processes that stopped early are kept too
+    if storage is not None:
+        storage.update(results)
+    if failed:
+        raise RuntimeError(
+            f"The processes {failed} stopped before the end of the iteration."
+            + "".join(f"\n\n{error}" for error in errors)
+        )
+
+
+def _exit_forked_process(conn, completed, results, error=None):
+    # Send the results of a process forked by process_parallel_objects back to
+    # the calling process, and exit
+    try:
+        conn.send((completed, results, error))
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0 if completed else 1)
+
+
 def parallel_ring(objects, generator_func, mutable=False):
     r"""This function loops in a ring around a set of objects, yielding the
     results of generator_func and passing from one processor to another to
@@ -0,0 +1,35 @@
+import numpy as np
+
+from yt.testing import assert_equal
+from yt.utilities.io_handler import ArrayCache
+
+
+def test_array_cache():
+    cache = ArrayCache(3 * 80)
+    arrays = [np.full(10, i, dtype="float64") for i in range(4)]
+    for i, arr in enumerate(arrays[:3]):
+        cache.put(i, arr, arr.nbytes)
+    assert_equal(cache.size, 240)
+    # Accessing the first value makes the second one the least recently used
+    assert cache.get(0) is arrays[0]
+    cache.put(3, arrays[3], arrays[3].nbytes)
+    assert_equal(len(cache), 3)
+    assert cache.get(1) is None
+    for i in (0, 2, 3):
+        assert cache.get(i) is arrays[i]
+    assert_equal((cache.hits, cache.misses), (4, 1))
+    # Values larger than the cache are not stored
+    cache.put(4, np.zeros(40), 320)
+    assert cache.get(4) is None
+    cache.clear()
+    assert_equal((len(cache), cache.size), (0, 0))
+
+
+def test_array_cache_pop():
+    cache = ArrayCache(80)
+    arr = np.zeros(10)
+    cache.put("a", arr, arr.nbytes)
+    assert cache.pop("a") is arr
+    assert_equal((len(cache), cache.size), (0, 0))
+    assert cache.pop("a") is None
+    assert_equal((cache.hits, cache.misses), (1, 1))
@@ -8,7 +8,11 @@ from .fits_image import (
     FITSProjection,
     FITSSlice,
 )
-from .fixed_resolution import FixedResolutionBuffer, ParticleImageBuffer
+from .fixed_resolution import (
+    FixedResolutionBuffer,
+    ParticleImageBuffer,
+    TiledFixedResolutionBuffer,
+)
 from .image_writer import (
     apply_colormap,
     map_to_colors,
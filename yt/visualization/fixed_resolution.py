@@ -1,4 +1,9 @@
+import os
+import shutil
+import tempfile
 import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 import numpy as np
@@ -89,6 +94,15 @@ class FixedResolutionBuffer:
         ("index", "theta"),
         ("index", "dtheta"),
     )
+    # Whether the images of several fields are made together by the
+    # coordinate handler
+    _pixelize_together = True
+    # The number of threads used to pixelize the SPH fields, or 0 to use the
+    # num_threads configuration option
+    num_threads = 0
+    # The cache of the pixelized images, shared with the buffers of the other
+    # views of a plot, or None
+    _image_cache = None
 
     def __init__(self, data_source, bounds, buff_size, antialias=True, periodic=False):
         self.data_source = data_source
@@ -133,24 +147,117 @@ class FixedResolutionBuffer:
             self.buff_size[0],
             self.buff_size[1],
         )
+        buff = self._get_cached_image(item)
+        if buff is None:
+            buff = self.ds.coordinates.pixelize(
+                self.data_source.axis,
+                self.data_source,
+                item,
+                self._get_code_bounds(),
+                self.buff_size,
+                int(self.antialias),
+                num_threads=self.num_threads,
+            )
+            self._cache_image(item, buff)
+        return self._set_image(item, buff)
+
+    def _get_code_bounds(self):
         bounds = []
         for b in self.bounds:
             if hasattr(b, "in_units"):
                 b = float(b.in_units("code_length"))
             bounds.append(b)
+        return bounds
+
+    def _get_image_key(self, item):
+        # The view parameters the image of a field depends on. The filters
+        # are applied to the cached images, so they are not part of the key.
+        # The hash of a data object only covers its construction arguments,
+        # so the object it is restricted to, the projection method and the
+        # field parameters are added separately.
+        dobj = self.data_source
+        source = getattr(dobj, "data_source", None)
+        if source is None:
+            source = getattr(dobj, "_data_source", None)
+        if source is not None:
+            source = (source._hash, hash(source.selector))
+        field_parameters = tuple(
+            sorted((name, repr(value)) for name, value in dobj.field_parameters.items())
+        )
+        return (
+            self.ds._hash(),
+            dobj._hash,
+            source,
+            getattr(dobj, "method", None),
+            field_parameters,
+            dobj._determine_fields(item)[0],
+            tuple(self._get_code_bounds()),
+            self.buff_size,
+            bool(self.antialias),
+            bool(self.periodic),
+        )
 
-        buff = self.ds.coordinates.pixelize(
+    def _get_cached_image(self, item):
+        if self._image_cache is None:
+            return None
+        buff = self._image_cache.get(self._get_image_key(item))
+        if buff is None:
+            return None
+        mylog.debug("Reusing the cached image of (%s)", item)
+        # The images are converted to other units in place
+        return buff.copy()
+
+    def _cache_image(self, item, buff):
+        if self._image_cache is not None:
+            self._image_cache.put(self._get_image_key(item), buff.copy(), buff.nbytes)
+
+    def _get_fields(self, fields):
+        # Make the images of several fields, letting the coordinate handler
+        # share the work between them, for instance by projecting SPH fields
+        # together
+        fields = [field for field in fields if field not in self.data]
+        if self._pixelize_together and self._image_cache is not None:
+            missing = []
+            for field in fields:
+                buff = self._get_cached_image(field)
+                if buff is None:
+                    missing.append(field)
+                else:
+                    self._set_image(field, buff)
+            fields = missing
+        if not self._pixelize_together or len(fields) < 2:
+            for field in fields:
+                self[field]
+            return
+        mylog.info(
+            "Making fixed resolution buffers of (%s) %d by %d",
+            ", ".join(str(field) for field in fields),
+            self.buff_size[0],
+            self.buff_size[1],
+        )
+        buffs = self.ds.coordinates.pixelize_fields(
             self.data_source.axis,
             self.data_source,
-            item,
-            bounds,
+            fields,
+            self._get_code_bounds(),
             self.buff_size,
             int(self.antialias),
+            num_threads=self.num_threads,
         )
+        for field, buff in zip(fields, buffs):
+            self._cache_image(field, buff)
+            self._set_image(field, buff)
 
+    def _set_image(self, item, buff):
         for name, (args, kwargs) in self._filters:
             buff = filter_registry[name](*args[1:], **kwargs).apply(buff)
 
+        units = self._get_units(item)
+        ia = ImageArray(buff, units=units, info=self._get_info(item))
+        self.data[item] = ia
+        return self.data[item]
+
+    def _get_units(self, item):
         # FIXME FIXME FIXME we shouldn't need to do this for projections
         # but that will require fixing data object access for particle
         # projections
@@ -159,13 +266,9 @@ class FixedResolutionBuffer:
                 it = item.name
             else:
                 it = item
-            units = self.data_source._projected_units[it]
+            return self.data_source._projected_units[it]
         except (KeyError, AttributeError):
-            units = self.data_source[item].units
-
-        ia = ImageArray(buff, units=units, info=self._get_info(item))
-        self.data[item] = ia
-        return self.data[item]
+            return self.data_source[item].units
 
     def __setitem__(self, item, val):
         self.data[item] = val
@@ -174,9 +277,10 @@ class FixedResolutionBuffer:
         exclude = self.data_source._key_fields + list(self._exclude_fields)
         fields = getattr(self.data_source, "fields", [])
         fields += getattr(self.data_source, "field_data", {}).keys()
-        for f in fields:
-            if f not in exclude and f[0] not in self.data_source.ds.particle_types:
-                self[f]
+        particle_types = self.data_source.ds.particle_types
+        self._get_fields(
+            [f for f in fields if f not in exclude and f[0] not in particle_types]
+        )
 
     def _get_info(self, item):
         info = {}
@@ -539,6 +643,8 @@ class CylindricalFixedResolutionBuffer(FixedResolutionBuffer):
     that supports non-aligned input data objects, primarily cutting planes.
     """
 
+    _pixelize_together = False
+
     def __init__(self, data_source, radius, buff_size, antialias=True):
 
         self.data_source = data_source
@@ -576,6 +682,8 @@ class OffAxisProjectionFixedResolutionBuffer(FixedResolutionBuffer):
     that supports off axis projections.  This calls the volume renderer.
     """
 
+    _pixelize_together = False
+
     def __init__(self, data_source, bounds, buff_size, antialias=True, periodic=False):
         self.data = {}
         FixedResolutionBuffer.__init__(
@@ -611,6 +719,7 @@ class OffAxisProjectionFixedResolutionBuffer(FixedResolutionBuffer):
             no_ghost=dd.no_ghost,
             interpolated=dd.interpolated,
             north_vector=dd.north_vector,
+            num_threads=self.num_threads or None,
             method=dd.method,
         )
         ia = ImageArray(buff.swapaxes(0, 1), info=self._get_info(item))
@@ -628,6 +737,8 @@ class ParticleImageBuffer(FixedResolutionBuffer):
 
     """
 
+    _pixelize_together = False
+
     def __init__(self, data_source, bounds, buff_size, antialias=True, periodic=False):
         self.data = {}
         FixedResolutionBuffer.__init__(
@@ -772,3 +883,228 @@ class ParticleImageBuffer(FixedResolutionBuffer):
         for f in fields:
             if f not in exclude:
                 self[f]
+
+
+class TiledFixedResolutionBuffer(FixedResolutionBuffer):
+    r"""
+    TiledFixedResolutionBuffer(data_source, bounds, buff_size, tile_size=1024)
+
+    This object is a subclass of
+    :class:`yt.visualization.fixed_resolution.FixedResolutionBuffer`
+    that pixelizes its images tile by tile, so that images larger than the
+    memory can be made. Each image is written to a memory-mapped ``.npy``
+    file as its tiles are pixelized, and only the tiles being pixelized are
+    held in memory. The images can also be exported as a multi-resolution
+    pyramid of tiles, each level of which is pixelized directly from the data
+    source. Since the images are never held in memory as a whole, filters
+    such as ``apply_gauss_beam`` cannot be applied to them.
+
+    Parameters
+    ----------
+    data_source : :class:`yt.data_objects.construction_data_containers.YTQuadTreeProj`
+                   or :class:`yt.data_objects.selection_data_containers.YTSlice`
+        This is the source to be pixelized, which can be a projection or a
+        slice.
+    bounds : sequence of floats
+        Bounds are the min and max in the image plane that we want our
+        image to cover.  It's in the order of (xmin, xmax, ymin, ymax),
+        where the coordinates are all in the appropriate code units.
+    buff_size : sequence of ints
+        The size of the image to generate.
+    antialias : boolean
+        This can be true or false.  It determines whether or not sub-pixel
+        rendering is used during data deposition.
+    periodic : boolean
+        This can be true or false, and governs whether the pixelization
+        will span the domain boundaries.
+    tile_size : int
+        The size, in pixels, of the square tiles the images are pixelized by.
+    directory : string, optional
+        The directory the images are written to. By default, they are written
+        to a temporary directory, which is removed with the buffer.
+    num_workers : int
+        The number of threads pixelizing the tiles concurrently. This helps
+        when the pixelization releases the GIL, as it does for the grid data
+        of slices and projections.
+
+    Examples
+    --------
+    >>> proj = ds.proj(("gas", "density"), 2)
+    >>> frb = TiledFixedResolutionBuffer(proj, (0, 1, 0, 1), (32768, 32768))
+    >>> image = frb["gas", "density"]
+    >>> frb.export_tile_pyramid("density_tiles.h5", [("gas", "density")])
+    """
+    _pixelize_together = False
+
+    def __init__(
+        self,
+        data_source,
+        bounds,
+        buff_size,
+        antialias=True,
+        periodic=False,
+        tile_size=1024,
+        directory=None,
+        num_workers=1,
+    ):
+        FixedResolutionBuffer.__init__(
+            self, data_source, bounds, buff_size, antialias, periodic
+        )
+        self.tile_size = int(tile_size)
+        self.num_workers = num_workers
+        if directory is None:
+            # The temporary directory is removed with the buffer
+            directory = tempfile.mkdtemp(prefix="yt_frb_")
+            weakref.finalize(self, shutil.rmtree, directory, ignore_errors=True)
+        self.directory = directory
+
+    def __getitem__(self, item):
+        if item in self.data:
+            return self.data[item]
+        self._check_filters()
+        mylog.info(
+            "Making a tiled fixed resolution buffer of (%s) %d by %d",
+            item,
+            self.buff_size[0],
+            self.buff_size[1],
+        )
+        field = self.data_source._determine_fields(item)[0]
+        fname = os.path.join(self.directory, "{}_{}.npy".format(*field))
+        buff = np.lib.format.open_memmap(
+            fname,
+            mode="w+",
+            dtype="float64",
+            shape=(self.buff_size[1], self.buff_size[0]),
+        )
+        self._pixelize_tiles(item, buff, self.buff_size)
+        buff.flush()
+        return self._set_image(item, buff)
+
+    def _check_filters(self):
+        # The filters act on whole images
+        if self._filters:
+            raise ValueError(
+                "Filters cannot be applied to the images of a "
+                "TiledFixedResolutionBuffer, since they act on whole images. "
+                "Use a FixedResolutionBuffer to filter the images."
+            )
+
+    def _get_tiles(self, buff_size):
+        # The pixels and bounds of the tiles of an image of size buff_size.
+        # The tiles share the pixel edges of the whole image.
+        x0, x1, y0, y1 = self._get_code_bounds()
+        nx, ny = buff_size
+        dx = (x1 - x0) / nx
+        dy = (y1 - y0) / ny
+        for j0 in range(0, ny, self.tile_size):
+            j1 = min(j0 + self.tile_size, ny)
+            for i0 in range(0, nx, self.tile_size):
+                i1 = min(i0 + self.tile_size, nx)
+                bounds = (x0 + i0 * dx, x0 + i1 * dx, y0 + j0 * dy, y0 + j1 * dy)
+                yield (slice(j0, j1), slice(i0, i1)), bounds, (i1 - i0, j1 - j0)
+
+    def _pixelize_tile(self, item, bounds, size):
+        return self.ds.coordinates.pixelize(
+            self.data_source.axis,
+            self.data_source,
+            item,
+            list(bounds),
+            size,
+            int(self.antialias),
+            num_threads=self.num_threads,
+        )
+
+    def _pixelize_tiles(self, item, buff, buff_size):
+        # Pixelize an image of size buff_size tile by tile into buff, which
+        # can be a memory-mapped array or an HDF5 dataset. The first tile is
+        # pixelized on its own, so that the data it needs is read before the
+        # other tiles are pixelized concurrently. At most num_workers + 1
+        # tiles are kept in memory at any time.
+        tiles = self._get_tiles(buff_size)
+        index, bounds, size = next(tiles)
+        buff[index] = self._pixelize_tile(item, bounds, size)
+        if self.num_workers <= 1:
+            for index, bounds, size in tiles:
+                buff[index] = self._pixelize_tile(item, bounds, size)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as pool:
+            futures = deque()
+            for index, bounds, size in tiles:
+                futures.append(
+                    (index, pool.submit(self._pixelize_tile, item, bounds, size))
+                )
+                if len(futures) > self.num_workers:
+                    index, future = futures.popleft()
+                    buff[index] = future.result()
+            while futures:
+                index, future = futures.popleft()
+                buff[index] = future.result()
+
+    def get_pyramid_sizes(self):
+        r"""Return the sizes of the images of each level of the tile pyramid.
+
+        The last level has the size of the buffer, and the size of each of
+        the other levels is half that of the next one, down to the first
+        level, which fits in a single tile.
+        """
+        sizes = [self.buff_size]
+        while max(sizes[0]) > self.tile_size:
+            nx, ny = sizes[0]
+            sizes.insert(0, ((nx + 1) // 2, (ny + 1) // 2))
+        return sizes
+
+    def export_tile_pyramid(self, filename, fields=None):
+        r"""Export the images of a set of fields as multi-resolution tile
+        pyramids in an HDF5 file.
+
+        The pyramid of each field is written to the ``ftype/fname`` group of
+        the file, with one dataset for each level, chunked by tile and named
+        after the level. The first level fits in a single tile, and the size
+        of each of the following levels doubles, up to the size of the buffer
+        (see :meth:`get_pyramid_sizes`). Each level is pixelized directly
+        from the data source, tile by tile, rather than downsampled from the
+        next one.
+
+        Parameters
+        ----------
+        filename : string
+            This file will be opened in "append" mode.
+        fields : list of fields, optional
+            The fields to export. If None, the fields of the buffer are
+            exported.
+        """
+        self._check_filters()
+        if fields is None:
+            fields = list(self.data.keys())
+        else:
+            fields = list(iter_fields(fields))
+        sizes = self.get_pyramid_sizes()
+        with h5py.File(filename, mode="a") as f:
+            for item in fields:
+                ftype, fname = self.data_source._determine_fields(item)[0]
+                group = f.require_group(ftype).require_group(fname)
+                for level, size in enumerate(sizes):
+                    mylog.info(
+                        "Making level %d of the tile pyramid of (%s) %d by %d",
+                        level,
+                        item,
+                        size[0],
+                        size[1],
+                    )
+                    shape = (size[1], size[0])
+                    buff = group.create_dataset(
+                        str(level),
+                        shape=shape,
+                        dtype="float64",
+                        chunks=tuple(min(self.tile_size, n) for n in shape),
+                    )
+                    if size == self.buff_size and item in self.data:
+                        for index, _, _ in self._get_tiles(size):
+                            buff[index] = self.data[item][index].d
+                    else:
+                        self._pixelize_tiles(item, buff, size)
+                group.attrs["units"] = str(self._get_units(item))
+                group.attrs["bounds"] = self._get_code_bounds()
+                group.attrs["tile_size"] = self.tile_size
+                group.attrs["levels"] = len(sizes)
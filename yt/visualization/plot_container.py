@@ -376,6 +376,9 @@ class PlotContainer(abc.ABC):
     def _switch_ds(self, new_ds, data_source=None):
         old_object = self.data_source
         name = old_object._type_name
+        if name == "quad_proj":
+            # Projections are created with Dataset.proj
+            name = "proj"
         kwargs = {n: getattr(old_object, n) for n in old_object._con_args}
         kwargs["center"] = getattr(old_object, "center", None)
         if data_source is not None:
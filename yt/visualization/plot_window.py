@@ -1,4 +1,5 @@
 import abc
+import builtins
 from collections import defaultdict
 from functools import wraps
 from numbers import Number
@@ -17,7 +18,15 @@ from yt._maintenance.deprecation import issue_deprecation_warning
 from yt.config import ytcfg
 from yt.data_objects.image_array import ImageArray
 from yt.frontends.ytdata.data_structures import YTSpatialPlotDataset
-from yt.funcs import fix_axis, fix_unitary, is_sequence, iter_fields, mylog, obj_length
+from yt.funcs import (
+    fix_axis,
+    fix_unitary,
+    get_interactivity,
+    is_sequence,
+    iter_fields,
+    mylog,
+    obj_length,
+)
 from yt.units.unit_object import Unit  # type: ignore
 from yt.units.unit_registry import UnitParseError  # type: ignore
 from yt.units.yt_array import YTArray, YTQuantity
@@ -29,6 +38,7 @@ from yt.utilities.exceptions import (
     YTUnitNotRecognized,
     YTUnsupportedPlotCallback,
 )
+from yt.utilities.io_handler import ArrayCache
 from yt.utilities.math_utils import ortho_find
 from yt.utilities.orientation import Orientation
 
@@ -203,6 +213,13 @@ class PlotWindow(ImagePlotContainer):
         self._equivalencies = defaultdict(lambda: (None, {}))
         self.buff_size = buff_size
         self.antialias = antialias
+        self.num_threads = 0
+        self.preview_factor = None
+        # The images of the previous views, reused when they are shown again
+        self._frb_cache = None
+        max_size = int(ytcfg.get("yt", "frb_cache_size") * 1024**2)
+        if max_size > 0:
+            self._frb_cache = ArrayCache(max_size)
         self._axes_unit_names = None
         self._transform = None
         self._projection = None
@@ -301,6 +318,8 @@ class PlotWindow(ImagePlotContainer):
             self.antialias,
             periodic=self._periodic,
         )
+        self._frb.num_threads = self.num_threads
+        self._frb._image_cache = self._frb_cache
 
         # At this point the frb has the valid bounds, size, aliasing, etc.
         if old_fields is None:
@@ -750,6 +769,76 @@ class PlotWindow(ImagePlotContainer):
         """
         self.antialias = aa
 
+    @invalidate_data
+    def set_num_threads(self, num_threads):
+        """Sets the number of threads used to pixelize the SPH fields
+
+        parameters
+        ----------
+        num_threads : int
+            The number of threads, or 0 to use the num_threads
+            configuration option.
+        """
+        self.num_threads = num_threads
+
+    def set_progressive(self, preview_factor=8):
+        """Show a low resolution preview of the plots in the notebook
+        before the full resolution plots
+
+        When the data of the plots have changed, for instance after a zoom
+        or a pan, ``show`` first displays plots made from a buffer
+        ``preview_factor`` times smaller than the buffer size, without
+        antialiasing, and replaces them with the full resolution plots once
+        they are made.
+
+        parameters
+        ----------
+        preview_factor : int or None
+            The ratio of the buffer size to the size of the buffer of the
+            preview, or None to turn off the preview.
+        """
+        self.preview_factor = preview_factor
+        return self
+
+    def _get_preview(self):
+        # The html representation of the plots made from a low resolution
+        # buffer. The data are left invalid, so that the full resolution
+        # buffer is made next.
+        buff_size, antialias = self.buff_size, self.antialias
+        self.buff_size = tuple(max(1, n // self.preview_factor) for n in buff_size)
+        self.antialias = False
+        try:
+            self._recreate_frb()
+            self._plot_valid = False
+            self._setup_plots()
+            return self._repr_html_()
+        finally:
+            self.buff_size, self.antialias = buff_size, antialias
+            self._data_valid = self._plot_valid = False
+
+    def show(self):
+        r"""This will send any existing plots to the IPython notebook.
+
+        If a preview factor was set with ``set_progressive`` and the data of
+        the plots have changed, a low resolution preview of the plots is
+        displayed first, and then replaced with the full resolution plots.
+        See :meth:`~yt.visualization.plot_container.PlotContainer.show`.
+        """
+        if (
+            self.preview_factor is None
+            or self._data_valid
+            or get_interactivity()
+            or "__IPYTHON__" not in dir(builtins)
+        ):
+            return super().show()
+        from IPython.display import HTML, display
+
+        handle = display(HTML(self._get_preview()), display_id=True)
+        if handle is None:
+            display(self)
+        else:
+            handle.update(self)
+
     @invalidate_data
     def set_buff_size(self, size):
         """Sets a new buffer size for the fixed resolution buffer
@@ -972,7 +1061,11 @@ class PWViewerMPL(PlotWindow):
             self._recreate_frb()
             self._data_valid = True
         self._colorbar_valid = True
-        for f in list(set(self.data_source._determine_fields(self.fields))):
+        fields = list(set(self.data_source._determine_fields(self.fields)))
+        # Make the images of all the fields at once, so that their
+        # pixelization can share the reads and the work
+        self.frb._get_fields(fields)
+        for f in fields:
             axis_index = self.data_source.axis
 
             xc, yc = self._setup_origin()
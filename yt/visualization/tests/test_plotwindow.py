@@ -7,6 +7,7 @@ from collections import OrderedDict
 import numpy as np
 from nose.tools import assert_true
 
+from yt.config import ytcfg
 from yt.loaders import load_uniform_grid
 from yt.testing import (
     assert_array_almost_equal,
@@ -804,3 +805,60 @@ def test_dispatch_plot_classes():
     assert isinstance(p2, OffAxisProjectionPlot)
     assert isinstance(s1, AxisAlignedSlicePlot)
     assert isinstance(s2, OffAxisSlicePlot)
+
+
+def test_frb_cache():
+    ds = fake_random_ds(32, fields=("density", "temperature"), units=("g/cm**3", "K"))
+    fields = [("gas", "density"), ("gas", "temperature")]
+    old_size = ytcfg.get("yt", "frb_cache_size")
+    ytcfg["yt", "frb_cache_size"] = 10
+    try:
+        plot = ProjectionPlot(ds, "z", fields, buff_size=(100, 100))
+    finally:
+        ytcfg["yt", "frb_cache_size"] = old_size
+    ref = {field: plot.frb[field].copy() for field in fields}
+    plot.set_unit(("gas", "density"), "kg/m**2")
+    cache = plot._frb_cache
+    assert_equal(cache.hits, 0)
+    plot.zoom(2)
+    plot._setup_plots()
+    plot.zoom(0.5)
+    plot._setup_plots()
+    # Going back to the first view reuses its images
+    assert_equal(cache.hits, 2)
+    for field in fields:
+        assert_rel_equal(plot.frb[field].to(ref[field].units), ref[field], 10)
+    assert_equal(str(plot.frb["gas", "density"].units), "kg/m**2")
+
+
+def test_frb_cache_data_source():
+    ds = fake_random_ds(32)
+    field = ("gas", "density")
+    sphere = ds.sphere("c", 0.1)
+    old_size = ytcfg.get("yt", "frb_cache_size")
+    ytcfg["yt", "frb_cache_size"] = 10
+    try:
+        plot = ProjectionPlot(ds, "z", field, buff_size=(100, 100))
+        full = plot.frb[field].copy()
+        plot._switch_ds(ds, data_source=sphere)
+        plot._setup_plots()
+    finally:
+        ytcfg["yt", "frb_cache_size"] = old_size
+    ref = ProjectionPlot(ds, "z", field, buff_size=(100, 100), data_source=sphere)
+    assert_equal(plot._frb_cache.hits, 0)
+    assert_rel_equal(plot.frb[field], ref.frb[field], 10)
+    assert (plot.frb[field] != full).any()
+
+
+def test_progressive_preview():
+    ds = fake_random_ds(32)
+    plot = SlicePlot(ds, "z", ("gas", "density"), buff_size=(100, 100))
+    plot.set_progressive(4)
+    plot.zoom(2)
+    html = plot._get_preview()
+    assert "<img" in html
+    assert not plot._data_valid
+    assert_equal(plot._frb["gas", "density"].shape, (25, 25))
+    assert_equal(plot.buff_size, (100, 100))
+    assert_equal(plot.frb["gas", "density"].shape, (100, 100))
+    assert plot.frb.antialias
@@ -0,0 +1,75 @@
+import os
+import tempfile
+
+import numpy as np
+
+from yt.testing import (
+    assert_allclose_units,
+    assert_equal,
+    assert_raises,
+    fake_random_ds,
+    requires_module,
+)
+from yt.utilities.on_demand_imports import _h5py as h5py
+from yt.visualization.fixed_resolution import (
+    FixedResolutionBuffer,
+    TiledFixedResolutionBuffer,
+)
+
+
+def setup():
+    """Test specific setup."""
+    from yt.config import ytcfg
+
+    ytcfg["yt", "internals", "within_testing"] = True
+
+
+_fields = [("gas", "density"), ("gas", "velocity_x")]
+_bounds = (0.1, 0.8, 0.2, 0.9)
+
+
+def test_tiled_frb():
+    ds = fake_random_ds(32, fields=("density", "velocity_x"), units=("g/cm**3", "cm/s"))
+    proj = ds.proj(("gas", "density"), 2)
+    ref = FixedResolutionBuffer(proj, _bounds, (100, 70))
+    for num_workers in (1, 3):
+        frb = TiledFixedResolutionBuffer(
+            proj, _bounds, (100, 70), tile_size=32, num_workers=num_workers
+        )
+        for field in _fields:
+            image = frb[field]
+            fn = os.path.join(frb.directory, "{}_{}.npy".format(*field))
+            assert_equal(np.load(fn, mmap_mode="r"), image.d)
+            assert_equal(image.shape, (70, 100))
+            assert_allclose_units(image, ref[field])
+
+
+def test_tiled_frb_filters():
+    ds = fake_random_ds(32)
+    proj = ds.proj(("gas", "density"), 2)
+    frb = TiledFixedResolutionBuffer(proj, _bounds, (100, 70), tile_size=32)
+    frb.apply_gauss_beam(nbeam=15, sigma=1.0)
+    assert_raises(ValueError, frb.__getitem__, ("gas", "density"))
+
+
+@requires_module("h5py")
+def test_tile_pyramid():
+    ds = fake_random_ds(32)
+    slc = ds.slice(0, 0.5)
+    frb = TiledFixedResolutionBuffer(slc, _bounds, (100, 70), tile_size=32)
+    sizes = frb.get_pyramid_sizes()
+    assert_equal(sizes, [(25, 18), (50, 35), (100, 70)])
+    image = frb["gas", "density"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "pyramid.h5")
+        frb.export_tile_pyramid(fn)
+        with h5py.File(fn, mode="r") as f:
+            group = f["gas"]["density"]
+            assert_equal(group.attrs["levels"], 3)
+            assert_equal(group.attrs["units"], str(image.units))
+            for level, (nx, ny) in enumerate(sizes):
+                level_ref = FixedResolutionBuffer(slc, _bounds, (nx, ny))
+                assert_equal(group[str(level)].shape, (ny, nx))
+                assert_allclose_units(
+                    group[str(level)][()], level_ref["gas", "density"].d
+                )
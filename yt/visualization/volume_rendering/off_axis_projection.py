@@ -1,7 +1,7 @@
 import numpy as np
 
 from yt.data_objects.api import ImageArray
-from yt.funcs import is_sequence, mylog
+from yt.funcs import get_num_threads, is_sequence, mylog
 from yt.units.unit_object import Unit  # type: ignore
 from yt.utilities.lib.partitioned_grid import PartitionedGrid
 from yt.utilities.lib.pixelization_routines import (
@@ -15,6 +15,16 @@ from .transfer_functions import ProjectionTransferFunction
 from .utils import data_source_or_all
 
 
+def _sort_particles(chunk, ptype, ppos, *fields):
+    # Read the particle data of an io chunk, in Morton order if the SPH
+    # particles are sorted, with the units off_axis_projection_SPH expects
+    chunk_fields = [(ptype, ax) for ax in ppos]
+    chunk_fields += [(ptype, "mass"), (ptype, "density"), (ptype, "smoothing_length")]
+    data = chunk.ds.index._sort_particles(chunk, ptype, chunk_fields + list(fields))
+    units = ["code_length"] * 3 + ["code_mass", "code_density", "code_length"]
+    return [d.to(u).d for d, u in zip(data, units)] + data[len(units) :]
+
+
 def off_axis_projection(
     data_source,
     center,
@@ -27,7 +37,7 @@ def off_axis_projection(
     no_ghost=False,
     interpolated=False,
     north_vector=None,
-    num_threads=1,
+    num_threads=None,
     method="integrate",
 ):
     r"""Project through a dataset, off-axis, and return the image plane.
@@ -77,8 +87,10 @@ def off_axis_projection(
     north_vector : optional, array_like, default None
         A vector that, if specified, restricts the orientation such that the
         north vector dotted into the image plane points "up". Useful for rotations
-    num_threads: integer, optional, default 1
-        Use this many OpenMP threads during projection.
+    num_threads: integer, optional, default None
+        Use this many OpenMP threads during projection. If None, SPH
+        projections use the num_threads configuration option, and other
+        projections use a single thread.
     method : string
         The method of projection.  Valid methods are:
 
@@ -196,6 +208,9 @@ def off_axis_projection(
             north = north / np.linalg.norm(north)
             east_vector = np.cross(north, normal).ravel()
 
+        if num_threads is None:
+            num_threads = get_num_threads()
+
         # if weight is None:
         buf = np.zeros((resolution[0], resolution[1]), dtype="float64")
 
@@ -211,20 +226,24 @@ def off_axis_projection(
 
         if weight is None:
             for chunk in data_source.chunks([], "io"):
+                px, py, pz, mass, dens, hsml, values = _sort_particles(
+                    chunk, ptype, ppos, item
+                )
                 off_axis_projection_SPH(
-                    chunk[ptype, ppos[0]].to("code_length").d,
-                    chunk[ptype, ppos[1]].to("code_length").d,
-                    chunk[ptype, ppos[2]].to("code_length").d,
-                    chunk[ptype, "mass"].to("code_mass").d,
-                    chunk[ptype, "density"].to("code_density").d,
-                    chunk[ptype, "smoothing_length"].to("code_length").d,
+                    px,
+                    py,
+                    pz,
+                    mass,
+                    dens,
+                    hsml,
                     bounds,
                     center.to("code_length").d,
                     width.to("code_length").d,
-                    chunk[item].in_units(ounits),
+                    values.in_units(ounits),
                     buf,
                     normal_vector,
                     north,
+                    num_threads=num_threads,
                 )
 
             # Assure that the path length unit is in the default length units
@@ -250,38 +269,46 @@ def off_axis_projection(
             wounits = data_source.ds.field_info[weight].output_units
 
             for chunk in data_source.chunks([], "io"):
+                px, py, pz, mass, dens, hsml, values, weights = _sort_particles(
+                    chunk, ptype, ppos, item, weight
+                )
                 off_axis_projection_SPH(
-                    chunk[ptype, ppos[0]].to("code_length").d,
-                    chunk[ptype, ppos[1]].to("code_length").d,
-                    chunk[ptype, ppos[2]].to("code_length").d,
-                    chunk[ptype, "mass"].to("code_mass").d,
-                    chunk[ptype, "density"].to("code_density").d,
-                    chunk[ptype, "smoothing_length"].to("code_length").d,
+                    px,
+                    py,
+                    pz,
+                    mass,
+                    dens,
+                    hsml,
                     bounds,
                     center.to("code_length").d,
                     width.to("code_length").d,
-                    chunk[item].in_units(ounits),
+                    values.in_units(ounits),
                     buf,
                     normal_vector,
                     north,
-                    weight_field=chunk[weight].in_units(wounits),
+                    weight_field=weights.in_units(wounits),
+                    num_threads=num_threads,
                 )
 
             for chunk in data_source.chunks([], "io"):
+                px, py, pz, mass, dens, hsml, weights = _sort_particles(
+                    chunk, ptype, ppos, weight
+                )
                 off_axis_projection_SPH(
-                    chunk[ptype, ppos[0]].to("code_length").d,
-                    chunk[ptype, ppos[1]].to("code_length").d,
-                    chunk[ptype, ppos[2]].to("code_length").d,
-                    chunk[ptype, "mass"].to("code_mass").d,
-                    chunk[ptype, "density"].to("code_density").d,
-                    chunk[ptype, "smoothing_length"].to("code_length").d,
+                    px,
+                    py,
+                    pz,
+                    mass,
+                    dens,
+                    hsml,
                     bounds,
                     center.to("code_length").d,
                     width.to("code_length").d,
-                    chunk[weight].to(wounits),
+                    weights.to(wounits),
                     weight_buff,
                     normal_vector,
                     north,
+                    num_threads=num_threads,
                 )
 
             normalization_2d_utility(buf, weight_buff)
@@ -303,6 +330,9 @@ def off_axis_projection(
             buf, funits, registry=data_source.ds.unit_registry, info=myinfo
         )
 
+    if num_threads is None:
+        num_threads = 1
+
     sc = Scene()
     data_source.ds.index
     if item is None: